@@ -0,0 +1,93 @@
+"""
+Cold start benchmark for the sfy entry point.
+
+Reports the slowest imports of `saasFactory.main` (from `python -X importtime`) and the wall-clock time of
+`sfy --help`, and exits non-zero if the import time or the wall-clock time goes over its limit, or if a heavy
+module that should only be imported by a command handler is loaded at start up.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5] [--max-import-ms 250] [--max-wall-ms 600]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# only the handlers that need these may import them
+HEAVY_MODULES = ["linode_api4", "paramiko", "coolipy", "cryptography", "github", "git", "pyfiglet", "tabulate"]
+
+HELP_COMMAND = "import sys; sys.argv = ['sfy', '--help']; from saasFactory.main import main; main()"
+
+
+def run_env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = SRC_DIR + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def import_times() -> list[tuple[str, int, int]]:
+    """
+    Returns:
+        list[tuple[str, int, int]]: (module, self us, cumulative us) for every module imported by saasFactory.main.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import saasFactory.main"],
+                            env=run_env(), capture_output=True, text=True, check=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((module.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def help_wall_time() -> float:
+    """
+    Returns:
+        float: Seconds taken by a fresh interpreter to run `sfy --help`.
+    """
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", HELP_COMMAND], env=run_env(), stdout=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="sfy cold start benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs, the median is compared to the limits")
+    parser.add_argument("--max-import-ms", type=float, default=250, help="Limit for the cumulative import time of saasFactory.main")
+    parser.add_argument("--max-wall-ms", type=float, default=600, help="Limit for the wall-clock time of `sfy --help`")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to report")
+    args = parser.parse_args()
+
+    help_wall_time() # warm up so bytecode compilation isn't measured
+
+    import_runs = [import_times() for _ in range(args.runs)]
+    import_ms = statistics.median(next(row[2] for row in rows if row[0] == "saasFactory.main") for rows in import_runs) / 1000
+    wall_ms = statistics.median(help_wall_time() for _ in range(args.runs)) * 1000
+
+    print("Slowest imports of saasFactory.main (cumulative, last run):")
+    for module, self_us, cumulative_us in sorted(import_runs[-1], key=lambda row: row[2], reverse=True)[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {self_us / 1000:8.1f} ms self  {module}")
+    print(f"import saasFactory.main: {import_ms:.1f} ms (limit {args.max_import_ms:.0f} ms)")
+    print(f"sfy --help wall-clock:   {wall_ms:.1f} ms (limit {args.max_wall_ms:.0f} ms)")
+
+    failures = []
+    loaded = {row[0] for row in import_runs[-1]}
+    heavy = [module for module in HEAVY_MODULES if module in loaded]
+    if heavy:
+        failures.append(f"heavy modules imported at start up: {', '.join(heavy)}")
+    if import_ms > args.max_import_ms:
+        failures.append(f"import time {import_ms:.1f} ms is over the {args.max_import_ms:.0f} ms limit")
+    if wall_ms > args.max_wall_ms:
+        failures.append(f"sfy --help took {wall_ms:.1f} ms, over the {args.max_wall_ms:.0f} ms limit")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+Micro-benchmark for YAMLParser.get() on a large sf_config.yaml.
+
+Runs 10k get() calls through the shared parsed-document cache and compares the per-call cost with a re-parse
+on every call (the cache is cleared before each get, which is what every get() did before the cache existed).
+
+Usage:
+    python benchmarks/bench_yaml_get.py [--calls 10000] [--projects 500] [--uncached-calls 100]
+"""
+import argparse
+import os
+import tempfile
+import time
+from fleet_config import make_config
+from saasFactory.utils import yaml as sf_yaml
+from saasFactory.utils.enums import CoolifyKeys, VPSKeys
+from saasFactory.utils.globals import CONFIG_FILE_NAME
+from saasFactory.utils.yaml import YAMLParser, list_to_dot_notation
+
+# the lookups configure_instance / create_instance / destroy_instance make
+KEYS = [
+    VPSKeys.VPS_PROJECT_NAME_KEY.value,
+    list_to_dot_notation([VPSKeys.VPS_CONFIGS_KEY.value, VPSKeys.LINODE_ID_KEY.value]),
+    list_to_dot_notation([VPSKeys.VPS_CONFIGS_KEY.value, VPSKeys.LINODE_PUBLIC_IP_KEY.value]),
+    list_to_dot_notation([CoolifyKeys.COOLIFY_CONFIGS_KEY.value, CoolifyKeys.COOLIFY_PORT_KEY.value]),
+]
+
+
+def time_gets(parser: YAMLParser, calls: int, cached: bool) -> float:
+    """
+    Returns:
+        float: Seconds per get() call.
+    """
+    start = time.perf_counter()
+    for i in range(calls):
+        if not cached:
+            sf_yaml._DOCUMENT_CACHE.clear()
+        parser.get(KEYS[i % len(KEYS)])
+    return (time.perf_counter() - start) / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="YAMLParser.get() benchmark")
+    parser.add_argument("--calls", type=int, default=10_000, help="Number of cached get() calls")
+    parser.add_argument("--projects", type=int, default=500, help="Number of Coolify projects in the config")
+    parser.add_argument("--uncached-calls", type=int, default=100, help="Number of get() calls that re-parse the file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["XDG_CACHE_HOME"] = tmp_dir # keep the lock files out of the real cache directory
+        config_path = os.path.join(tmp_dir, CONFIG_FILE_NAME)
+        config_parser = YAMLParser(config_path)
+        config_parser.append(make_config(args.projects))
+        size_kb = os.path.getsize(config_path) / 1024
+
+        cached = time_gets(config_parser, args.calls, cached=True)
+        uncached = time_gets(config_parser, args.uncached_calls, cached=False)
+
+    print(f"{CONFIG_FILE_NAME}: {args.projects} projects, {size_kb:.0f} KiB")
+    print(f"cached get():   {cached * 1e6:10.1f} us/call, {args.calls} calls in {cached * args.calls:.3f} s")
+    print(f"re-parse get(): {uncached * 1e6:10.1f} us/call, {args.calls} calls would take {uncached * args.calls:.1f} s")
+    print(f"speed up:       {uncached / cached:10.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Parse/dump throughput of the YAMLParser load and dump path on configs with hundreds of Coolify projects under
+`coolify_configs.projects`, comparing the libyaml (C) loader/dumper YAMLParser uses when available with the
+pure Python SafeLoader/SafeDumper it falls back to.
+
+Usage:
+    python benchmarks/bench_yaml_throughput.py [--projects 100 500 1000] [--repeat 5]
+"""
+import argparse
+import io
+import time
+import yaml
+from fleet_config import make_config
+from saasFactory.utils import yaml as sf_yaml
+
+
+def best_time(func, repeat: int) -> float:
+    """
+    Returns:
+        float: The fastest of `repeat` runs of `func`, in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def dump(data: dict, dumper: type) -> str:
+    stream = io.StringIO()
+    yaml.dump(data, stream, Dumper=dumper, default_flow_style=False, sort_keys=False)
+    return stream.getvalue()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="YAMLParser parse/dump throughput benchmark")
+    parser.add_argument("--projects", type=int, nargs="+", default=[100, 500, 1000], help="Config sizes, in Coolify projects")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement, the fastest is reported")
+    args = parser.parse_args()
+
+    implementations = [("pure", yaml.SafeLoader, yaml.SafeDumper)]
+    if sf_yaml._SafeLoader is not yaml.SafeLoader:
+        implementations.append(("libyaml", sf_yaml._SafeLoader, sf_yaml._SafeDumper))
+    else:
+        print("PyYAML was built without libyaml, only the pure Python path is measured")
+
+    print(f"{'projects':>8} {'KiB':>6} {'impl':>8} {'parse MiB/s':>12} {'dump MiB/s':>11} {'parse ms':>9} {'dump ms':>8}")
+    for projects in args.projects:
+        data = make_config(projects)
+        text = dump(data, yaml.SafeDumper)
+        mib = len(text.encode("utf-8")) / (1024 * 1024)
+        for name, loader, dumper in implementations:
+            assert yaml.load(dump(data, dumper), Loader=loader) == yaml.load(text, Loader=yaml.SafeLoader) # same document either way
+            parse = best_time(lambda: yaml.load(text, Loader=loader), args.repeat)
+            dumped = best_time(lambda: dump(data, dumper), args.repeat)
+            print(f"{projects:>8} {mib * 1024:>6.0f} {name:>8} {mib / parse:>12.2f} {mib / dumped:>11.2f} {parse * 1000:>9.1f} {dumped * 1000:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Builds large sf_config.yaml documents for the YAMLParser benchmarks, shaped like a fleet config with
+many Coolify projects under `coolify_configs.projects`.
+"""
+import os
+import sys
+from collections import OrderedDict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from saasFactory.utils.enums import CoolifyKeys, VPSKeys
+
+
+def make_config(projects: int) -> OrderedDict:
+    """
+    Args:
+        projects (int): Number of Coolify projects to generate.
+
+    Returns:
+        OrderedDict: The sf_config.yaml document.
+    """
+    return OrderedDict([
+        (VPSKeys.VPS_PROJECT_NAME_KEY.value, "fleet"),
+        ("created_at", "2024-01-01 00:00:00"),
+        (VPSKeys.VPS_CONFIGS_KEY.value, OrderedDict([
+            (VPSKeys.LINODE_ID_KEY.value, 12345678),
+            (VPSKeys.LINODE_LABEL_KEY.value, "fleet-sfy"),
+            (VPSKeys.LINODE_REGION_KEY.value, "us-east"),
+            (VPSKeys.LINODE_TYPE_KEY.value, "g6-standard-2"),
+            (VPSKeys.LINODE_IMAGE_KEY.value, "linode/ubuntu22.04"),
+            (VPSKeys.LINODE_PUBLIC_IP_KEY.value, "203.0.113.10"),
+        ])),
+        (CoolifyKeys.COOLIFY_CONFIGS_KEY.value, OrderedDict([
+            (CoolifyKeys.COOLIFY_USE_DOMAIN_KEY.value, False),
+            (CoolifyKeys.COOLIFY_PORT_KEY.value, 8000),
+            (CoolifyKeys.COOLIFY_PROJECTS_PARENT_KEY.value, [
+                OrderedDict([
+                    (CoolifyKeys.COOLIFY_NAME_KEY.value, f"project-{i}"),
+                    (CoolifyKeys.COOLIFY_PROJECT_DESCRIPTION_KEY.value, f"Fleet project number {i} deployed by sfy"),
+                    (CoolifyKeys.COOLIFY_UUID_KEY.value, f"{i:08x}-0000-4000-8000-{i:012x}"),
+                    (CoolifyKeys.COOLIFY_STACK_SERVICES_KEY.value, ["web", "worker", "postgres", "redis"]),
+                ])
+                for i in range(projects)
+            ]),
+        ])),
+    ])
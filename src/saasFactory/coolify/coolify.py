@@ -1,26 +1,41 @@
 from base64 import b64encode
-import json
+from collections import OrderedDict
 from saasFactory.utils.cli import findProjectRoot, root_dir_error_msg, yes_no_prompt, get_user_choice
-from saasFactory.utils.globals import CONFIG_FILE_NAME
+from saasFactory.utils.globals import CONFIG_FILE_NAME, DEFAULT_COOLIFY_CACHE_TTL
+from saasFactory.utils.cache import DiskCache, hash_token
 from saasFactory.utils.yaml import YAMLParser, list_to_dot_notation
 from saasFactory.utils.enums import CoolifyKeys, Emojis, GitHubRepos
 from saasFactory.utils.globals import DEFAULT_COOLIFY_PROJECT_NAME, DEFAULT_COOLIFY_SERVICE_NAME, DEFAULT_COOLIFY_PROJECT_DESCRIPTION, DEFAULT_COOLIFY_SERVICE_DESCRIPTION, DEFAULT_COOLIFY_PORT, GIT_REPO_DIR_NAME, DEFAULT_NEW_GITHUB_REPO_NAME, DEFAULT_DEPLOY_KEY_PREFIX, DEFAULT_COOLIFY_ENVIRONMENT_NAME
 from saasFactory.github.github_client import GitHubRepoClient
 from saasFactory.utils.id import generate_random_id
-from coolipy import Coolipy
+from saasFactory.coolify.coolify_async import AsyncCoolifyClient
 from coolipy.models.private_keys import PrivateKeysModelCreate
 from coolipy.models.service import ServiceModelCreate
 from tabulate import tabulate
 import os
 from cryptography.hazmat.primitives.asymmetric import ed25519
 from cryptography.hazmat.primitives.serialization import Encoding, PrivateFormat, NoEncryption, PublicFormat
-import http.client
+import asyncio
+import time
 from uuid import uuid4
 
 
 class CoolifyClient:
-    def __init__(self, api_key):
+    """
+    Interactive Coolify client used by the CLI commands. The API calls themselves are made by
+    an AsyncCoolifyClient, this class runs them one at a time and handles prompts, messages and configs.
+    """
+    def __init__(self, api_key, cache_ttl: int|None = None):
+        """
+        Args:
+            api_key (str): The Coolify API token.
+            cache_ttl (int|None): Seconds to cache project/server listings. Defaults to `cache_ttl` under coolify_configs, or DEFAULT_COOLIFY_CACHE_TTL.
+        """
         self.api_key = api_key
+        self.cache_ttl = cache_ttl
+        self.coolify_client = None
+        self.async_client = None
+        self._loop = None
         project_root = findProjectRoot()
         if project_root is None:
             root_dir_error_msg()
@@ -31,7 +46,10 @@ class CoolifyClient:
     def connect(self) -> None:
         """
         Grabs Coolify configuration from the user's YAML file. Then creates a Coolify client object.
+        Only connects once per client, later calls reuse the client and its pooled HTTP session.
         """
+        if self.coolify_client is not None:
+            return
         project_root = findProjectRoot()
         if project_root is None:
             root_dir_error_msg()
@@ -42,28 +60,50 @@ class CoolifyClient:
             return
         try:
             self.coolify_endpoint = coolify_configs.get(CoolifyKeys.COOLIFY_DOMAIN_KEY.value)
-            self.coolify_rest_client = http.client.HTTPConnection(self.coolify_endpoint, DEFAULT_COOLIFY_PORT)
-            omit_port = coolify_configs.get(CoolifyKeys.COOLIFY_OMIT_PORT_KEY.value)
-            use_https = coolify_configs.get(CoolifyKeys.COOLIFY_USE_HTTPS_KEY.value)
-            if not omit_port:
-                port = coolify_configs.get(CoolifyKeys.COOLIFY_PORT_KEY.value)
-                self.coolify_client = Coolipy(
-                    coolify_api_key=self.api_key,
-                    coolify_endpoint=self.coolify_endpoint,
-                    omit_port=omit_port,
-                    http_protocol="https" if use_https else "http",
-                    coolify_port=port
-                )
-            else:
-                self.coolify_client = Coolipy(
-                    coolify_api_key=self.api_key,
-                    coolify_endpoint=self.coolify_endpoint,
-                    omit_port=omit_port,
-                    http_protocol="https" if use_https else "http",
-                )
+            if self.cache_ttl is None:
+                self.cache_ttl = coolify_configs.get(CoolifyKeys.COOLIFY_CACHE_TTL_KEY.value, DEFAULT_COOLIFY_CACHE_TTL)
+            self.async_client = AsyncCoolifyClient(self.api_key, coolify_configs)
+            self.async_client.connect()
+            self.coolify_client = self.async_client.coolify_client
+            self.coolify_url = self.async_client.coolify_url
+            # project/server listings are cached per Coolify instance and token
+            self.listings_cache = DiskCache("coolify_listings")
+            self.listings_cache_prefix = f"{self.coolify_url}|{hash_token(self.api_key)}"
         except Exception as e:
+            self.coolify_client = None
             print(f"{Emojis.ERROR_SIGN.value} Failed to create Coolify client: {e}")
 
+    def _cache_key(self, listing: str) -> str:
+        return f"{self.listings_cache_prefix}|{listing}"
+
+    def invalidate_listings(self) -> None:
+        """
+        Drops the cached project and server listings so the next list call goes to the Coolify API.
+        """
+        self.connect()
+        self.listings_cache.invalidate(self._cache_key("projects"))
+        self.listings_cache.invalidate(self._cache_key("servers"))
+
+    def close(self) -> None:
+        """
+        Closes the pooled HTTP connections to the Coolify API and the client's event loop.
+        """
+        if self.async_client is not None:
+            self.async_client.close()
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.run_until_complete(self._loop.shutdown_default_executor())
+            self._loop.close()
+
+    def _run(self, coroutine):
+        """
+        Runs a single AsyncCoolifyClient call to completion from synchronous code.
+        Every call runs on the same event loop, created on first use, so its worker threads and the
+        async client's concurrency limiter are reused instead of being set up again for each call.
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coroutine)
+
     def test_connection(self) -> bool: 
         """
         Tests the connection to the Coolify API.
@@ -77,8 +117,10 @@ class CoolifyClient:
             return
         try:
             self.connect()
-            list_servers_res = self.coolify_client.servers.list()
+            list_servers_res = self._run(self.async_client.list_servers())
             if list_servers_res.status_code == 200 or list_servers_res.status_code == 201:
+                # keep the listing so a later list_servers() in this command doesn't fetch it again
+                self.listings_cache.set(self._cache_key("servers"), format_servers(list_servers_res.data))
                 print(f"{Emojis.CHECK_MARK.value} Successfully connected to Coolify API. Status code: {list_servers_res.status_code}")
                 return True
             else:
@@ -118,20 +160,24 @@ class CoolifyClient:
                 project_description = input("Specify your Coolify project description: ")
         try:
             self.connect()
-            res = self.coolify_client.projects.create(project_name=project_name, project_description=project_description)
+            res = self._run(self.async_client.create_project(project_name, project_description))
             if res.status_code == 201 or res.status_code == 200:
-                append_res = self.sf_config_parser.append_nested(
-                    list_to_dot_notation([CoolifyKeys.COOLIFY_CONFIGS_KEY.value, CoolifyKeys.COOLIFY_PROJECTS_PARENT_KEY.value]),
-                    [{
-                        CoolifyKeys.COOLIFY_NAME_KEY.value: project_name,
-                        CoolifyKeys.COOLIFY_PROJECT_DESCRIPTION_KEY.value: project_description,
-                        CoolifyKeys.COOLIFY_UUID_KEY.value: res.data.uuid
-                    }]
-                )
-                if not append_res:
-                    print(f"{Emojis.ERROR_SIGN.value} Failed to update the config file.")
+                try:
+                    with self.sf_config_parser.edit() as sf_config:
+                        if not isinstance(sf_config.get(CoolifyKeys.COOLIFY_CONFIGS_KEY.value), dict):
+                            sf_config[CoolifyKeys.COOLIFY_CONFIGS_KEY.value] = OrderedDict()
+                        coolify_configs = sf_config[CoolifyKeys.COOLIFY_CONFIGS_KEY.value]
+                        coolify_configs[CoolifyKeys.COOLIFY_PROJECTS_PARENT_KEY.value] = coolify_configs.get(CoolifyKeys.COOLIFY_PROJECTS_PARENT_KEY.value) or []
+                        coolify_configs[CoolifyKeys.COOLIFY_PROJECTS_PARENT_KEY.value].append({
+                            CoolifyKeys.COOLIFY_NAME_KEY.value: project_name,
+                            CoolifyKeys.COOLIFY_PROJECT_DESCRIPTION_KEY.value: project_description,
+                            CoolifyKeys.COOLIFY_UUID_KEY.value: res.data.uuid
+                        })
+                except Exception as e:
+                    print(f"{Emojis.ERROR_SIGN.value} Failed to update the config file: {e}")
                     print("Please manually update the config file with the project UUID, name, and description.")
 
+                self.listings_cache.invalidate(self._cache_key("projects"))
                 print(f"{Emojis.STAR.value} Successfully created project '{project_name}' and updated configs.")
                 return True
             else:
@@ -141,22 +187,33 @@ class CoolifyClient:
             print(f"{Emojis.ERROR_SIGN.value} Failed to create project '{project_name}': {e}")
             return False
         
-    def list_projects(self) -> list[dict]:
+    def list_projects(self, refresh: bool = False) -> list[dict]:
         """
-        Lists all projects on Coolify.
+        Lists all projects on Coolify. Uses the cached listing if it is younger than the cache TTL, otherwise fetches it from the Coolify API.
+        The projects recorded under coolify_configs.projects are not a listing: projects created in the Coolify UI or
+        by another sfy project are missing from it, and deleted projects stay in it.
+
+        Args:
+            refresh (bool): Skip the cache and always fetch from the API. (default is False)
 
         Returns:
             list[str]: A list of project dictionaries.
         """
         try:
             self.connect()
-            res = self.coolify_client.projects.list()
+            if not refresh:
+                cached_projects = self.listings_cache.get(self._cache_key("projects"), self.cache_ttl)
+                if cached_projects is not None:
+                    return cached_projects
+            res = self._run(self.async_client.list_projects())
             if res.status_code ==  200 or res.status_code == 201:
                 projects = res.data #list of project objects
-                return [{
+                project_list = [{
                     CoolifyKeys.COOLIFY_NAME_KEY.value: project.name, 
                     CoolifyKeys.COOLIFY_UUID_KEY.value: project.uuid} 
                     for project in projects]
+                self.listings_cache.set(self._cache_key("projects"), project_list)
+                return project_list
             else:
                 print(f"{Emojis.ERROR_SIGN.value} Failed to list projects.")
                 return []
@@ -164,22 +221,27 @@ class CoolifyClient:
             print(f"{Emojis.ERROR_SIGN.value} Failed to list projects: {e}")
             return []
         
-    def list_servers(self) -> list[dict]:   
+    def list_servers(self, refresh: bool = False) -> list[dict]:   
         """
-        Lists servers on Coolify instance
+        Lists servers on Coolify instance. Uses the cached listing if it is younger than the cache TTL.
+
+        Args:
+            refresh (bool): Skip the cache and always fetch from the API. (default is False)
 
         Returns:
             list[str]: A list of server dictionaries.
         """
         try:
             self.connect()
-            res = self.coolify_client.servers.list()
+            if not refresh:
+                cached_servers = self.listings_cache.get(self._cache_key("servers"), self.cache_ttl)
+                if cached_servers is not None:
+                    return cached_servers
+            res = self._run(self.async_client.list_servers())
             if res.status_code ==  200 or res.status_code == 201:
-                servers = res.data
-                return [{
-                    CoolifyKeys.COOLIFY_NAME_KEY.value: server.name,
-                    CoolifyKeys.COOLIFY_UUID_KEY.value: server.uuid, 
-                } for server in servers]
+                server_list = format_servers(res.data)
+                self.listings_cache.set(self._cache_key("servers"), server_list)
+                return server_list
             else:
                 print(f"{Emojis.ERROR_SIGN.value} Failed to list servers.")
                 return []
@@ -212,11 +274,11 @@ class CoolifyClient:
 
         try:
             self.connect()
-            res = self.coolify_client.private_keys.create(private_key=PrivateKeysModelCreate(
+            res = self._run(self.async_client.create_private_key(PrivateKeysModelCreate(
                 description="Deployment key for GitHub",
                 name=key_title,
                 private_key=encoded_key
-            )) 
+            )))
             if res.status_code == 201 or res.status_code == 200:
                 print(f"{Emojis.CHECK_MARK.value} Successfully created deployment key for project '{project_uuid}'.")
 
@@ -242,7 +304,6 @@ class CoolifyClient:
             bool: True if the git resource was created successfully, False otherwise.
         """
         try:
-            # later on try to replace this with coolipy library
             self.connect()     
             payload_dict = {
                 "project_uuid": project_uuid,
@@ -255,15 +316,8 @@ class CoolifyClient:
                 "ports_exposes": "3000",
                 "git_commit_sha": "HEAD"
             }
-
-            payload = json.dumps(payload_dict)
-            headers = {
-                'Authorization': f"Bearer {self.api_key}",
-                'Content-Type': "application/json"
-            }
-            self.coolify_rest_client.request("POST", "/api/v1/applications/private-deploy-key", payload, headers)
-            res = self.coolify_rest_client.getresponse()
-            if res.status == 201 or res.status == 200:
+            res = self._run(self.async_client.create_private_deploy_key_application(payload_dict))
+            if res.status_code == 201 or res.status_code == 200:
                 print(f"{Emojis.CHECK_MARK.value} Successfully created git resource for project '{project_uuid}'.")
                 return True
             else:
@@ -296,15 +350,21 @@ class CoolifyClient:
         
         try:
             self.github_client = GitHubRepoClient(github_access_token, chosen_new_remote_repo_name, os.path.join(os.getcwd(), GIT_REPO_DIR_NAME))
-            self.github_client.clone_repo(chosen_repo_url)
-            self.github_client.create_private_repo(chosen_new_remote_repo_name)
-            if yes_no_prompt("Remove old .git folder and initialize new git repository?"):
-                self.github_client.remove_old_init()
+            # the template history is only cloned when it is kept
+            new_history = yes_no_prompt("Remove old .git folder and initialize new git repository?")
+            if not self.github_client.clone_repo(chosen_repo_url, shallow=new_history):
+                return
+            if not self.github_client.create_private_repo(chosen_new_remote_repo_name):
+                return
+            if new_history:
+                if not self.github_client.remove_old_init():
+                    return
             else:
                 print(f"{Emojis.WARNING_SIGN.value} Skipping removal of old .git folder and initialization of new git repository.")
-                self.github_client.remove_upstream()
-            self.github_client.add_upstream()
-            self.github_client.add_commit_push()
+                if not self.github_client.remove_upstream():
+                    return
+            if not self.github_client.add_upstream() or not self.github_client.add_commit_push():
+                return
         except Exception as e:
             print(f"{Emojis.ERROR_SIGN.value} Failed to connect to GitHub: {e}")
             return
@@ -333,21 +393,9 @@ class CoolifyClient:
         """
         chosen_project_uuid = get_project_uuid(self.list_projects())
         chosen_server_uuid = get_server_uuid(self.list_servers())
-        dummy_destination_uuid = str(uuid4()) # destination_uuid is not used in the create service API call but coolipy still requires it
         try:
             self.connect()
-            # Assuming there is a method in coolipy to create a service
-            res = self.coolify_client.services.create(ServiceModelCreate(
-                type=service_type,
-                name=DEFAULT_COOLIFY_SERVICE_NAME + service_type,
-                environment_name=DEFAULT_COOLIFY_ENVIRONMENT_NAME,
-                project_uuid=chosen_project_uuid,
-                server_uuid=chosen_server_uuid,
-                instant_deploy=False,
-                description=DEFAULT_COOLIFY_SERVICE_DESCRIPTION,
-                destination_uuid=dummy_destination_uuid,
-
-            ))
+            res = self._run(self.async_client.create_service(build_service_model(service_type, chosen_project_uuid, chosen_server_uuid)))
             if res.status_code == 201 or res.status_code == 200:
                 print(f"{Emojis.CHECK_MARK.value} Successfully created service '{service_type}'.")
                 print(res)
@@ -359,11 +407,102 @@ class CoolifyClient:
             print(f"{Emojis.ERROR_SIGN.value} Failed to create service '{service_type}': {e}")
             return False
 
+    def create_services(self, service_types: list[str], max_concurrency: int|None = None) -> bool:
+        """
+        Creates several services on Coolify concurrently. The project and server are chosen once for the whole stack.
+        Prints a table with the result and time taken for each service.
+
+        Args:
+            service_types (list[str]): The types of the services. Each must be one of DEFAULT_RESOURCE_PRODUCT_NAMES.
+            max_concurrency (int|None): Maximum number of services created at once. (default is DEFAULT_COOLIFY_MAX_CONCURRENCY)
+
+        Returns:
+            bool: True if every service was created successfully, False otherwise.
+        """
+        chosen_project_uuid = get_project_uuid(self.list_projects())
+        chosen_server_uuid = get_server_uuid(self.list_servers())
+        if chosen_project_uuid is None or chosen_server_uuid is None:
+            return False
+        try:
+            self.connect()
+            if max_concurrency is not None:
+                self.async_client.set_max_concurrency(max_concurrency)
+            print(f"{Emojis.CLOCK.value} Creating {len(service_types)} services: {', '.join(service_types)}")
+            results = self._run(self._create_services(service_types, chosen_project_uuid, chosen_server_uuid))
+        except Exception as e:
+            print(f"{Emojis.ERROR_SIGN.value} Failed to create services: {e}")
+            return False
+
+        print(tabulate(results, headers=["Service", "Result", "Time (s)", "Details"], tablefmt="fancy_grid"))
+        failed = [row[0] for row in results if row[1] != Emojis.CHECK_MARK.value]
+        if failed:
+            print(f"{Emojis.ERROR_SIGN.value} Failed to create {len(failed)} of {len(results)} services: {', '.join(failed)}")
+            return False
+        print(f"{Emojis.STAR.value} Successfully created all {len(results)} services.")
+        return True
+
+    async def _create_services(self, service_types: list[str], project_uuid: str, server_uuid: str) -> list[list[str]]:
+        """
+        Creates the services concurrently through the async client and times each one.
+
+        Returns:
+            list[list[str]]: One [service, result, seconds, details] row per service, in the order given.
+        """
+        async def create_one(service_type: str) -> list[str]:
+            start = time.perf_counter()
+            try:
+                res = await self.async_client.create_service(build_service_model(service_type, project_uuid, server_uuid))
+                if res.status_code == 201 or res.status_code == 200:
+                    result, details = Emojis.CHECK_MARK.value, getattr(res.data, CoolifyKeys.COOLIFY_UUID_KEY.value, "")
+                else:
+                    result, details = Emojis.ERROR_SIGN.value, f"HTTP {res.status_code}"
+            except Exception as e:
+                result, details = Emojis.ERROR_SIGN.value, str(e)
+            return [service_type, result, f"{time.perf_counter() - start:.2f}", details]
+
+        return await asyncio.gather(*(create_one(service_type) for service_type in service_types))
+
 
 
 # Functions to get user input for Coolify operations
 #---------------------------------------------------
 
+def build_service_model(service_type: str, project_uuid: str, server_uuid: str) -> ServiceModelCreate:
+    """
+    Builds the coolipy model used to create a service with the saasFactory defaults.
+
+    Args:
+        service_type (str): The type of the service. Must be one of DEFAULT_RESOURCE_PRODUCT_NAMES.
+        project_uuid (str): The UUID of the project.
+        server_uuid (str): The UUID of the server.
+    Returns:
+        ServiceModelCreate: The service model.
+    """
+    return ServiceModelCreate(
+        type=service_type,
+        name=DEFAULT_COOLIFY_SERVICE_NAME + service_type,
+        environment_name=DEFAULT_COOLIFY_ENVIRONMENT_NAME,
+        project_uuid=project_uuid,
+        server_uuid=server_uuid,
+        instant_deploy=False,
+        description=DEFAULT_COOLIFY_SERVICE_DESCRIPTION,
+        destination_uuid=str(uuid4()), # destination_uuid is not used in the create service API call but coolipy still requires it
+    )
+
+def format_servers(servers: list) -> list[dict]:
+    """
+    Converts coolipy server models to the name/uuid dictionaries used by the CLI.
+
+    Args:
+        servers (list): A list of coolipy server objects.
+    Returns:
+        list[dict]: A list of server dictionaries.
+    """
+    return [{
+        CoolifyKeys.COOLIFY_NAME_KEY.value: server.name,
+        CoolifyKeys.COOLIFY_UUID_KEY.value: server.uuid, 
+    } for server in servers]
+
 def get_github_url() -> str:
     """
     Prompts the user to either use a premade GitHub repository or enter a custom URL.
@@ -0,0 +1,195 @@
+import asyncio
+import json
+import os
+from typing import Callable
+import requests
+from requests.adapters import HTTPAdapter
+from coolipy import Coolipy
+from coolipy.exceptions import CoolipyHttpServiceException
+from coolipy.models.coolify_api_response import CoolifyAPIResponse
+from coolipy.models.private_keys import PrivateKeysModelCreate
+from coolipy.models.service import ServiceModelCreate
+from coolipy.services.http_service import HttpService
+from coolipy.services.coolify_api.base import CoolifyApiBase
+from saasFactory.utils.cli import findProjectRoot
+from saasFactory.utils.enums import CoolifyKeys
+from saasFactory.utils.globals import CONFIG_FILE_NAME, COOLIFY_HTTP_POOL_SIZE, DEFAULT_COOLIFY_MAX_CONCURRENCY
+from saasFactory.utils.yaml import YAMLParser
+
+
+class PooledHttpService(HttpService):
+    """
+    coolipy HttpService that sends every request through a shared keep-alive requests.Session
+    instead of the module level `requests.get/post` calls, so TCP/TLS connections are reused.
+    """
+
+    def __init__(self, api_base_endpoint: str, bearer_token: str, session: requests.Session) -> None:
+        super().__init__(api_base_endpoint=api_base_endpoint, bearer_token=bearer_token)
+        self._session = session
+
+    def _make_request(self, method: str, url: str, data: dict|None = None) -> requests.Response:
+        full_url = f"{self._api_base_endpoint}{url}"
+        try:
+            response = self._session.request(method.upper(), full_url, headers=self._headers, data=data)
+        except Exception as exc:
+            raise CoolipyHttpServiceException(exc) from exc
+        return response
+
+
+class AsyncCoolifyClient:
+    """
+    asyncio client for the Coolify API, used to overlap the latency of many resource operations.
+    Every call goes through one pooled coolipy client in a worker thread and at most `max_concurrency`
+    requests are in flight at once. Methods return coolipy `CoolifyAPIResponse` objects and raise on transport errors,
+    the user facing messages are left to CoolifyClient.
+
+    Usage:
+        async with AsyncCoolifyClient(api_key) as client:
+            responses = await asyncio.gather(*(client.create_service(service) for service in services))
+    """
+
+    def __init__(self, api_key: str, coolify_configs: dict|None = None, max_concurrency: int = DEFAULT_COOLIFY_MAX_CONCURRENCY) -> None:
+        """
+        Args:
+            api_key (str): The Coolify API token.
+            coolify_configs (dict|None): The coolify_configs section of the config file. Read from the project config if None.
+            max_concurrency (int): Maximum number of concurrent requests to the Coolify API.
+        """
+        self.api_key = api_key
+        self.coolify_configs = coolify_configs
+        self.max_concurrency = max_concurrency
+        self.coolify_client = None
+        self.http_session = None
+        self._pool_maxsize = None
+        self._limiter = None
+        self._limiter_loop = None
+
+    async def __aenter__(self) -> "AsyncCoolifyClient":
+        self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def connect(self) -> None:
+        """
+        Creates the coolipy client and the keep-alive HTTP session shared by all requests. Only connects once.
+
+        Raises:
+            ValueError: If no Coolify configuration can be found.
+        """
+        if self.coolify_client is not None:
+            return
+        if self.coolify_configs is None:
+            project_root = findProjectRoot()
+            if project_root is not None:
+                self.coolify_configs = YAMLParser(os.path.join(project_root, CONFIG_FILE_NAME)).get(CoolifyKeys.COOLIFY_CONFIGS_KEY.value)
+        if self.coolify_configs is None:
+            raise ValueError("Coolify configurations not found in the config file.")
+
+        omit_port = self.coolify_configs.get(CoolifyKeys.COOLIFY_OMIT_PORT_KEY.value)
+        use_https = self.coolify_configs.get(CoolifyKeys.COOLIFY_USE_HTTPS_KEY.value)
+        coolify_client_args = {
+            "coolify_api_key": self.api_key,
+            "coolify_endpoint": self.coolify_configs.get(CoolifyKeys.COOLIFY_DOMAIN_KEY.value),
+            "omit_port": omit_port,
+            "http_protocol": "https" if use_https else "http",
+        }
+        if not omit_port:
+            coolify_client_args["coolify_port"] = self.coolify_configs.get(CoolifyKeys.COOLIFY_PORT_KEY.value)
+        coolify_client = Coolipy(**coolify_client_args)
+
+        # one keep-alive session shared by every coolipy call and the raw REST calls
+        self.http_session = requests.Session()
+        self._mount_adapter()
+        self.pooled_http = PooledHttpService(coolify_client._api_base_endpoint, self.api_key, self.http_session)
+        coolify_client._http = self.pooled_http
+        for api in vars(coolify_client).values():
+            if isinstance(api, CoolifyApiBase):
+                api._http = self.pooled_http
+        self.coolify_url = coolify_client._coolify_url
+        self.coolify_client = coolify_client
+
+    def _mount_adapter(self) -> None:
+        """
+        Mounts a connection pool big enough for `max_concurrency` requests on the HTTP session, unless the mounted one already is.
+        """
+        pool_maxsize = max(COOLIFY_HTTP_POOL_SIZE, self.max_concurrency)
+        if pool_maxsize == self._pool_maxsize:
+            return
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        self.http_session.mount("http://", adapter)
+        self.http_session.mount("https://", adapter)
+        self._pool_maxsize = pool_maxsize
+
+    def set_max_concurrency(self, max_concurrency: int) -> None:
+        """
+        Changes the maximum number of concurrent requests. If already connected, the HTTP connection pool is resized to match.
+
+        Args:
+            max_concurrency (int): Maximum number of concurrent requests to the Coolify API.
+        """
+        self.max_concurrency = max_concurrency
+        self._limiter = None
+        self._limiter_loop = None
+        if self.http_session is not None:
+            self._mount_adapter()
+
+    def close(self) -> None:
+        """
+        Closes the pooled HTTP connections to the Coolify API.
+        """
+        if self.http_session is not None:
+            self.http_session.close()
+
+    async def _call(self, func: Callable, *args) -> CoolifyAPIResponse:
+        """
+        Runs a blocking coolipy call in a worker thread, bounded by the concurrency limit.
+        """
+        self.connect()
+        # semaphores are bound to the loop they are first used in, make a new one when called from another loop
+        loop = asyncio.get_running_loop()
+        if self._limiter is None or self._limiter_loop is not loop:
+            self._limiter = asyncio.Semaphore(self.max_concurrency)
+            self._limiter_loop = loop
+        async with self._limiter:
+            return await asyncio.to_thread(func, *args)
+
+    # Projects
+    async def list_projects(self) -> CoolifyAPIResponse:
+        return await self._call(lambda: self.coolify_client.projects.list())
+
+    async def create_project(self, project_name: str, project_description: str) -> CoolifyAPIResponse:
+        return await self._call(lambda: self.coolify_client.projects.create(project_name=project_name, project_description=project_description))
+
+    # Servers
+    async def list_servers(self) -> CoolifyAPIResponse:
+        return await self._call(lambda: self.coolify_client.servers.list())
+
+    async def get_server(self, server_uuid: str) -> CoolifyAPIResponse:
+        return await self._call(lambda: self.coolify_client.servers.get(server_uuid))
+
+    # Private keys
+    async def create_private_key(self, private_key: PrivateKeysModelCreate) -> CoolifyAPIResponse:
+        return await self._call(lambda: self.coolify_client.private_keys.create(private_key=private_key))
+
+    # Applications
+    async def list_applications(self) -> CoolifyAPIResponse:
+        return await self._call(lambda: self.coolify_client.applications.list())
+
+    async def get_application(self, application_uuid: str) -> CoolifyAPIResponse:
+        return await self._call(lambda: self.coolify_client.applications.get(application_uuid))
+
+    async def create_private_deploy_key_application(self, payload: dict) -> CoolifyAPIResponse:
+        """
+        Creates an application from a private git repository using a deploy key.
+        coolipy doesn't wrap this endpoint, so the request is sent directly through the pooled HTTP service.
+        """
+        return await self._call(lambda: self.pooled_http.post("/applications/private-deploy-key", data=json.dumps(payload)))
+
+    # Services
+    async def list_services(self) -> CoolifyAPIResponse:
+        return await self._call(lambda: self.coolify_client.services.list())
+
+    async def create_service(self, service: ServiceModelCreate) -> CoolifyAPIResponse:
+        return await self._call(lambda: self.coolify_client.services.create(service))
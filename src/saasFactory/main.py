@@ -1,14 +1,13 @@
 import argparse
 import os
+import time
 from dotenv import load_dotenv
-from saasFactory.utils.enums import Emojis, VPSCommands, LinodeStatus, CoolifyKeys, EnvVarNames, VPSKeys
-from saasFactory.vps.provider import LinodeProvider
-from saasFactory.vps.ssh import SSHConnection
+from saasFactory.utils.enums import Emojis, VPSCommands, LinodeStatus, CoolifyKeys, EnvVarNames, VPSKeys, SSHKeyTypes, PoolKeys
 from saasFactory.utils.yaml import YAMLParser, list_to_dot_notation
-from saasFactory.coolify.coolify import CoolifyClient
 from saasFactory.utils.block_msgs import POST_COOLIFY_INSTALL_MSG
-from saasFactory.utils.globals import DEFAULT_RESOURCE_PRODUCT_NAMES
-from tabulate import tabulate
+from saasFactory.utils.globals import DEFAULT_RESOURCE_PRODUCT_NAMES, DEFAULT_COOLIFY_MAX_CONCURRENCY
+# heavy modules (LinodeProvider, SSHConnection, CoolifyClient, tabulate) are imported inside the handlers that need them
+# so `sfy --help` and light commands don't pay for linode_api4, paramiko, coolipy, etc. on every start up
 
 from saasFactory.utils.cli import (
     createProjectDir, 
@@ -24,11 +23,23 @@ from saasFactory.utils.cli import (
 )
 from saasFactory.utils.globals import ( 
     DEFAULT_LINODE_VPS_CONFIG, 
+    get_default_linode_vps_config_table,
     CONFIG_FILE_NAME, 
     PROJECT_DIR_NAME_SUFFIX, 
-    DEFAULT_LINODE_VPS_CONFIG_TABLE,
     DEFAULT_LINODE_USERNAME,  
-    DEFAULT_COOLIFY_PORT
+    DEFAULT_COOLIFY_PORT,
+    DEFAULT_FLEET_PARALLELISM,
+    DEFAULT_SSH_KEY_TYPE,
+    DEFAULT_READINESS_TIMEOUT,
+    DEFAULT_COOLIFY_BOOTSTRAP_TIMEOUT,
+    BOOTSTRAP_LOG_PATH,
+    DEFAULT_IMAGE_BAKE_TIMEOUT,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_POOL_TTL,
+    DEFAULT_POOL_MAX_IDLE,
+    DEFAULT_SSH_KEY_POOL_SIZE,
+    SSH_KEY_DIR_NAME,
+    COOLIFY_INSTALL_COMMANDS
 )
 
 
@@ -80,16 +91,131 @@ def main():
     vps_up_parser = vps_subparsers.add_parser(
         "up", help="Start Up the VPS instance"
     )
+    vps_up_parser.add_argument(
+        "--key-type", type=str, choices=[key_type.value for key_type in SSHKeyTypes], default=DEFAULT_SSH_KEY_TYPE,
+        help=f"Type of the SSH key generated for the instance (default {DEFAULT_SSH_KEY_TYPE})"
+    )
+    vps_up_parser.add_argument(
+        "--wait", action="store_true", help="Wait until the instance is running and accepts SSH connections",
+        required=False
+    )
+    vps_up_parser.add_argument(
+        "--timeout", type=int, required=False,
+        help=f"Maximum seconds to wait with --wait (default {DEFAULT_READINESS_TIMEOUT}, {DEFAULT_COOLIFY_BOOTSTRAP_TIMEOUT} with --bootstrap-coolify)"
+    )
+    vps_up_parser.add_argument(
+        "--bootstrap-coolify", action="store_true", help="Install Coolify during the first boot with cloud-init instead of `sfy coolify install`",
+        required=False
+    )
+    vps_up_parser.add_argument(
+        "--golden-image", action="store_true", help="Create the instance from the Coolify image made by `sfy vps bake`",
+        required=False
+    )
+    vps_up_parser.add_argument(
+        "--no-pool", action="store_true", help="Create a new instance even if a matching warm pool instance is ready",
+        required=False
+    )
+    vps_up_parser.add_argument(
+        "--count", type=int, help="Create this many extra instances from the project's VPS configuration concurrently",
+        required=False
+    )
+    vps_up_parser.add_argument(
+        "--key-pool", action="store_true", help="With --count, generate the SSH keys in the background while the root password is entered (worth it for rsa keys)",
+        required=False
+    )
+
+    # `vps bake` command argument parser
+    vps_bake_parser = vps_subparsers.add_parser(
+        "bake", help="Save the VPS instance, with Coolify installed, as a private image to create new instances from"
+    )
+    vps_bake_parser.add_argument(
+        "--label", type=str, help="Label of the image (default is the instance label with a -coolify suffix)",
+        required=False
+    )
+    vps_bake_parser.add_argument(
+        "--timeout", type=int, default=DEFAULT_IMAGE_BAKE_TIMEOUT,
+        help=f"Maximum seconds to wait for the image (default {DEFAULT_IMAGE_BAKE_TIMEOUT})"
+    )
 
     # `vpc down` command argument parser
     vps_down_parser = vps_subparsers.add_parser(
         "down", help="Deactivate the VPS instance"
     )
+    vps_down_parser.add_argument(
+        "--hibernate", action="store_true", help="Shut the instance down but keep its disk and configuration, `sfy vps up` boots it again",
+        required=False
+    )
 
     # `vpc status` command argument parser
     vps_status_parser = vps_subparsers.add_parser(
         "status", help="Check the status of the VPS instance"
     )
+    vps_status_parser.add_argument(
+        "--all", action="store_true", help="Show the status of every saasFactory instance on the account",
+        required=False
+    )
+    vps_status_parser.add_argument(
+        "--projects", type=str, nargs="+", help="Project root directories to match to the instances",
+        required=False
+    )
+
+    # `vps catalog` command argument parser
+    vps_catalog_parser = vps_subparsers.add_parser(
+        "catalog", help="Manage the cached Linode catalog (images, regions, types)"
+    )
+    vps_catalog_subparsers = vps_catalog_parser.add_subparsers(dest="catalog_command", required=True)
+    vps_catalog_subparsers.add_parser(
+        "refresh", help="Fetch the Linode catalog again and update the cache"
+    )
+#---------------------------------------------------------------------------------------------------------
+    # warm pool commands
+    pool_parser = subparsers.add_parser(
+        "pool", help="Manage the warm pool of ready instances `sfy vps up` claims from"
+    )
+    pool_subparsers = pool_parser.add_subparsers(dest="pool_command", required=True)
+
+    # `pool refill` command argument parser
+    pool_refill_parser = pool_subparsers.add_parser(
+        "refill", help="Top the warm pool up with instances from the project's VPS configuration"
+    )
+    pool_refill_parser.add_argument(
+        "--size", type=int, help=f"Number of ready instances to keep (default {DEFAULT_POOL_SIZE} or {PoolKeys.POOL_CONFIGS_KEY.value}.{PoolKeys.SIZE_KEY.value})",
+        required=False
+    )
+    pool_refill_parser.add_argument(
+        "--ttl", type=int, help=f"Seconds before an unclaimed instance is replaced (default {DEFAULT_POOL_TTL})",
+        required=False
+    )
+    pool_refill_parser.add_argument(
+        "--max-idle", type=int, help=f"Seconds without claims before a --scheduled refill empties the pool (default {DEFAULT_POOL_MAX_IDLE})",
+        required=False
+    )
+    pool_refill_parser.add_argument(
+        "--coolify", action="store_true", help="Install Coolify on the new pool instances",
+        required=False
+    )
+    pool_refill_parser.add_argument(
+        "--scheduled", action="store_true", help="Run from a scheduler such as cron: empty the pool after --max-idle without claims",
+        required=False
+    )
+    pool_refill_parser.add_argument(
+        "--background", action="store_true", help="Refill in a detached process and return immediately",
+        required=False
+    )
+    pool_refill_parser.add_argument(
+        "--key-pool", action="store_true", help="Generate the SSH keys of the new pool instances in the background",
+        required=False
+    )
+
+    # `pool status` command argument parser
+    pool_subparsers.add_parser(
+        "status", help="List the ready instances in the warm pool"
+    )
+
+    # `pool drain` command argument parser
+    pool_subparsers.add_parser(
+        "drain", help="Delete every instance in the warm pool"
+    )
 #---------------------------------------------------------------------------------------------------------
     # coolify commands
     coolify_parser = subparsers.add_parser(
@@ -100,6 +226,26 @@ def main():
     coolify_install_parser = coolify_subparser.add_parser(
         "install", help="Install coolify on a VPS"
     )
+    coolify_install_parser.add_argument(
+        "--hosts", type=str, nargs="+", help="Install on these hosts concurrently instead of the project VPS",
+        required=False
+    )
+    coolify_install_parser.add_argument(
+        "--fleet", type=str, help="Path to a YAML fleet manifest with a `hosts` list to install on concurrently",
+        required=False
+    )
+    coolify_install_parser.add_argument(
+        "--parallel", type=int, help=f"Max number of hosts installed at once (default {DEFAULT_FLEET_PARALLELISM})",
+        default=DEFAULT_FLEET_PARALLELISM
+    )
+    coolify_install_parser.add_argument(
+        "--yes", action="store_true", help="Skip the confirmation prompt",
+        required=False
+    )
+    coolify_install_parser.add_argument(
+        "--pipelined", action="store_true", help="Upload the install commands as one script and run it in a single SSH session",
+        required=False
+    )
 
     coolify_synth_parser = coolify_subparser.add_parser(
         "synth", help="Sythesize a new Coolify instance config"
@@ -141,9 +287,17 @@ def main():
         "service_create", help="Create a resource for a Coolify project"
     )
     coolify_service_create_parser.add_argument(
-        "--product", type=str, help=f"Name of the service {DEFAULT_RESOURCE_PRODUCT_NAMES}",
+        "--product", type=str, action="append", help=f"Name of the service {DEFAULT_RESOURCE_PRODUCT_NAMES}. Repeat to create several services at once",
+        required=False
+    )
+    coolify_service_create_parser.add_argument(
+        "--stack", type=str, help="Path to a YAML stack file with a `services` list of service names",
         required=False
     )
+    coolify_service_create_parser.add_argument(
+        "--concurrency", type=int, help=f"Max number of services created at once (default {DEFAULT_COOLIFY_MAX_CONCURRENCY})",
+        default=DEFAULT_COOLIFY_MAX_CONCURRENCY
+    )
 #---------------------------------------------------------------------------------------------------------
     args = parser.parse_args()
 
@@ -158,8 +312,20 @@ def main():
             handle_vps_up(args)
         elif args.vps_command == "down":
             handle_vps_down(args)
+        elif args.vps_command == "bake":
+            handle_vps_bake(args)
         elif args.vps_command == "status":
             handle_vps_status(args)
+        elif args.vps_command == "catalog":
+            if args.catalog_command == "refresh":
+                handle_vps_catalog_refresh(args)
+    elif args.command == "pool":
+        if args.pool_command == "refill":
+            handle_pool_refill(args)
+        elif args.pool_command == "status":
+            handle_pool_status(args)
+        elif args.pool_command == "drain":
+            handle_pool_drain(args)
     elif args.command == "coolify":
         if args.coolify_command == "install":
             handle_coolify_install(args)
@@ -199,6 +365,7 @@ def handle_vps_synth(args):
         return
     
     if (args.provider == "linode" or args.provider == "Linode"):
+        from saasFactory.vps.provider import LinodeProvider
         # get API token either from command args or from user input and add to .env
         linode_api_token = args.api_token if args.api_token is not None else get_api_token_cli(provider="Linode")
         # add the Linode API token to the .env file
@@ -212,7 +379,7 @@ def handle_vps_synth(args):
         # use default configurations for VPS instance
         defaults_choice = yes_no_prompt(
             "Would you like to use default configurations for the VPS instance?",
-            additional_text=DEFAULT_LINODE_VPS_CONFIG_TABLE)
+            additional_text=get_default_linode_vps_config_table())
         if defaults_choice:
             print("Using default configurations for the VPS instance.")
             if(not linVPS.configure_instance(DEFAULT_LINODE_VPS_CONFIG)):
@@ -239,11 +406,87 @@ def handle_vps_up(args):
         return
     print(f"{Emojis.CHECK_MARK.value} Config File Found. Spinning up the VPS instance {Emojis.ROCKET.value}{Emojis.ROCKET.value}{Emojis.ROCKET.value}.")
 
+    if args.count is not None and args.count < 1:
+        print(f"{Emojis.ERROR_SIGN.value} --count must be at least 1.")
+        return
+
     # create Linode VPS Provider Instance
+    from saasFactory.vps.provider import LinodeProvider
     load_dotenv(os.path.join(findProjectRoot(), ".env"))
-    linVPS = LinodeProvider(os.environ[EnvVarNames.VPS_API_TOKEN_ENV_VAR.value])
+    key_pool = None
+    if args.key_pool and args.count is not None:
+        from saasFactory.vps.keys import SSHKeyPool
+        key_pool = SSHKeyPool(args.key_type, size=min(args.count, DEFAULT_SSH_KEY_POOL_SIZE))
+    linVPS = LinodeProvider(os.environ[EnvVarNames.VPS_API_TOKEN_ENV_VAR.value], key_type=args.key_type, key_pool=key_pool)
+    if args.count is None:
+        hibernated_linode = linVPS.find_hibernated_instance()
+        if hibernated_linode is not None:
+            linVPS.resume_instance(hibernated_linode, timeout=args.timeout if args.timeout is not None else DEFAULT_READINESS_TIMEOUT)
+            return
+    if args.count is None and not args.no_pool:
+        from saasFactory.vps.pool import WarmPool, read_pool_settings, start_background_refill
+        pool = WarmPool(linVPS, **read_pool_settings(YAMLParser(config_file)))
+        claimed = pool.claim(findProjectRoot(), require_coolify=args.bootstrap_coolify or args.golden_image)
+        if claimed is not None:
+            print(f"{Emojis.STAR.value} Claimed warm pool instance {claimed[VPSKeys.LINODE_ID_KEY.value]} ({claimed[VPSKeys.LINODE_PUBLIC_IP_KEY.value]}), it is ready to use.")
+            print(f"{Emojis.LOCK.value} Pool instances have no root password from {EnvVarNames.VPS_ROOT_PASSWORD_ENV_VAR.value}, use the SSH key in {SSH_KEY_DIR_NAME}.")
+            start_background_refill(findProjectRoot())
+            if claimed[PoolKeys.COOLIFY_KEY.value]:
+                print(POST_COOLIFY_INSTALL_MSG)
+            return
     linVPS.get_root_password()
-    linVPS.create_instance()
+    if args.golden_image and args.bootstrap_coolify:
+        print(f"{Emojis.WARNING_SIGN.value} The golden image already has Coolify installed, ignoring --bootstrap-coolify.")
+        args.bootstrap_coolify = False
+    has_coolify = args.bootstrap_coolify or args.golden_image
+    timeout = args.timeout if args.timeout is not None else (DEFAULT_COOLIFY_BOOTSTRAP_TIMEOUT if args.bootstrap_coolify else DEFAULT_READINESS_TIMEOUT)
+    if args.count is not None:
+        try:
+            linVPS.create_instances(args.count, wait=args.wait, timeout=timeout, bootstrap_coolify=args.bootstrap_coolify, golden_image=args.golden_image)
+        finally:
+            if key_pool is not None:
+                key_pool.close()
+        return
+    new_linode = linVPS.create_instance(bootstrap_coolify=args.bootstrap_coolify, golden_image=args.golden_image)
+    if new_linode is None:
+        return
+    if args.bootstrap_coolify:
+        print(f"{Emojis.CLOCK.value} Coolify is being installed during the first boot (log: {BOOTSTRAP_LOG_PATH} on the instance).")
+    if args.wait and linVPS.wait_for_instance(new_linode.id, new_linode.ipv4[0], timeout=timeout, wait_for_coolify=has_coolify) is not None and has_coolify:
+        print(POST_COOLIFY_INSTALL_MSG)
+
+
+def handle_vps_bake(args):
+    if findProjectRoot() is None:
+        root_dir_error_msg()
+        return
+    config_file = os.path.join(findProjectRoot(), CONFIG_FILE_NAME)
+    if not os.path.exists(config_file):
+        print(f"{Emojis.ERROR_SIGN.value} Project configuration file not found.")
+        return
+    print(f"{Emojis.CHECK_MARK.value} Config File Found. Baking a Coolify image of the VPS instance.")
+    from saasFactory.vps.provider import LinodeProvider
+    load_dotenv(os.path.join(findProjectRoot(), ".env"))
+    linVPS = LinodeProvider(os.environ[EnvVarNames.VPS_API_TOKEN_ENV_VAR.value])
+    linVPS.bake_image(label=args.label, timeout=args.timeout)
+
+
+def handle_vps_catalog_refresh(args):
+    if findProjectRoot() is None:
+        root_dir_error_msg()
+        return
+    load_dotenv(os.path.join(findProjectRoot(), ".env"))
+    linode_api_token = os.getenv(EnvVarNames.VPS_API_TOKEN_ENV_VAR.value)
+    if linode_api_token is None:
+        print(f"{Emojis.ERROR_SIGN.value} {EnvVarNames.VPS_API_TOKEN_ENV_VAR.value} not found in .env file. Run `sfy vps synth` first.")
+        return
+    from saasFactory.vps.provider import LinodeProvider
+    linVPS = LinodeProvider(linode_api_token)
+    catalog = linVPS.get_catalog(refresh=True)
+    if catalog is None:
+        print(f"{Emojis.ERROR_SIGN.value} Error refreshing the Linode catalog.")
+        return
+    print(f"{Emojis.CHECK_MARK.value} Linode catalog refreshed: {', '.join(f'{len(section)} {name}' for name, section in catalog.items())}.")
 
 
 def handle_vps_down(args):
@@ -254,13 +497,21 @@ def handle_vps_down(args):
     if not os.path.exists(config_file):
         print(f"{Emojis.ERROR_SIGN.value} Project configuration file not found.")
         return
-    print(f"{Emojis.CHECK_MARK.value} Config File Found. Destroying the VPS instance.")
+    from saasFactory.vps.provider import LinodeProvider
     load_dotenv(os.path.join(findProjectRoot(), ".env"))
     linVPS = LinodeProvider(os.environ[EnvVarNames.VPS_API_TOKEN_ENV_VAR.value])
+    if args.hibernate:
+        print(f"{Emojis.CHECK_MARK.value} Config File Found. Hibernating the VPS instance.")
+        linVPS.hibernate_instance()
+        return
+    print(f"{Emojis.CHECK_MARK.value} Config File Found. Destroying the VPS instance.")
     linVPS.destroy_instance()
 
 
 def handle_vps_status(args):
+    if args.all or args.projects:
+        handle_vps_status_all(args)
+        return
     if findProjectRoot() is None:
         root_dir_error_msg()
         return
@@ -269,11 +520,109 @@ def handle_vps_status(args):
         print(f"{Emojis.ERROR_SIGN.value} Project configuration file not found.")
         return
     print(f"{Emojis.CHECK_MARK.value} Config File Found. Checking the VPS instance status.")
+    from saasFactory.vps.provider import LinodeProvider
     load_dotenv(os.path.join(findProjectRoot(), ".env"))
     linVPS = LinodeProvider(os.environ[EnvVarNames.VPS_API_TOKEN_ENV_VAR.value])
     linVPS.check_instance_status(log_status=True)
 
+def handle_vps_status_all(args):
+    project_roots = list(args.projects or [])
+    if findProjectRoot() is not None:
+        project_roots.insert(0, findProjectRoot())
+    project_roots = list(dict.fromkeys(os.path.abspath(project_root) for project_root in project_roots))
+    # the API token comes from the first project that has one
+    for project_root in project_roots:
+        load_dotenv(os.path.join(project_root, ".env"))
+    linode_api_token = os.getenv(EnvVarNames.VPS_API_TOKEN_ENV_VAR.value)
+    if linode_api_token is None:
+        print(f"{Emojis.ERROR_SIGN.value} {EnvVarNames.VPS_API_TOKEN_ENV_VAR.value} not found. Run this command from a project root or pass --projects.")
+        return
+    from saasFactory.vps.provider import LinodeProvider
+    from tabulate import tabulate
+    linVPS = LinodeProvider(linode_api_token)
+    rows = linVPS.get_instances_status(project_roots)
+    if rows is None:
+        return
+    if len(rows) == 0:
+        print(f"{Emojis.STOP_SIGN.value} No saasFactory instances found.")
+        return
+    print(tabulate(rows, headers=["Project", "Label", "ID", "Status", "Public IP", "Region", "Type"], tablefmt="fancy_grid"))
+
+def handle_pool_refill(args):
+    if findProjectRoot() is None:
+        root_dir_error_msg()
+        return
+    if args.background:
+        from saasFactory.vps.pool import start_background_refill
+        start_background_refill(findProjectRoot())
+        return
+    sf_config_parser = YAMLParser(os.path.join(findProjectRoot(), CONFIG_FILE_NAME))
+    linode_configs = sf_config_parser.get(VPSKeys.VPS_CONFIGS_KEY.value)
+    if not isinstance(linode_configs, dict) or any(linode_configs.get(key.value) is None for key in (VPSKeys.LINODE_IMAGE_KEY, VPSKeys.LINODE_REGION_KEY, VPSKeys.LINODE_TYPE_KEY)):
+        print(f"{Emojis.ERROR_SIGN.value} No Linode configurations found. Run `sfy vps synth` first.")
+        return
+    from saasFactory.vps.provider import LinodeProvider
+    from saasFactory.vps.pool import WarmPool, read_pool_settings
+    load_dotenv(os.path.join(findProjectRoot(), ".env"))
+    pool_settings = read_pool_settings(
+        sf_config_parser,
+        size=args.size,
+        ttl=args.ttl,
+        max_idle=args.max_idle,
+        coolify=True if args.coolify else None
+    )
+    key_pool = None
+    if args.key_pool:
+        from saasFactory.vps.keys import SSHKeyPool
+        key_pool = SSHKeyPool(size=min(pool_settings[PoolKeys.SIZE_KEY.value], DEFAULT_SSH_KEY_POOL_SIZE))
+    try:
+        linVPS = LinodeProvider(os.environ[EnvVarNames.VPS_API_TOKEN_ENV_VAR.value], key_pool=key_pool)
+        if not linVPS.test_token_client():
+            return
+        WarmPool(linVPS, **pool_settings).refill(linode_configs, scheduled=args.scheduled)
+    finally:
+        if key_pool is not None:
+            key_pool.close()
+
+def handle_pool_status(args):
+    if findProjectRoot() is None:
+        root_dir_error_msg()
+        return
+    from saasFactory.vps.provider import LinodeProvider
+    from saasFactory.vps.pool import WarmPool, read_pool_settings
+    from tabulate import tabulate
+    load_dotenv(os.path.join(findProjectRoot(), ".env"))
+    linVPS = LinodeProvider(os.environ[EnvVarNames.VPS_API_TOKEN_ENV_VAR.value])
+    pool_settings = read_pool_settings(YAMLParser(os.path.join(findProjectRoot(), CONFIG_FILE_NAME)))
+    entries = WarmPool(linVPS, **pool_settings).entries()
+    print(tabulate([[key, value] for key, value in pool_settings.items()], headers=["", "Pool Setting"], tablefmt="fancy_grid"))
+    if len(entries) == 0:
+        print(f"{Emojis.STOP_SIGN.value} The warm pool is empty. Run `sfy pool refill` to fill it.")
+        return
+    print(tabulate(
+        [[entry[VPSKeys.LINODE_LABEL_KEY.value], instance_id, entry[VPSKeys.LINODE_PUBLIC_IP_KEY.value], entry[VPSKeys.LINODE_REGION_KEY.value],
+          entry[VPSKeys.LINODE_TYPE_KEY.value], entry[VPSKeys.LINODE_IMAGE_KEY.value], entry[PoolKeys.COOLIFY_KEY.value], f"{(time.time() - entry['created']) / 60:.0f}"]
+         for instance_id, entry in entries.items()],
+        headers=["Label", "ID", "Public IP", "Region", "Type", "Image", "Coolify", "Age (min)"], tablefmt="fancy_grid"
+    ))
+
+def handle_pool_drain(args):
+    if findProjectRoot() is None:
+        root_dir_error_msg()
+        return
+    if not yes_no_prompt("Are you sure you want to delete every instance in the warm pool?"):
+        print(f"{Emojis.BOMB.value} Pool drain aborted.")
+        return
+    from saasFactory.vps.provider import LinodeProvider
+    from saasFactory.vps.pool import WarmPool
+    load_dotenv(os.path.join(findProjectRoot(), ".env"))
+    linVPS = LinodeProvider(os.environ[EnvVarNames.VPS_API_TOKEN_ENV_VAR.value])
+    print(f"{Emojis.STAR.value} Deleted {WarmPool(linVPS).drain()} warm pool instances.")
+
 def handle_coolify_install(args):
+    if args.hosts or args.fleet:
+        handle_coolify_fleet_install(args)
+        return
     if findProjectRoot() is None:
         root_dir_error_msg()
         return
@@ -282,6 +631,7 @@ def handle_coolify_install(args):
         print(f"{Emojis.ERROR_SIGN.value} Project configuration file not found.")
         return
     #check if the instance is running
+    from saasFactory.vps.provider import LinodeProvider
     load_dotenv(os.path.join(findProjectRoot(), ".env"))
     linVPS = LinodeProvider(os.environ[EnvVarNames.VPS_API_TOKEN_ENV_VAR.value])
     vps_status = linVPS.check_instance_status(log_status=False)
@@ -290,6 +640,8 @@ def handle_coolify_install(args):
         print(f"Please ensure the VPS instance is running before installing coolify. Current status: {vps_status}")
    
     print(f"{Emojis.CLOCK.value} Attempting SSH connection to the VPS instance.")
+    from saasFactory.vps.ssh import SSHConnection
+    from tabulate import tabulate
     sf_config_parser = YAMLParser(config_file)
     vps_ipv4 = sf_config_parser.get(list_to_dot_notation([VPSKeys.VPS_CONFIGS_KEY.value, VPSKeys.LINODE_PUBLIC_IP_KEY.value]))
     ssh_con = SSHConnection(host=vps_ipv4, username=DEFAULT_LINODE_USERNAME)
@@ -298,18 +650,31 @@ def handle_coolify_install(args):
         return
     print(f"{Emojis.CHECK_MARK.value} SSH Connection Successful.")
     
-    if not yes_no_prompt(f"Those commands will take a while {Emojis.CLOCK.value} to execute. Are you sure you want to continue?", additional_text="\n\nThe following commands will be executed:\n" + tabulate([[VPSCommands.UPDATE_CMD.value], [VPSCommands.UPGRADE_CMD.value], [VPSCommands.COOLIFY_INSTALL_CMD.value]])):
+    if not args.yes and not yes_no_prompt(f"Those commands will take a while {Emojis.CLOCK.value} to execute. Are you sure you want to continue?", additional_text="\n\nThe following commands will be executed:\n" + tabulate([[command] for command in COOLIFY_INSTALL_COMMANDS])):
         print(f"\n{Emojis.DYNAMITE.value} Aborted Coolify Installation.")
         return
 
     print(f"{Emojis.CHECK_MARK.value} Attempting to install coolify on the VPS instance.\n")
-    if not ssh_con.execute_command(VPSCommands.UPDATE_CMD.value, logging=True):
+    if args.pipelined:
+        result = ssh_con.execute_script(COOLIFY_INSTALL_COMMANDS, logging=True)
+        ssh_con.disconnect()
+        print(tabulate(
+            [[index + 1, step.command, Emojis.CHECK_MARK.value if step.exit_code == 0 else Emojis.ERROR_SIGN.value, f"{step.seconds:.1f}" if step.seconds is not None else "-"] for index, step in enumerate(result.steps)],
+            headers=["Step", "Command", "Result", "Time (s)"], tablefmt="fancy_grid"
+        ))
+        if not result.ok:
+            print(f"{Emojis.ERROR_SIGN.value} Coolify Installation Failed.")
+            return
+        print(f"{Emojis.STAR.value} Coolify Installation Successful.")
+        print(POST_COOLIFY_INSTALL_MSG)
+        return
+    if not ssh_con.execute_command(VPSCommands.UPDATE_CMD.value, logging=True).ok:
         print(f"{Emojis.ERROR_SIGN.value} VPS Update Failed.")
         return
-    if not ssh_con.execute_command(VPSCommands.UPGRADE_CMD.value, logging=True):
+    if not ssh_con.execute_command(VPSCommands.UPGRADE_CMD.value, logging=True).ok:
         print(f"{Emojis.ERROR_SIGN.value} VPS Upgrade Failed.")
         return
-    if not ssh_con.execute_command(VPSCommands.COOLIFY_INSTALL_CMD.value, logging=True):
+    if not ssh_con.execute_command(VPSCommands.COOLIFY_INSTALL_CMD.value, logging=True).ok:
         print(f"{Emojis.ERROR_SIGN.value} Coolify Installation Failed.")
         return 
     
@@ -318,6 +683,25 @@ def handle_coolify_install(args):
     # prompt user to run manual commands to sign into coolify ...
     print(POST_COOLIFY_INSTALL_MSG)    
 
+def handle_coolify_fleet_install(args):
+    from saasFactory.vps.fleet import load_fleet_hosts, run_commands_on_fleet
+    from tabulate import tabulate
+    if args.fleet is not None and not os.path.exists(args.fleet):
+        print(f"{Emojis.ERROR_SIGN.value} Fleet manifest '{args.fleet}' not found.")
+        return
+    fleet_hosts = load_fleet_hosts(args.hosts, args.fleet)
+    if len(fleet_hosts) == 0:
+        print(f"{Emojis.ERROR_SIGN.value} No hosts to install on.")
+        return
+    if not args.yes and not yes_no_prompt(f"Those commands will take a while {Emojis.CLOCK.value} to execute on {len(fleet_hosts)} hosts. Are you sure you want to continue?", additional_text="\n\nThe following commands will be executed:\n" + tabulate([[command] for command in COOLIFY_INSTALL_COMMANDS])):
+        print(f"\n{Emojis.DYNAMITE.value} Aborted Coolify Installation.")
+        return
+
+    print(f"{Emojis.CHECK_MARK.value} Installing coolify on {len(fleet_hosts)} hosts, {args.parallel} at a time.\n")
+    if run_commands_on_fleet(fleet_hosts, COOLIFY_INSTALL_COMMANDS, parallelism=args.parallel, pipelined=args.pipelined):
+        print(f"{Emojis.STAR.value} Coolify Installation Successful on all hosts.")
+        print(POST_COOLIFY_INSTALL_MSG)
+
 def handle_coolify_synth(args):
     if findProjectRoot() is None:
         root_dir_error_msg()
@@ -365,6 +749,7 @@ def handle_coolify_synth(args):
     
     #attempt to connect to coolify instance
     print(f"{Emojis.CHECK_MARK.value} Attempting to connect to the Coolify instance.")
+    from saasFactory.coolify.coolify import CoolifyClient
     coolify_client = CoolifyClient(coolify_api_token)
     coolify_client.test_connection()
     print(f"\n{Emojis.STAR.value} Coolify instance configuration successful!\n")
@@ -375,6 +760,7 @@ def handle_coolify_project_create(args):
         return
     print(f"{Emojis.SOON.value} Creating a new Coolify project.")
     load_dotenv(os.path.join(findProjectRoot(), ".env"))
+    from saasFactory.coolify.coolify import CoolifyClient
     coolify_client = CoolifyClient(os.environ[EnvVarNames.COOLIFY_API_TOKEN_ENV_VAR.value])
     if not coolify_client.test_connection():
         return 
@@ -396,6 +782,7 @@ def handle_coolify_github_connect(args):
         return
     print(f"{Emojis.SOON.value} Creating a new GitHub Repo for your app and connecting it to your Coolify instance.")
     load_dotenv(os.path.join(findProjectRoot(), ".env"))
+    from saasFactory.coolify.coolify import CoolifyClient
     coolify_client = CoolifyClient(os.environ[EnvVarNames.COOLIFY_API_TOKEN_ENV_VAR.value])
     if not coolify_client.test_connection():
         return
@@ -408,14 +795,24 @@ def handle_coolify_service_create(args):
         return
     print(f"{Emojis.SOON.value} Creating a new Resource for your app and connecting it to your Coolify instance.")
     load_dotenv(os.path.join(findProjectRoot(), ".env"))
+    from saasFactory.coolify.coolify import CoolifyClient
     coolify_client = CoolifyClient(os.environ[EnvVarNames.COOLIFY_API_TOKEN_ENV_VAR.value])
     if not coolify_client.test_connection():
         return
-    service_product = args.product
-    if service_product not in DEFAULT_RESOURCE_PRODUCT_NAMES or service_product is None:
+    service_products = list(args.product or [])
+    if args.stack is not None:
+        if not os.path.exists(args.stack):
+            print(f"{Emojis.ERROR_SIGN.value} Stack file '{args.stack}' not found.")
+            return
+        service_products += YAMLParser(args.stack).get(CoolifyKeys.COOLIFY_STACK_SERVICES_KEY.value) or []
+    service_products = list(dict.fromkeys(service_products)) #drop duplicates, keep order
+    if len(service_products) == 0 or any(service_product not in DEFAULT_RESOURCE_PRODUCT_NAMES for service_product in service_products):
         print(f"{Emojis.ERROR_SIGN.value} Invalid resource product name.")
         return
-    coolify_client.create_service(service_product)
+    if len(service_products) == 1:
+        coolify_client.create_service(service_products[0])
+    else:
+        coolify_client.create_services(service_products, max_concurrency=args.concurrency)
     #no list service as far as i know
     # next steps are to get the services, deploy them, change their endpoints and get the important env vars to connect to frontend 
     # need domain handling too which can tie to the services
@@ -0,0 +1,115 @@
+import json
+import os
+import tempfile
+import time
+from hashlib import sha256
+from saasFactory.utils.globals import CACHE_DIR_NAME
+from saasFactory.utils.lock import file_lock
+
+
+def get_cache_dir() -> str:
+    """
+    Get the saasFactory cache directory, creating it if needed. Honors $XDG_CACHE_HOME.
+
+    Returns:
+        str: The absolute path of the cache directory.
+    """
+    base_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    cache_dir = os.path.join(base_dir, CACHE_DIR_NAME)
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    return cache_dir
+
+
+def hash_token(token: str) -> str:
+    """
+    Hash an API token so it can be used in cache keys without writing the token itself to disk.
+
+    Args:
+        token (str): The API token.
+
+    Returns:
+        str: A short hex digest of the token.
+    """
+    return sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+class DiskCache:
+    """
+    A small JSON backed key/value cache in the user's cache directory. Entries expire after a TTL chosen at read time.
+    Values must be JSON serializable.
+    """
+
+    def __init__(self, namespace: str) -> None:
+        """
+        Initialize the cache for a namespace. Each namespace is stored in its own `<namespace>.json` file.
+
+        Args:
+            namespace (str): Name of the cache file.
+        """
+        self.file_path = os.path.join(get_cache_dir(), f"{namespace}.json")
+
+    def _read(self) -> dict:
+        try:
+            with file_lock(self.file_path):
+                with open(self.file_path, "r") as file:
+                    return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write(self, entries: dict) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.file_path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as file:
+                json.dump(entries, file)
+            os.replace(tmp_path, self.file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def get(self, key: str, ttl: float) -> any:
+        """
+        Get a cached value if it is younger than `ttl` seconds.
+
+        Args:
+            key (str): The cache key.
+            ttl (float): Maximum age of the entry in seconds.
+
+        Returns:
+            any: The cached value, or None if missing or expired.
+        """
+        entry = self._read().get(key)
+        if entry is None or time.time() - entry["stored_at"] > ttl:
+            return None
+        return entry["value"]
+
+    def set(self, key: str, value: any) -> None:
+        """
+        Store a value in the cache. Failures are ignored since the cache is only an optimization.
+
+        Args:
+            key (str): The cache key.
+            value (any): The JSON serializable value to store.
+        """
+        try:
+            with file_lock(self.file_path, exclusive=True):
+                entries = self._read()
+                entries[key] = {"stored_at": time.time(), "value": value}
+                self._write(entries)
+        except Exception:
+            pass
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove an entry from the cache.
+
+        Args:
+            key (str): The cache key.
+        """
+        try:
+            with file_lock(self.file_path, exclusive=True):
+                entries = self._read()
+                if entries.pop(key, None) is not None:
+                    self._write(entries)
+        except Exception:
+            pass
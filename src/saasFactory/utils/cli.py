@@ -1,15 +1,15 @@
 import os
 from typing import Optional
 from datetime import datetime
-from tabulate import tabulate
 from saasFactory.utils.globals import CONFIG_FILE_NAME, PROJECT_DIR_NAME_SUFFIX
 from saasFactory.utils.enums import Emojis
 from saasFactory.utils.yaml import YAMLParser
+from saasFactory.utils.lock import file_lock
 from dotenv import load_dotenv, set_key
-from pyfiglet import figlet_format
 
 
 def printWelcomeMessage() -> None:
+    from pyfiglet import figlet_format # only needed by `sfy init`, keep it off the start up path
     ascii_logo = figlet_format("saasFactory", width=140) 
     ascii_name = figlet_format("Scott Williams", font="digital")
     print(ascii_logo)
@@ -93,8 +93,10 @@ def createSFConfigFile(project_path: str, project_name: str) -> None:
                 pass
             config_file.close()
         yaml_file = YAMLParser(config_file_path)
-        yaml_file.append({"project_name": project_name})
-        yaml_file.append({"created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")})
+        yaml_file.append({
+            "project_name": project_name,
+            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        })
         print(f">>> Created {CONFIG_FILE_NAME} file at: {config_file_path}")
     except Exception as e:
         print(f"Error creating {CONFIG_FILE_NAME} file: {e}")
@@ -132,37 +134,60 @@ def addEnvVar(env_var: str, value: str) -> bool:
     env_file_path = os.path.join(project_root, ".env")
     try:
         load_dotenv(env_file_path)
-        # Check if the environment variable already exists
-        with open(env_file_path, "r") as env_file:
-            lines = env_file.readlines()
-        
-            for line in lines:
-                if line.startswith(f"{env_var.upper()}="):
+        confirmed_line = None
+        while True:
+            with file_lock(env_file_path):
+                existing_line = find_env_line(env_file_path, env_var)
+
+            # Check if the environment variable already exists, the prompt runs without holding the lock
+            # so other sfy processes can keep writing the .env file while it waits for an answer
+            if existing_line is not None and existing_line != confirmed_line:
+                print(f"-------------------------------------------{len(env_var) * '-'}")
+                print(f"Conflict detected for environment variable '{env_var.upper()}':")
+                print(f"1. Keep existing value: {existing_line.strip()}")
+                print(f"2. Replace with new value: {env_var.upper()}={value}")
+                choice = input("Choose an option (1 or 2): ").strip()
+                if choice == '1':
+                    print("Keeping existing environment variable...")
                     print(f"-------------------------------------------{len(env_var) * '-'}")
-                    print(f"Conflict detected for environment variable '{env_var.upper()}':")
-                    print(f"1. Keep existing value: {line.strip()}")
-                    print(f"2. Replace with new value: {env_var.upper()}={value}")
-                    choice = input("Choose an option (1 or 2): ").strip()
-                    if choice == '1':
-                        print("Keeping existing environment variable...")
-                        print(f"-------------------------------------------{len(env_var) * '-'}")
-                        return True
-                    elif choice == '2':
-                        print("Replacing existing environment variable...")
-                        print(f"-------------------------------------------{len(env_var) * '-'}")
-                        break
-                    else:
-                        print("Invalid choice. Please enter 1 or 2.")
-                        return False
-                    
-           
-            set_key(dotenv_path=env_file_path, key_to_set=env_var.upper(), value_to_set=value, quote_mode="never")            
+                    return True
+                elif choice == '2':
+                    print("Replacing existing environment variable...")
+                    print(f"-------------------------------------------{len(env_var) * '-'}")
+                    confirmed_line = existing_line
+                else:
+                    print("Invalid choice. Please enter 1 or 2.")
+                    return False
+
+            # set_key rewrites the whole .env, lock it so parallel sfy commands don't drop each other's variables
+            with file_lock(env_file_path, exclusive=True):
+                if find_env_line(env_file_path, env_var) != existing_line:
+                    continue # another process changed the variable while we were prompting, check it again
+                set_key(dotenv_path=env_file_path, key_to_set=env_var.upper(), value_to_set=value, quote_mode="never")
             print(f">>> Added environment variable '{env_var.upper()}' to .env file.")
             return True
 
     except Exception as e:
         print(f"Error adding environment variable to .env file: {e}")
         return False
+
+
+def find_env_line(env_file_path: str, env_var: str) -> str|None:
+    """
+    Find the line setting an environment variable in a .env file.
+
+    Args:
+        env_file_path (str): Path of the .env file.
+        env_var (str): The name of the environment variable.
+
+    Returns:
+        str|None: The line, or None if the variable is not set in the file.
+    """
+    with open(env_file_path, "r") as env_file:
+        for line in env_file:
+            if line.startswith(f"{env_var.upper()}="):
+                return line
+    return None
     
 
 def get_user_choice(options:list[str], use_table: bool = False, table_headers: list[str] = None) -> int:
@@ -180,6 +205,7 @@ def get_user_choice(options:list[str], use_table: bool = False, table_headers: l
     while True:
         print("Choose an option:")
         if use_table:
+            from tabulate import tabulate
             print(tabulate(options, headers=table_headers, tablefmt="fancy_grid"))
         else:
             for i, option in enumerate(options):
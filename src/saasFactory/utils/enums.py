@@ -18,6 +18,10 @@ class VPSKeys(Enum):
     LINODE_LABEL_KEY = "label"
     LINODE_ID_KEY = "linode_id"
     LINODE_PUBLIC_IP_KEY = "public_ip"
+    LINODE_INSTANCES_KEY = "instances" #extra instances from `vps up --count`
+    LINODE_SSH_KEY_KEY = "ssh_key" #key file name of an extra instance
+    LINODE_GOLDEN_IMAGE_KEY = "golden_image" #private image with Coolify installed, from `vps bake`
+    LINODE_HIBERNATED_KEY = "hibernated" #boolean value, set by `vps down --hibernate`
 
 #Configurations Key Coolify
 class CoolifyKeys(Enum):
@@ -31,6 +35,8 @@ class CoolifyKeys(Enum):
     COOLIFY_NAME_KEY = "name"
     COOLIFY_PROJECT_DESCRIPTION_KEY = "description"
     COOLIFY_UUID_KEY = "uuid"
+    COOLIFY_CACHE_TTL_KEY = "cache_ttl" #optional, seconds to cache project/server listings
+    COOLIFY_STACK_SERVICES_KEY = "services" #list of service names in a `service_create --stack` file
 
 #Emojis:
 class Emojis(Enum):
@@ -56,6 +62,25 @@ class Emojis(Enum):
     KEY = "🔑"
     DOCS = "📚"
 
+#Fleet manifest keys (`sfy coolify install --fleet`)
+class FleetKeys(Enum):
+    HOSTS_KEY = "hosts" #parent key
+    HOST_KEY = "host"
+    NAME_KEY = "name" #optional, defaults to host
+    USERNAME_KEY = "username" #optional
+    PORT_KEY = "port" #optional
+    KEY_PATH_KEY = "key" #optional, path to the private key
+
+class SSHKeyTypes(Enum):
+    ED25519 = "ed25519"
+    RSA = "rsa"
+
+#Linode catalog cache sections
+class LinodeCatalogKeys(Enum):
+    IMAGES_KEY = "images"
+    REGIONS_KEY = "regions"
+    TYPES_KEY = "types"
+
 class VPSCommands(Enum):
     UPDATE_CMD = "sudo apt update -y"
     UPGRADE_CMD = "sudo apt upgrade -y"
@@ -70,6 +95,26 @@ class LinodeStatus(Enum):
     SHUTTING_DOWN = "shutting_down"
     BUSY = "busy"
 
+#Configurations Key Warm Pool (`sfy pool`)
+class PoolKeys(Enum):
+    POOL_CONFIGS_KEY = "pool_configs" #parent key
+    SIZE_KEY = "size"
+    TTL_KEY = "ttl" #seconds
+    MAX_IDLE_KEY = "max_idle" #seconds
+    COOLIFY_KEY = "coolify" #boolean value
+
+class LinodeImageStatus(Enum):
+    CREATING = "creating"
+    PENDING_UPLOAD = "pending_upload"
+    AVAILABLE = "available"
+
+#phases of waiting for a new instance (`vps up --wait`)
+class ReadinessPhases(Enum):
+    STATUS = "status running"
+    TCP = "ssh port open"
+    SSH = "ssh handshake"
+    COOLIFY = "coolify port open"
+
 #github repos - the last 2 are dummy replace later
 class GitHubRepos(Enum):
     SAAS_STARTER = "https://github.com/nextjs/saas-starter.git"
@@ -1,5 +1,4 @@
-from tabulate import tabulate
-from saasFactory.utils.enums import VPSKeys, Emojis
+from saasFactory.utils.enums import VPSKeys, Emojis, VPSCommands, SSHKeyTypes
 
 #Files Names:
 PROJECT_DIR_NAME_SUFFIX = "_sfy_project" # if user doesn't specify a project name this gets added to the current directory name
@@ -8,7 +7,10 @@ SSH_KEY_FILE_NAME = "sfy_key"
 
 #Folder Names:
 SSH_KEY_DIR_NAME = "ssh_keys"
+CACHE_DIR_NAME = "saasFactory" # created under $XDG_CACHE_HOME (or ~/.cache)
 GIT_REPO_DIR_NAME = "frontend"
+TEMPLATE_CACHE_DIR_NAME = "template_repos" # bare mirrors of the template repos, under the cache directory
+LOCK_DIR_NAME = "locks" # file_lock sidecar files, under the cache directory so they never end up in a project repo
 
 #Configurations Raw:
 DEFAULT_LINODE_VPS_CONFIG = {
@@ -17,21 +19,73 @@ DEFAULT_LINODE_VPS_CONFIG = {
     VPSKeys.LINODE_TYPE_KEY.value: "g6-standard-1"
 }
 DEFAULT_LINODE_USERNAME = "root"
+DEFAULT_PROVISION_PARALLELISM = 8 # instances created at once by `vps up --count`
+LINODE_API_RATE_LIMIT = 800 # Linode API requests allowed per LINODE_API_RATE_WINDOW, shared by all sfy processes
+LINODE_API_RATE_WINDOW = 60 # seconds
+LINODE_API_BURST = 40 # requests that may be sent back to back before the rate limit applies
+LINODE_API_MAX_RETRIES = 5 # retries of a rate limited (429) or failed read request
+LINODE_API_RETRY_STATUSES = [408, 429, 502, 503, 504]
+DEFAULT_LINODE_CATALOG_TTL = 86400 # seconds to cache the Linode images/regions/types catalog
+DEFAULT_TOKEN_VALIDATION_TTL = 900 # seconds a successful API token validation is trusted for
+DEFAULT_SSH_KEY_TYPE = SSHKeyTypes.ED25519.value
+RSA_KEY_BITS = 4096
+DEFAULT_SSH_KEY_POOL_SIZE = 4 # keys pre-generated in the background when provisioning several instances
+SSH_RECV_BUFFER_SIZE = 32768 # bytes read from an SSH channel at a time
+SSH_OUTPUT_TAIL_BYTES = 65536 # bytes of command output kept in memory, older output is only streamed
+SSH_SELECT_TIMEOUT = 1.0 # seconds to wait for SSH channel output before re-checking the exit status
+SSH_CONNECT_TIMEOUT = 10 # seconds allowed for a TCP connect or SSH handshake
+DEFAULT_READINESS_TIMEOUT = 600 # seconds `vps up --wait` waits for an instance to accept SSH
+DEFAULT_COOLIFY_BOOTSTRAP_TIMEOUT = 1800 # seconds `vps up --bootstrap-coolify --wait` waits for Coolify to be installed at first boot
+BOOTSTRAP_LOG_PATH = "/var/log/sfy-bootstrap.log" # where the first boot Coolify install logs to on the instance
+DEFAULT_IMAGE_BAKE_TIMEOUT = 1800 # seconds `vps bake` waits for the instance to shut down and the image to become available
+DEFAULT_SHUTDOWN_TIMEOUT = 300 # seconds `vps down --hibernate` waits for the instance to be offline
+GOLDEN_IMAGE_LABEL_SUFFIX = "-coolify" # appended to the instance label to name the image made by `vps bake`
+READINESS_POLL_INITIAL_DELAY = 1.0 # first delay between readiness checks, doubled after each check
+READINESS_POLL_MAX_DELAY = 15.0 # largest delay between readiness checks
+DEFAULT_FLEET_PARALLELISM = 5 # hosts worked on at once by fleet commands
+SSH_STEP_MARKER = "::sfy-step::" # prefix of the step marker lines printed by uploaded scripts
+SSH_REMOTE_SCRIPT_DIR = "/tmp" # where scripts are uploaded before they are run
 DEFAULT_COOLIFY_PORT = 8000
 DEFAULT_COOLIFY_PROJECT_NAME = "sfy-coolify-project"
 DEFAULT_COOLIFY_SERVICE_NAME = "sfy-coolify-service"
 DEFAULT_COOLIFY_PROJECT_DESCRIPTION = "A project created by saasFactory CLI."
 DEFAULT_COOLIFY_SERVICE_DESCRIPTION = "A service created by saasFactory CLI."
+DEFAULT_TEMPLATE_FETCH_TTL = 300 # seconds a template mirror is used without fetching it again
+GIT_PUSH_BASE_TIMEOUT = 30 # seconds a push may take regardless of its size
+GIT_PUSH_MIN_THROUGHPUT = 256 * 1024 # bytes per second a push is expected to reach at least, sets the timeout for larger pushes
 DEFAULT_NEW_GITHUB_REPO_NAME = "sfy_coolify_project"
 DEFAULT_DEPLOY_KEY_PREFIX = "sfy_coolify_deploy_key_"
 DEFAULT_COOLIFY_ENVIRONMENT_NAME = "production"
+COOLIFY_HTTP_POOL_SIZE = 10 # max keep-alive connections kept open to the Coolify API
+DEFAULT_COOLIFY_MAX_CONCURRENCY = 8 # max concurrent requests made by AsyncCoolifyClient
+DEFAULT_COOLIFY_CACHE_TTL = 300 # seconds to cache Coolify project/server listings
 
 #Configurations Text Formatted:
 DEFAULT_LINODE_VPS_CONFIG_TEXT = "Here are the default Linode VPS Configs:\n" + "\n".join([f"{key}: {value}" for key, value in DEFAULT_LINODE_VPS_CONFIG.items()])
-DEFAULT_LINODE_VPS_CONFIG_TABLE = "Here are the default Linode VPS Configs:\n" + tabulate([[key, value] for key, value in DEFAULT_LINODE_VPS_CONFIG.items()], headers=["", "Default"], tablefmt="fancy_grid")
+def get_default_linode_vps_config_table() -> str:
+    """
+    Render the default Linode VPS configs as a table. Rendered on demand so importing globals doesn't pull in tabulate.
+
+    Returns:
+        str: The formatted table of default Linode VPS configs.
+    """
+    from tabulate import tabulate
+    return "Here are the default Linode VPS Configs:\n" + tabulate([[key, value] for key, value in DEFAULT_LINODE_VPS_CONFIG.items()], headers=["", "Default"], tablefmt="fancy_grid")
+
+#Commands run on a VPS to install Coolify, in order
+COOLIFY_INSTALL_COMMANDS = [VPSCommands.UPDATE_CMD.value, VPSCommands.UPGRADE_CMD.value, VPSCommands.COOLIFY_INSTALL_CMD.value]
 
 #Resources Name Prefixes:
 LINODE_INSTANCE_PREFIX = "sfy-instance-"
+POOL_LABEL_PREFIX = f"{LINODE_INSTANCE_PREFIX}pool-" # label prefix of warm pool instances
+POOL_TAG = f"{LINODE_INSTANCE_PREFIX}pool" # tag of warm pool instances
+
+#Warm pool (`sfy pool`):
+DEFAULT_POOL_SIZE = 2 # ready instances kept in the pool
+DEFAULT_POOL_TTL = 86400 # seconds before an unclaimed pool instance is replaced
+DEFAULT_POOL_MAX_IDLE = 259200 # seconds without claims before scheduled refills empty the pool
+POOL_KEY_DIR_NAME = "pool_keys" # cache folder with the SSH keys of unclaimed pool instances
+POOL_REFILL_LOG_FILE_NAME = "pool_refill.log" # cache file background refills log to
 
 #Default Resource Products:
 DEFAULT_RESOURCE_PRODUCT_NAMES = ["convex", "supabase", "n8n", "pocketbase"]
@@ -0,0 +1,83 @@
+import os
+import threading
+from hashlib import sha256
+from contextlib import contextmanager
+from typing import Iterator
+from saasFactory.utils.globals import LOCK_DIR_NAME
+
+# fcntl is POSIX only, on other platforms locking is a no-op
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# locks held by the current thread: lock file path -> [fd, exclusive, depth]
+_held_locks = threading.local()
+
+
+def lock_file_path(file_path: str) -> str:
+    """
+    Get the sidecar lock file used for a file. Lock files live in the cache directory, named after a hash of
+    the file's absolute path, so they are never created next to the project's sf_config.yaml or .env.
+
+    Args:
+        file_path (str): Path of the file to lock.
+
+    Returns:
+        str: The absolute path of the lock file.
+    """
+    from saasFactory.utils.cache import get_cache_dir # cache imports this module
+    lock_dir = os.path.join(get_cache_dir(), LOCK_DIR_NAME)
+    os.makedirs(lock_dir, mode=0o700, exist_ok=True)
+    return os.path.join(lock_dir, sha256(os.path.abspath(file_path).encode("utf-8")).hexdigest()[:32] + ".lock")
+
+
+@contextmanager
+def file_lock(file_path: str, exclusive: bool = False) -> Iterator[None]:
+    """
+    Hold an advisory fcntl lock for a file so multiple sfy processes can safely share a project directory.
+    The lock is taken on a sidecar file in the cache directory (see `lock_file_path`) because writers replace the file itself with a rename.
+    Readers should take a shared lock and writers an exclusive one, up front for the whole read-modify-write.
+
+    Locks are re-entrant within a thread: a nested call on an already locked file reuses the held lock.
+    A shared lock is never upgraded in place since flock drops it before converting, which would let another
+    writer in between the caller's read and write.
+
+    Args:
+        file_path (str): Path of the file to lock.
+        exclusive (bool): Take an exclusive (write) lock instead of a shared (read) lock (default is False).
+
+    Raises:
+        RuntimeError: If an exclusive lock is requested while the thread only holds a shared lock on the file.
+    """
+    if fcntl is None:
+        yield
+        return
+
+    lock_path = lock_file_path(file_path)
+    held = getattr(_held_locks, "locks", None)
+    if held is None:
+        held = _held_locks.locks = {}
+
+    if lock_path in held:
+        entry = held[lock_path]
+        if exclusive and not entry[1]:
+            raise RuntimeError(f"Cannot upgrade the shared lock on {file_path} to exclusive, take the exclusive lock up front.")
+        entry[2] += 1
+        try:
+            yield
+        finally:
+            entry[2] -= 1
+        return
+
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        held[lock_path] = [fd, exclusive, 1]
+        try:
+            yield
+        finally:
+            del held[lock_path]
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
@@ -1,6 +1,18 @@
 import yaml
 import os
+import copy
+import stat
+import tempfile
 from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator
+from saasFactory.utils.lock import file_lock
+
+# Use the libyaml (C) loader/dumper when PyYAML was built with it, otherwise fall back to the pure Python ones
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
 
 # Register custom representer for OrderedDict
 def represent_ordereddict(dumper, data):
@@ -8,6 +20,12 @@ def represent_ordereddict(dumper, data):
 
 yaml.add_representer(OrderedDict, represent_ordereddict)
 yaml.SafeDumper.add_representer(OrderedDict, represent_ordereddict)
+_SafeDumper.add_representer(OrderedDict, represent_ordereddict)
+
+# Parsed documents shared by every YAMLParser in the process, keyed on absolute file path.
+# Entries hold (inode, mtime_ns, size, data) and are only reused while the file's stat still matches.
+# Writes replace the file with a rename, so the inode changes even when mtime and size don't.
+_DOCUMENT_CACHE: dict[str, tuple[int, int, int, dict|None]] = {}
 
 class YAMLParser:
     def __init__(self, file_path: str) -> None:
@@ -19,6 +37,107 @@ class YAMLParser:
         """
         self.file_path = file_path
 
+    def _load(self) -> dict|None:
+        """
+        Load the parsed YAML document, reusing the cached copy if the file is unchanged since it was last parsed.
+        The returned document is shared with the cache and must not be mutated.
+
+        Returns:
+            dict|None: The parsed document, or None if the file is empty.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        with open(self.file_path, 'r') as file:
+            file_stat = os.fstat(file.fileno())
+            cached = _DOCUMENT_CACHE.get(os.path.abspath(self.file_path))
+            if cached is not None and cached[:3] == (file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size):
+                return cached[3]
+        # only take the shared lock when we actually have to parse, cache hits stay lock free
+        with file_lock(self.file_path):
+            return self._parse()
+
+    def _parse(self) -> dict|None:
+        """
+        Parse the YAML file, bypassing the cache, and store the result in the cache. Callers hold a lock on the file.
+
+        Returns:
+            dict|None: The parsed document, or None if the file is empty.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        with open(self.file_path, 'r') as file:
+            file_stat = os.fstat(file.fileno())
+            data = yaml.load(file, Loader=_SafeLoader) or None
+        _DOCUMENT_CACHE[os.path.abspath(self.file_path)] = (file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size, data)
+        return data
+
+    def _read_locked(self) -> dict|None:
+        """
+        Read a mutable copy of the YAML file for a read-modify-write under the exclusive lock.
+        The file is always parsed again, so another process's write is never missed through a stale cache entry.
+
+        Returns:
+            dict|None: The data read from the YAML file, or None if the file does not exist.
+        """
+        try:
+            return copy.deepcopy(self._parse())
+        except FileNotFoundError:
+            return None
+
+    def _invalidate(self) -> None:
+        """
+        Drop the cached document for this file. Called after every write so a rewrite within the
+        filesystem's timestamp granularity is never served stale.
+        """
+        _DOCUMENT_CACHE.pop(os.path.abspath(self.file_path), None)
+
+    def _write(self, data: dict) -> None:
+        """
+        Atomically replace the YAML file with the given data. The document is dumped to a temp file in the
+        same directory, fsynced and renamed over the original, so readers never see a half-written file.
+
+        Args:
+            data (dict): The full document to write.
+        """
+        file_dir = os.path.dirname(os.path.abspath(self.file_path))
+        fd, tmp_path = tempfile.mkstemp(dir=file_dir, prefix=f".{os.path.basename(self.file_path)}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as file:
+                yaml.dump(data, file, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
+                file.flush()
+                os.fsync(file.fileno())
+            if os.path.exists(self.file_path):
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(self.file_path).st_mode)) #mkstemp creates 0o600, keep the original mode
+            os.replace(tmp_path, self.file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        finally:
+            self._invalidate()
+
+    @contextmanager
+    def edit(self) -> Iterator[OrderedDict]:
+        """
+        Open an editing session on the YAML file. All mutations made to the yielded document are written back
+        in a single atomic write when the block exits. If the block raises, nothing is written.
+        An exclusive file lock is held for the whole session so concurrent sfy processes can't lose updates.
+
+        Example:
+            with parser.edit() as doc:
+                doc["vps_configs"]["linode_id"] = 123
+                doc.pop("coolify_configs", None)
+
+        Yields:
+            OrderedDict: A mutable copy of the current document (empty if the file is empty or missing).
+        """
+        with file_lock(self.file_path, exclusive=True):
+            data = OrderedDict(self._read_locked() or OrderedDict())
+            yield data
+            self._write(data)
+
     def read(self) -> dict|None:
         """
         Read the contents of the YAML file. 
@@ -27,8 +146,7 @@ class YAMLParser:
             dict|None: The data read from the YAML file as a dictionary, or None if the file does not exist.
         """
         try:
-            with open(self.file_path, 'r') as file:
-                return yaml.safe_load(file) or None
+            return copy.deepcopy(self._load())
         except FileNotFoundError:
             return None
         
@@ -43,7 +161,10 @@ class YAMLParser:
         Returns:
             dict|str|None: The value corresponding to the key, or None if the key does not exist.
         """
-        data = self.read()
+        try:
+            data = self._load()
+        except FileNotFoundError:
+            return None
         if data is None:
             return None
 
@@ -57,7 +178,8 @@ class YAMLParser:
                 return None
             current = current[part]
 
-        return current
+        # copy so callers can't mutate the cached document
+        return copy.deepcopy(current)
 
     def append(self, data: dict) -> bool:
         """
@@ -70,17 +192,17 @@ class YAMLParser:
             bool: True if the data was successfully appended, False otherwise.
         """
         try:
-            current_data = self.read() or OrderedDict()
+            with file_lock(self.file_path, exclusive=True):
+                current_data = self._read_locked() or OrderedDict()
 
-            # Convert current_data to OrderedDict to maintain order
-            current_data = OrderedDict(current_data)
-            # Merge the new data with the existing data
-            for key, val in data.items():
-                current_data[key] = val
+                # Convert current_data to OrderedDict to maintain order
+                current_data = OrderedDict(current_data)
+                # Merge the new data with the existing data
+                for key, val in data.items():
+                    current_data[key] = val
 
-            with open(self.file_path, 'w') as file:
-                yaml.safe_dump(current_data, file, default_flow_style=False, sort_keys=False)
-            return True
+                self._write(current_data)
+                return True
         except Exception as e:
             print(f"Error appending data to {os.path.basename(self.file_path)}: {e}")
             return False
@@ -97,25 +219,25 @@ class YAMLParser:
             bool: True if the data was successfully appended, False otherwise.
         """
         try:
-            current_data = self.read() or OrderedDict()
+            with file_lock(self.file_path, exclusive=True):
+                current_data = self._read_locked() or OrderedDict()
 
-            # Handle dot notation key
-            key_parts = key.split('.')
-            current = current_data
+                # Handle dot notation key
+                key_parts = key.split('.')
+                current = current_data
 
-            for part in key_parts[:-1]:
-                if part not in current or not isinstance(current[part], dict):
-                    current[part] = OrderedDict()
-                current = current[part]
+                for part in key_parts[:-1]:
+                    if part not in current or not isinstance(current[part], dict):
+                        current[part] = OrderedDict()
+                    current = current[part]
 
-            if isinstance(value, list):
-                current[key_parts[-1]] = current.get(key_parts[-1], []) + value
-            else:
-                current[key_parts[-1]] = value
+                if isinstance(value, list):
+                    current[key_parts[-1]] = current.get(key_parts[-1], []) + value
+                else:
+                    current[key_parts[-1]] = value
 
-            with open(self.file_path, 'w') as file:
-                yaml.safe_dump(current_data, file, default_flow_style=False, sort_keys=False)
-            return True
+                self._write(current_data)
+                return True
         except Exception as e:
             print(f"Error appending nested data to {os.path.basename(self.file_path)}: {e}")
             return False
@@ -132,40 +254,40 @@ class YAMLParser:
             bool: True if the key was successfully removed, False otherwise.
         """
         try:
-            data = self.read()
-            if data is None:
-                print(f"Error: {os.path.basename(self.file_path)} is empty.")
-                return False
-
-            # Handle nested keys
-            key_parts = key.split('.')
-            current = data
-            parent = None
-            final_key = key_parts[-1]
-
-            # Navigate through the nested structure
-            for i, part in enumerate(key_parts[:-1]):
-                if part not in current:
-                    print(f"Error: Key path '{'.'.join(key_parts[:i+1])}' not found in {os.path.basename(self.file_path)}.")
+            with file_lock(self.file_path, exclusive=True):
+                data = self._read_locked()
+                if data is None:
+                    print(f"Error: {os.path.basename(self.file_path)} is empty.")
+                    return False
+
+                # Handle nested keys
+                key_parts = key.split('.')
+                current = data
+                parent = None
+                final_key = key_parts[-1]
+
+                # Navigate through the nested structure
+                for i, part in enumerate(key_parts[:-1]):
+                    if part not in current:
+                        print(f"Error: Key path '{'.'.join(key_parts[:i+1])}' not found in {os.path.basename(self.file_path)}.")
+                        return False
+                    parent = current
+                    current = current[part]
+
+                # Check if the final key exists in the current level
+                if final_key not in current:
+                    print(f"Error: Key '{key}' not found in {os.path.basename(self.file_path)}.")
                     return False
-                parent = current
-                current = current[part]
-
-            # Check if the final key exists in the current level
-            if final_key not in current:
-                print(f"Error: Key '{key}' not found in {os.path.basename(self.file_path)}.")
-                return False
-
-            # Remove the key
-            if parent is None:
-                del data[final_key]
-            else:
-                del current[final_key]
-
-            # Save the modified data
-            with open(self.file_path, 'w') as file:
-                yaml.safe_dump(data, file, default_flow_style=False)
-            return True
+
+                # Remove the key
+                if parent is None:
+                    del data[final_key]
+                else:
+                    del current[final_key]
+
+                # Save the modified data
+                self._write(data)
+                return True
         except Exception as e:
             print(f"Error removing key '{key}' from {os.path.basename(self.file_path)}: {e}")
             return False
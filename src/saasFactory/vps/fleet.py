@@ -0,0 +1,106 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from tabulate import tabulate
+from saasFactory.vps.ssh import SSHConnection
+from saasFactory.utils.yaml import YAMLParser
+from saasFactory.utils.enums import Emojis, FleetKeys
+from saasFactory.utils.globals import DEFAULT_LINODE_USERNAME, DEFAULT_FLEET_PARALLELISM
+
+
+def load_fleet_hosts(hosts: list[str]|None = None, manifest_path: str|None = None) -> list[dict]:
+    """
+    Builds the list of hosts to run on from `--hosts` arguments and/or a fleet manifest file.
+    A manifest is a YAML file with a `hosts` list, each entry either a host string or a mapping with
+    `host` and optional `name`, `username`, `port` and `key` (private key path).
+
+    Args:
+        hosts (list[str]|None): Host names or IP addresses.
+        manifest_path (str|None): Path to a fleet manifest file.
+
+    Returns:
+        list[dict]: One dictionary per host with FleetKeys keys filled in with defaults.
+    """
+    entries = list(hosts or [])
+    if manifest_path is not None:
+        entries += YAMLParser(manifest_path).get(FleetKeys.HOSTS_KEY.value) or []
+
+    fleet_hosts = []
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {FleetKeys.HOST_KEY.value: entry}
+        host = entry[FleetKeys.HOST_KEY.value]
+        fleet_hosts.append({
+            FleetKeys.HOST_KEY.value: host,
+            FleetKeys.NAME_KEY.value: entry.get(FleetKeys.NAME_KEY.value, host),
+            FleetKeys.USERNAME_KEY.value: entry.get(FleetKeys.USERNAME_KEY.value, DEFAULT_LINODE_USERNAME),
+            FleetKeys.PORT_KEY.value: entry.get(FleetKeys.PORT_KEY.value, 22),
+            FleetKeys.KEY_PATH_KEY.value: entry.get(FleetKeys.KEY_PATH_KEY.value),
+        })
+    return fleet_hosts
+
+
+def run_commands_on_host(host_config: dict, commands: list[str], pipelined: bool = False) -> list[str]:
+    """
+    Connects to one host and runs the commands in order, stopping at the first failure.
+    Every line printed for the host is prefixed with its name.
+
+    Args:
+        host_config (dict): A host dictionary from load_fleet_hosts.
+        commands (list[str]): The commands to run.
+        pipelined (bool): Run the commands as one uploaded script in a single channel (default is False).
+
+    Returns:
+        list[str]: A [host, result, seconds, details] summary row.
+    """
+    name = host_config[FleetKeys.NAME_KEY.value]
+    start = time.perf_counter()
+    ssh_con = SSHConnection(
+        host=host_config[FleetKeys.HOST_KEY.value],
+        port=host_config[FleetKeys.PORT_KEY.value],
+        username=host_config[FleetKeys.USERNAME_KEY.value],
+        private_key_path=host_config[FleetKeys.KEY_PATH_KEY.value],
+        log_prefix=f"[{name}] "
+    )
+    if not ssh_con.connect():
+        return [name, Emojis.ERROR_SIGN.value, f"{time.perf_counter() - start:.1f}", "SSH connection failed"]
+    try:
+        if pipelined:
+            result = ssh_con.execute_script(commands, logging=True)
+            if not result.ok:
+                failed_step = next((step for step in result.steps if step.exit_code != 0), None)
+                details = f"`{failed_step.command}` exited with status {failed_step.exit_code}" if failed_step is not None else f"script exited with status {result.exit_code}"
+                return [name, Emojis.ERROR_SIGN.value, f"{time.perf_counter() - start:.1f}", details]
+            return [name, Emojis.CHECK_MARK.value, f"{time.perf_counter() - start:.1f}", ", ".join(f"{step.seconds:.1f}s" for step in result.steps if step.seconds is not None)]
+        for command in commands:
+            result = ssh_con.execute_command(command, logging=True)
+            if not result.ok:
+                return [name, Emojis.ERROR_SIGN.value, f"{time.perf_counter() - start:.1f}", f"`{command}` exited with status {result.exit_code}"]
+    finally:
+        ssh_con.disconnect()
+    return [name, Emojis.CHECK_MARK.value, f"{time.perf_counter() - start:.1f}", ""]
+
+
+def run_commands_on_fleet(fleet_hosts: list[dict], commands: list[str], parallelism: int = DEFAULT_FLEET_PARALLELISM, pipelined: bool = False) -> bool:
+    """
+    Runs the commands on every host concurrently, at most `parallelism` hosts at a time, then prints a per host summary.
+
+    Args:
+        fleet_hosts (list[dict]): Hosts from load_fleet_hosts.
+        commands (list[str]): The commands to run on each host.
+        parallelism (int): Maximum number of hosts worked on at once.
+        pipelined (bool): Run the commands on each host as one uploaded script in a single channel (default is False).
+
+    Returns:
+        bool: True if the commands succeeded on every host, False otherwise.
+    """
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, parallelism)) as executor:
+        summary = list(executor.map(lambda host_config: run_commands_on_host(host_config, commands, pipelined), fleet_hosts))
+
+    print(f"\n{Emojis.DOCS.value} Fleet summary ({time.perf_counter() - start:.1f}s total):")
+    print(tabulate(summary, headers=["Host", "Result", "Duration (s)", "Details"], tablefmt="fancy_grid"))
+    failed = [row[0] for row in summary if row[1] != Emojis.CHECK_MARK.value]
+    if failed:
+        print(f"{Emojis.ERROR_SIGN.value} Failed on {len(failed)} of {len(summary)} hosts: {', '.join(failed)}")
+        return False
+    return True
@@ -0,0 +1,136 @@
+import os
+import queue
+import threading
+from cryptography.hazmat.primitives.asymmetric import ed25519
+from cryptography.hazmat.primitives.serialization import (
+    Encoding,
+    PrivateFormat,
+    PublicFormat,
+    NoEncryption,
+    BestAvailableEncryption
+)
+from paramiko import PKey, RSAKey, Ed25519Key, ECDSAKey
+from saasFactory.utils.enums import SSHKeyTypes
+from saasFactory.utils.globals import DEFAULT_SSH_KEY_TYPE, RSA_KEY_BITS, DEFAULT_SSH_KEY_POOL_SIZE
+
+
+def generate_private_key(key_type: str = DEFAULT_SSH_KEY_TYPE) -> ed25519.Ed25519PrivateKey|RSAKey:
+    """
+    Generate a new private key. ed25519 keys take well under a millisecond, RSA_KEY_BITS RSA keys can take seconds.
+
+    Args:
+        key_type (str): One of the SSHKeyTypes values (default is DEFAULT_SSH_KEY_TYPE).
+
+    Returns:
+        ed25519.Ed25519PrivateKey|RSAKey: The private key.
+    """
+    if key_type == SSHKeyTypes.ED25519.value:
+        return ed25519.Ed25519PrivateKey.generate()
+    if key_type == SSHKeyTypes.RSA.value:
+        return RSAKey.generate(bits=RSA_KEY_BITS)
+    raise ValueError(f"Unsupported SSH key type '{key_type}'.")
+
+
+def write_key_pair(private_key: ed25519.Ed25519PrivateKey|RSAKey, private_path: str, public_path: str, passphrase: str|None = None) -> str:
+    """
+    Write a key from generate_private_key to an OpenSSH private key file (mode 0o600) and a public key file.
+
+    Args:
+        private_key (ed25519.Ed25519PrivateKey|RSAKey): The private key.
+        private_path (str): Path of the private key file.
+        public_path (str): Path of the public key file.
+        passphrase (str|None): Optional passphrase to encrypt the private key with.
+
+    Returns:
+        str: The public key in `<type> <base64>` format, as accepted by Linode.
+    """
+    if isinstance(private_key, RSAKey):
+        private_key.write_private_key_file(private_path, password=passphrase)
+        public_key = f"{private_key.get_name()} {private_key.get_base64()}"
+    else:
+        encryption = BestAvailableEncryption(passphrase.encode()) if passphrase else NoEncryption()
+        private_bytes = private_key.private_bytes(encoding=Encoding.PEM, format=PrivateFormat.OpenSSH, encryption_algorithm=encryption)
+        fd = os.open(private_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as file:
+            file.write(private_bytes)
+        public_key = private_key.public_key().public_bytes(Encoding.OpenSSH, PublicFormat.OpenSSH).decode("utf-8")
+    os.chmod(private_path, 0o600)
+
+    with open(public_path, "w") as file:
+        file.write(public_key)
+    return public_key
+
+
+def load_private_key(private_path: str, password: str|None = None) -> PKey:
+    """
+    Load a private key file of any supported type (ed25519, ECDSA or RSA).
+
+    Args:
+        private_path (str): Path of the private key file.
+        password (str|None): Password of the key if it is encrypted.
+
+    Returns:
+        PKey: The paramiko key.
+
+    Raises:
+        ValueError: If the file is not a supported private key.
+    """
+    errors = []
+    for key_class in (Ed25519Key, ECDSAKey, RSAKey):
+        try:
+            return key_class.from_private_key_file(private_path, password=password)
+        except Exception as e:
+            errors.append(f"{key_class.__name__}: {e}")
+    raise ValueError(f"Unsupported or unreadable private key ({'; '.join(errors)})")
+
+
+class SSHKeyPool:
+    """
+    Pre-generates private keys in a background thread so provisioning many instances never waits on key generation.
+    Taking a key from an empty pool generates one on the spot.
+
+    Usage:
+        key_pool = SSHKeyPool(size=4)
+        provider = LinodeProvider(api_token, key_pool=key_pool)
+    """
+
+    def __init__(self, key_type: str = DEFAULT_SSH_KEY_TYPE, size: int = DEFAULT_SSH_KEY_POOL_SIZE) -> None:
+        """
+        Args:
+            key_type (str): One of the SSHKeyTypes values (default is DEFAULT_SSH_KEY_TYPE).
+            size (int): How many keys to keep ready (default is DEFAULT_SSH_KEY_POOL_SIZE).
+        """
+        self.key_type = key_type
+        self.keys = queue.Queue(maxsize=max(1, size))
+        self.closed = threading.Event()
+        self.filler = threading.Thread(target=self._fill, name="sfy-ssh-key-pool", daemon=True)
+        self.filler.start()
+
+    def _fill(self) -> None:
+        while not self.closed.is_set():
+            private_key = generate_private_key(self.key_type)
+            # block until there is room, waking up now and then to check if the pool was closed
+            while not self.closed.is_set():
+                try:
+                    self.keys.put(private_key, timeout=0.5)
+                    break
+                except queue.Full:
+                    continue
+
+    def get(self) -> ed25519.Ed25519PrivateKey|RSAKey:
+        """
+        Take a pre-generated key, or generate one if the pool is empty.
+
+        Returns:
+            ed25519.Ed25519PrivateKey|RSAKey: The private key.
+        """
+        try:
+            return self.keys.get_nowait()
+        except queue.Empty:
+            return generate_private_key(self.key_type)
+
+    def close(self) -> None:
+        """
+        Stop generating keys.
+        """
+        self.closed.set()
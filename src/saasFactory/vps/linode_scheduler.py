@@ -0,0 +1,167 @@
+import copy
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future
+from urllib import parse
+from linode_api4 import LinodeClient
+from linode_api4.errors import ApiError
+from saasFactory.utils.cache import get_cache_dir, hash_token
+from saasFactory.utils.lock import file_lock
+from saasFactory.utils.globals import (
+    LINODE_API_RATE_LIMIT,
+    LINODE_API_RATE_WINDOW,
+    LINODE_API_BURST,
+    LINODE_API_MAX_RETRIES,
+    LINODE_API_RETRY_STATUSES
+)
+
+
+class TokenBucket:
+    """
+    Token bucket shared by every sfy process of a user, so many processes together stay under the API rate limit.
+    The bucket state lives in a small file in the cache directory and is updated under an exclusive file lock.
+    """
+
+    def __init__(self, name: str, rate: float, capacity: float) -> None:
+        """
+        Args:
+            name (str): Name of the bucket state file.
+            rate (float): Tokens added per second.
+            capacity (float): Maximum number of tokens, i.e. the largest burst.
+        """
+        self.state_path = os.path.join(get_cache_dir(), f"{name}.json")
+        self.rate = rate
+        self.capacity = capacity
+
+    def _read(self) -> dict:
+        try:
+            with open(self.state_path, "r") as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"tokens": self.capacity, "updated": time.time(), "blocked_until": 0}
+
+    def _write(self, state: dict) -> None:
+        with open(self.state_path, "w") as file:
+            json.dump(state, file)
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until one is available and any Retry-After pause is over.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            with file_lock(self.state_path, exclusive=True):
+                state = self._read()
+                now = time.time()
+                state["tokens"] = min(self.capacity, state["tokens"] + (now - state["updated"]) * self.rate)
+                state["updated"] = now
+                blocked = state.get("blocked_until", 0) - now
+                if blocked <= 0 and state["tokens"] >= 1:
+                    state["tokens"] -= 1
+                    self._write(state)
+                    return waited
+                self._write(state)
+                delay = blocked if blocked > 0 else (1 - state["tokens"]) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """
+        Stop handing out tokens for `seconds`, e.g. after the API answered 429 with a Retry-After header.
+        """
+        with file_lock(self.state_path, exclusive=True):
+            state = self._read()
+            state["blocked_until"] = max(state.get("blocked_until", 0), time.time() + seconds)
+            state["tokens"] = 0
+            state["updated"] = time.time()
+            self._write(state)
+
+
+class ScheduledLinodeClient(LinodeClient):
+    """
+    LinodeClient that sends every API call through a rate limit aware scheduler:
+    - a TokenBucket sized to LINODE_API_RATE_LIMIT requests per LINODE_API_RATE_WINDOW seconds, shared across processes
+    - 429 responses pause the shared bucket for the Retry-After time and the request is retried
+    - identical GETs that are already in flight are sent once and their response shared
+    - `metrics` counts requests, coalesced GETs, retries and the seconds spent throttled
+    """
+
+    def __init__(self, token: str, **kwargs) -> None:
+        # retries are handled here so they go through the bucket, not by the session's urllib3 adapter
+        kwargs.setdefault("retry", False)
+        super().__init__(token, **kwargs)
+        self.rate_limiter = TokenBucket(f"linode_rate_{hash_token(token)}", LINODE_API_RATE_LIMIT / LINODE_API_RATE_WINDOW, LINODE_API_BURST)
+        self.in_flight = {}
+        self.in_flight_lock = threading.Lock()
+        self.metrics_lock = threading.Lock()
+        self.metrics = {"requests": 0, "coalesced": 0, "retries": 0, "throttled_seconds": 0.0}
+
+    def _count(self, metric: str, amount: float = 1) -> None:
+        with self.metrics_lock:
+            self.metrics[metric] += amount
+
+    def _api_call(self, endpoint, model=None, method=None, data=None, filters=None):
+        if method != self.session.get:
+            return self._scheduled_call(endpoint, model=model, method=method, data=data, filters=filters)
+
+        formatted_endpoint = endpoint.format(**{k: parse.quote(str(v)) for k, v in vars(model).items()}) if model else endpoint
+        key = (formatted_endpoint, json.dumps(filters, sort_keys=True, default=str))
+        with self.in_flight_lock:
+            pending = self.in_flight.get(key)
+            owner = pending is None
+            if owner:
+                pending = self.in_flight[key] = Future()
+        if not owner:
+            self._count("coalesced")
+            return copy.deepcopy(pending.result())
+
+        try:
+            result = self._scheduled_call(endpoint, model=model, method=method, data=data, filters=filters)
+            pending.set_result(result)
+            return copy.deepcopy(result)
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with self.in_flight_lock:
+                self.in_flight.pop(key, None)
+
+    def _scheduled_call(self, endpoint, model=None, method=None, data=None, filters=None):
+        for attempt in range(LINODE_API_MAX_RETRIES + 1):
+            self._count("throttled_seconds", self.rate_limiter.acquire())
+            self._count("requests")
+            try:
+                return super()._api_call(endpoint, model=model, method=method, data=data, filters=filters)
+            except ApiError as e:
+                # only rate limited requests are known not to have been processed, other errors are only retried for reads
+                retryable = e.status == 429 or (e.status in LINODE_API_RETRY_STATUSES and method == self.session.get)
+                if not retryable or attempt == LINODE_API_MAX_RETRIES:
+                    raise
+                self._count("retries")
+                retry_after = _retry_after_seconds(e)
+                if e.status == 429:
+                    self.rate_limiter.pause(retry_after if retry_after is not None else 2 ** attempt)
+                else:
+                    time.sleep(retry_after if retry_after is not None else 2 ** attempt)
+
+    def metrics_summary(self) -> str:
+        """
+        Returns:
+            str: A one line summary of the API calls made through this client.
+        """
+        return f"{self.metrics['requests']} requests, {self.metrics['coalesced']} coalesced, {self.metrics['retries']} retried, {self.metrics['throttled_seconds']:.1f}s throttled"
+
+
+def _retry_after_seconds(error: ApiError) -> float|None:
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
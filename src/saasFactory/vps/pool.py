@@ -0,0 +1,367 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from linode_api4.errors import ApiError
+from linode_api4.objects import Instance
+from tabulate import tabulate
+from saasFactory.vps.provider import LinodeProvider
+from saasFactory.vps.keys import write_key_pair
+from saasFactory.utils.cache import get_cache_dir, hash_token
+from saasFactory.utils.lock import file_lock
+from saasFactory.utils.yaml import YAMLParser
+from saasFactory.utils.enums import Emojis, VPSKeys, PoolKeys
+from saasFactory.utils.globals import (
+    CONFIG_FILE_NAME,
+    SSH_KEY_DIR_NAME,
+    SSH_KEY_FILE_NAME,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_POOL_TTL,
+    DEFAULT_POOL_MAX_IDLE,
+    DEFAULT_PROVISION_PARALLELISM,
+    DEFAULT_READINESS_TIMEOUT,
+    DEFAULT_COOLIFY_BOOTSTRAP_TIMEOUT,
+    POOL_LABEL_PREFIX,
+    POOL_TAG,
+    POOL_KEY_DIR_NAME,
+    POOL_REFILL_LOG_FILE_NAME
+)
+
+
+def read_pool_settings(sf_config_parser: YAMLParser, **overrides) -> dict:
+    """
+    Read the warm pool settings from the `pool_configs` section of the CONFIG_FILE_NAME file, falling back to the defaults.
+
+    Args:
+        sf_config_parser (YAMLParser): Parser of the project's CONFIG_FILE_NAME file.
+        **overrides: PoolKeys values to use instead of the configured ones, e.g. from command line arguments. None values are ignored.
+
+    Returns:
+        dict: The size, ttl, max_idle and coolify settings.
+    """
+    pool_configs = sf_config_parser.get(PoolKeys.POOL_CONFIGS_KEY.value) or {}
+    settings = {
+        PoolKeys.SIZE_KEY.value: pool_configs.get(PoolKeys.SIZE_KEY.value, DEFAULT_POOL_SIZE),
+        PoolKeys.TTL_KEY.value: pool_configs.get(PoolKeys.TTL_KEY.value, DEFAULT_POOL_TTL),
+        PoolKeys.MAX_IDLE_KEY.value: pool_configs.get(PoolKeys.MAX_IDLE_KEY.value, DEFAULT_POOL_MAX_IDLE),
+        PoolKeys.COOLIFY_KEY.value: pool_configs.get(PoolKeys.COOLIFY_KEY.value, False),
+    }
+    settings.update({key: value for key, value in overrides.items() if value is not None})
+    return settings
+
+
+def start_background_refill(project_root: str) -> None:
+    """
+    Run `sfy pool refill` for the project in a detached process, logging to POOL_REFILL_LOG_FILE_NAME in the cache directory.
+    """
+    log_path = os.path.join(get_cache_dir(), POOL_REFILL_LOG_FILE_NAME)
+    with open(log_path, "a") as log_file:
+        subprocess.Popen(
+            [sys.executable, "-m", "saasFactory.main", "pool", "refill"],
+            cwd=project_root,
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            start_new_session=True
+        )
+    print(f"{Emojis.LOADING.value} Refilling the warm pool in the background (log: {log_path}).")
+
+
+class WarmPool:
+    """
+    Pool of pre-provisioned Linode instances that `vps up` can claim instead of creating one.
+    Pooled instances are labelled with POOL_LABEL_PREFIX and tagged with POOL_TAG, and optionally have Coolify installed.
+    The pool is shared by every project using the same API token: its state (which instances are ready, and since when)
+    lives in the cache directory and is updated under an exclusive file lock, and the SSH keys of pooled instances are kept
+    in the POOL_KEY_DIR_NAME folder of the cache directory until an instance is claimed.
+
+    Usage:
+        pool = WarmPool(linVPS, **read_pool_settings(sf_config_parser))
+        pool.refill(linode_configs)
+        claimed = pool.claim(project_root)
+    """
+
+    def __init__(self, provider: LinodeProvider, size: int = DEFAULT_POOL_SIZE, ttl: float = DEFAULT_POOL_TTL, max_idle: float = DEFAULT_POOL_MAX_IDLE, coolify: bool = False) -> None:
+        """
+        Args:
+            provider (LinodeProvider): Provider used for the API calls.
+            size (int): Number of ready instances to keep (default is DEFAULT_POOL_SIZE).
+            ttl (float): Seconds after which an unclaimed instance is deleted and replaced (default is DEFAULT_POOL_TTL).
+            max_idle (float): Seconds without claims after which scheduled refills empty the pool instead of topping it up (default is DEFAULT_POOL_MAX_IDLE).
+            coolify (bool): Install Coolify on new pooled instances (default is False).
+        """
+        self.provider = provider
+        self.size = size
+        self.ttl = ttl
+        self.max_idle = max_idle
+        self.coolify = coolify
+        self.state_path = os.path.join(get_cache_dir(), f"warm_pool_{hash_token(provider.api_token)}.json")
+        self.key_dir = os.path.join(get_cache_dir(), POOL_KEY_DIR_NAME)
+
+    def _read(self) -> dict:
+        try:
+            with open(self.state_path, "r") as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"instances": {}, "last_activity": time.time()}
+
+    def _write(self, state: dict) -> None:
+        with open(self.state_path, "w") as file:
+            json.dump(state, file, indent=2)
+
+    def _key_path(self, label: str) -> str:
+        return os.path.join(self.key_dir, label)
+
+    def _remove_keys(self, label: str) -> None:
+        for path in (self._key_path(label), f"{self._key_path(label)}.pub"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _instance_exists(self, instance_id: int) -> bool:
+        """
+        Returns:
+            bool: False if the API says the instance is gone, True otherwise (also when the API could not be asked).
+        """
+        try:
+            self.provider.linode_client.load(Instance, instance_id)
+        except ApiError as e:
+            if e.status == 404:
+                return False
+            self.provider.forget_token_validation(e)
+        except Exception:
+            pass
+        return True
+
+    def _delete_instance(self, instance_id: int, label: str) -> None:
+        try:
+            self.provider.linode_client.load(Instance, instance_id).delete()
+        except Exception as e:
+            self.provider.forget_token_validation(e)
+            print(f"{Emojis.WARNING_SIGN.value} Error deleting pooled instance {label}. Error: {e}")
+        self._remove_keys(label)
+
+    def entries(self) -> dict:
+        """
+        Returns:
+            dict: The ready pooled instances by ID, each with its label, public_ip, region, type, image, coolify flag and created time.
+        """
+        with file_lock(self.state_path):
+            return self._read()["instances"]
+
+    def refill(self, linode_configs: dict, scheduled: bool = False, parallelism: int = DEFAULT_PROVISION_PARALLELISM) -> list[list]|None:
+        """
+        Top the pool back up to `size` ready instances created from the project's vps_configs.
+        Drops pooled instances that no longer exist, deletes the ones older than `ttl`, then creates the missing ones concurrently.
+        An instance joins the pool only once it is ready (SSH, or the Coolify port with `coolify`), so claims never wait.
+        Only one refill runs at a time per pool.
+
+        Args:
+            linode_configs (dict): The vps_configs section of the CONFIG_FILE_NAME file (image, region, type).
+            scheduled (bool): Called periodically rather than by a user or a claim: if nothing was claimed for `max_idle`, empty the pool instead (default is False).
+            parallelism (int): Maximum number of instances created at once (default is DEFAULT_PROVISION_PARALLELISM).
+
+        Returns:
+            list[list]|None: A [label, linode_id, public_ip, result, seconds] row per created instance, or None if the pool could not be listed.
+        """
+        with file_lock(f"{self.state_path}.refill", exclusive=True):
+            listed = self.provider.list_sfy_instances()
+            if listed is None:
+                return None
+            listed_ids = {instance[VPSKeys.LINODE_ID_KEY.value] for instance in listed if instance[VPSKeys.LINODE_LABEL_KEY.value].startswith(POOL_LABEL_PREFIX)}
+
+            now = time.time()
+            with file_lock(self.state_path, exclusive=True):
+                state = self._read()
+                if not scheduled:
+                    state["last_activity"] = now
+                # a claim that was interrupted before it finished relabelling leaves its instance in "claiming",
+                # forget it after a grace period so the instance is deleted below as an orphan if it still has the pool label
+                claiming = state.setdefault("claiming", {})
+                for instance_id in [instance_id for instance_id, started in claiming.items() if now - started > DEFAULT_READINESS_TIMEOUT]:
+                    claiming.pop(instance_id)
+                expired = {instance_id: entry for instance_id, entry in state["instances"].items()
+                           if int(instance_id) not in listed_ids or now - entry["created"] > self.ttl}
+                idle = scheduled and now - state["last_activity"] > self.max_idle
+                if idle:
+                    expired = dict(state["instances"])
+                for instance_id in expired:
+                    state["instances"].pop(instance_id)
+                self._write(state)
+            # pooled instances the state does not know about were left behind by an interrupted refill
+            known_ids = {int(instance_id) for instance_id in list(state["instances"]) + list(expired) + list(state["claiming"])}
+            orphans = [instance for instance in listed if instance[VPSKeys.LINODE_ID_KEY.value] in listed_ids - known_ids]
+
+            for instance_id, entry in expired.items():
+                if int(instance_id) in listed_ids:
+                    print(f"{Emojis.BOMB.value} Deleting pooled instance {entry[VPSKeys.LINODE_LABEL_KEY.value]} ({'pool idle' if idle else 'expired'}).")
+                    self._delete_instance(int(instance_id), entry[VPSKeys.LINODE_LABEL_KEY.value])
+                else:
+                    self._remove_keys(entry[VPSKeys.LINODE_LABEL_KEY.value])
+            for instance in orphans:
+                print(f"{Emojis.BOMB.value} Deleting orphaned pooled instance {instance[VPSKeys.LINODE_LABEL_KEY.value]}.")
+                self._delete_instance(instance[VPSKeys.LINODE_ID_KEY.value], instance[VPSKeys.LINODE_LABEL_KEY.value])
+            if idle:
+                print(f"{Emojis.STOP_SIGN.value} Nothing was claimed for {self.max_idle:.0f}s, the warm pool was emptied. Run `sfy pool refill` to fill it again.")
+                return []
+
+            needed = self.size - len(state["instances"])
+            if needed <= 0:
+                print(f"{Emojis.CHECK_MARK.value} The warm pool already has {len(state['instances'])} ready instances.")
+                return []
+            print(f"{Emojis.ROCKET.value} Adding {needed} instances to the warm pool, {min(needed, parallelism)} at a time.")
+            with ThreadPoolExecutor(max_workers=max(1, min(needed, parallelism))) as executor:
+                rows = list(executor.map(lambda _: self._add_instance(linode_configs), range(needed)))
+            print(tabulate(rows, headers=["Label", "ID", "Public IP", "Ready", "Time (s)"], tablefmt="fancy_grid"))
+            print(f"Linode API: {self.provider.linode_client.metrics_summary()}")
+            return rows
+
+    def _add_instance(self, linode_configs: dict) -> list:
+        start = time.perf_counter()
+        label = f"{POOL_LABEL_PREFIX}{uuid.uuid4().hex[:8]}"
+        image = linode_configs.get(VPSKeys.LINODE_GOLDEN_IMAGE_KEY.value) if self.coolify else None
+        bootstrap_coolify = self.coolify and image is None
+        image = image or linode_configs[VPSKeys.LINODE_IMAGE_KEY.value]
+        os.makedirs(self.key_dir, mode=0o700, exist_ok=True)
+        try:
+            ssh_public_key = write_key_pair(self.provider.new_private_key(), self._key_path(label), f"{self._key_path(label)}.pub")
+            # no root password: the instance is only used through its SSH key
+            new_linode, _ = self.provider.linode_client.linode.instance_create(
+                ltype=linode_configs[VPSKeys.LINODE_TYPE_KEY.value],
+                region=linode_configs[VPSKeys.LINODE_REGION_KEY.value],
+                image=image,
+                label=label,
+                authorized_keys=[ssh_public_key],
+                tags=[POOL_TAG],
+                **self.provider.bootstrap_kwargs(bootstrap_coolify)
+            )
+        except Exception as e:
+            self.provider.forget_token_validation(e)
+            self._remove_keys(label)
+            return [label, "-", "-", f"{Emojis.ERROR_SIGN.value} {e}", f"{time.perf_counter() - start:.1f}"]
+
+        public_ip = new_linode.ipv4[0]
+        ready = self.provider.wait_for_instance(
+            new_linode.id,
+            public_ip,
+            private_key_path=self._key_path(label),
+            timeout=DEFAULT_COOLIFY_BOOTSTRAP_TIMEOUT if bootstrap_coolify else DEFAULT_READINESS_TIMEOUT,
+            log=False,
+            wait_for_coolify=self.coolify
+        )
+        if ready is None:
+            self._delete_instance(new_linode.id, label)
+            return [label, new_linode.id, public_ip, f"{Emojis.ERROR_SIGN.value} not ready, deleted", f"{time.perf_counter() - start:.1f}"]
+
+        with file_lock(self.state_path, exclusive=True):
+            state = self._read()
+            state["instances"][str(new_linode.id)] = {
+                VPSKeys.LINODE_LABEL_KEY.value: label,
+                VPSKeys.LINODE_PUBLIC_IP_KEY.value: public_ip,
+                VPSKeys.LINODE_REGION_KEY.value: linode_configs[VPSKeys.LINODE_REGION_KEY.value],
+                VPSKeys.LINODE_TYPE_KEY.value: linode_configs[VPSKeys.LINODE_TYPE_KEY.value],
+                VPSKeys.LINODE_IMAGE_KEY.value: image,
+                PoolKeys.COOLIFY_KEY.value: self.coolify,
+                "created": time.time()
+            }
+            self._write(state)
+        return [label, new_linode.id, public_ip, Emojis.CHECK_MARK.value, f"{time.perf_counter() - start:.1f}"]
+
+    def claim(self, project_root: str, require_coolify: bool = False) -> dict|None:
+        """
+        Take a ready pooled instance that matches the project's vps_configs and make it the project's instance:
+        it gets the project's label, loses POOL_TAG, its key pair becomes SSH_KEY_DIR_NAME/SSH_KEY_FILE_NAME and its
+        linode_id and public_ip are written to the project's vps_configs.
+        Nothing is claimed while the project's recorded instance still exists, so its key and ID are never overwritten.
+
+        Args:
+            project_root (str): The project root directory.
+            require_coolify (bool): Only claim an instance with Coolify installed (default is False).
+
+        Returns:
+            dict|None: The claimed pool entry with its linode_id, or None if no matching instance was ready or the project already has one.
+        """
+        sf_config_parser = YAMLParser(os.path.join(project_root, CONFIG_FILE_NAME))
+        linode_configs = sf_config_parser.get(VPSKeys.VPS_CONFIGS_KEY.value)
+        if not isinstance(linode_configs, dict) or linode_configs.get(VPSKeys.LINODE_LABEL_KEY.value) is None:
+            return None
+        recorded_id = linode_configs.get(VPSKeys.LINODE_ID_KEY.value)
+        if recorded_id is not None and self._instance_exists(recorded_id):
+            print(f"{Emojis.WARNING_SIGN.value} The project already has Linode instance {recorded_id}, not claiming a warm pool instance.")
+            return None
+        images = {linode_configs.get(VPSKeys.LINODE_IMAGE_KEY.value), linode_configs.get(VPSKeys.LINODE_GOLDEN_IMAGE_KEY.value)}
+
+        def matches(entry: dict) -> bool:
+            return (entry[VPSKeys.LINODE_REGION_KEY.value] == linode_configs.get(VPSKeys.LINODE_REGION_KEY.value)
+                    and entry[VPSKeys.LINODE_TYPE_KEY.value] == linode_configs.get(VPSKeys.LINODE_TYPE_KEY.value)
+                    and entry[VPSKeys.LINODE_IMAGE_KEY.value] in images
+                    and (entry[PoolKeys.COOLIFY_KEY.value] or not require_coolify)
+                    and time.time() - entry["created"] <= self.ttl)
+
+        while True:
+            # take the oldest matching instance out of the pool so no other process can claim it
+            with file_lock(self.state_path, exclusive=True):
+                state = self._read()
+                candidates = sorted((entry["created"], instance_id) for instance_id, entry in state["instances"].items() if matches(entry))
+                if not candidates:
+                    return None
+                instance_id = candidates[0][1]
+                entry = state["instances"].pop(instance_id)
+                state["last_activity"] = time.time()
+                # keeps a refill from taking the instance for an orphan while it is being relabelled
+                state.setdefault("claiming", {})[instance_id] = time.time()
+                self._write(state)
+
+            label = entry[VPSKeys.LINODE_LABEL_KEY.value]
+            try:
+                instance = self.provider.linode_client.load(Instance, int(instance_id))
+                instance.label = linode_configs[VPSKeys.LINODE_LABEL_KEY.value]
+                instance.tags = [tag for tag in instance.tags if tag != POOL_TAG]
+                instance.save()
+                claimed = True
+            except Exception as e:
+                self.provider.forget_token_validation(e)
+                print(f"{Emojis.WARNING_SIGN.value} Could not claim pooled instance {label}, trying the next one. Error: {e}")
+                self._delete_instance(int(instance_id), label)
+                claimed = False
+            with file_lock(self.state_path, exclusive=True):
+                state = self._read()
+                state.get("claiming", {}).pop(instance_id, None)
+                self._write(state)
+            if claimed:
+                break
+
+        key_dir = os.path.join(project_root, SSH_KEY_DIR_NAME)
+        os.makedirs(key_dir, mode=0o700, exist_ok=True)
+        shutil.move(self._key_path(label), os.path.join(key_dir, SSH_KEY_FILE_NAME))
+        shutil.move(f"{self._key_path(label)}.pub", os.path.join(key_dir, f"{SSH_KEY_FILE_NAME}.pub"))
+        try:
+            with sf_config_parser.edit() as sf_config:
+                sf_config[VPSKeys.VPS_CONFIGS_KEY.value][VPSKeys.LINODE_ID_KEY.value] = int(instance_id)
+                sf_config[VPSKeys.VPS_CONFIGS_KEY.value][VPSKeys.LINODE_PUBLIC_IP_KEY.value] = entry[VPSKeys.LINODE_PUBLIC_IP_KEY.value]
+        except Exception as e:
+            print(f"{Emojis.ERROR_SIGN.value} Error adding Linode ID to {CONFIG_FILE_NAME} file. Error: {e}")
+            print(f"Please add the following config to the {CONFIG_FILE_NAME} file manually:")
+            print(f"    '{VPSKeys.LINODE_ID_KEY.value}: {instance_id}'")
+            return None
+        return {**entry, VPSKeys.LINODE_ID_KEY.value: int(instance_id)}
+
+    def drain(self) -> int:
+        """
+        Delete every pooled instance.
+
+        Returns:
+            int: The number of deleted instances.
+        """
+        with file_lock(f"{self.state_path}.refill", exclusive=True):
+            with file_lock(self.state_path, exclusive=True):
+                state = self._read()
+                drained = state["instances"]
+                state["instances"] = {}
+                self._write(state)
+            for instance_id, entry in drained.items():
+                self._delete_instance(int(instance_id), entry[VPSKeys.LINODE_LABEL_KEY.value])
+        return len(drained)
@@ -1,21 +1,40 @@
 from typing import Optional
 from dotenv import load_dotenv
 from getpass import getpass
-from linode_api4 import LinodeClient
+from linode_api4.errors import ApiError
 from linode_api4.objects import Image, Instance
 from linode_api4.paginated_list import PaginatedList
+from cryptography.hazmat.primitives.asymmetric import ed25519
 from paramiko import RSAKey
 import os
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from tabulate import tabulate
-from saasFactory.utils.yaml import YAMLParser, list_to_dot_notation
-from saasFactory.utils.enums import Emojis, LinodeStatus, VPSKeys, EnvVarNames, CoolifyKeys
+from saasFactory.utils.yaml import YAMLParser
+from saasFactory.utils.cache import DiskCache, hash_token
+from saasFactory.utils.enums import Emojis, LinodeStatus, LinodeImageStatus, VPSKeys, EnvVarNames, CoolifyKeys, LinodeCatalogKeys, ReadinessPhases
 from saasFactory.utils.globals import (
     SSH_KEY_DIR_NAME, 
     CONFIG_FILE_NAME,  
     SSH_KEY_FILE_NAME,
-    LINODE_INSTANCE_PREFIX
+    LINODE_INSTANCE_PREFIX,
+    DEFAULT_SSH_KEY_TYPE,
+    DEFAULT_LINODE_CATALOG_TTL,
+    DEFAULT_TOKEN_VALIDATION_TTL,
+    DEFAULT_READINESS_TIMEOUT,
+    DEFAULT_LINODE_USERNAME,
+    DEFAULT_PROVISION_PARALLELISM,
+    DEFAULT_COOLIFY_PORT,
+    COOLIFY_INSTALL_COMMANDS,
+    BOOTSTRAP_LOG_PATH,
+    DEFAULT_IMAGE_BAKE_TIMEOUT,
+    GOLDEN_IMAGE_LABEL_SUFFIX,
+    DEFAULT_SHUTDOWN_TIMEOUT
 )
+from saasFactory.vps.linode_scheduler import ScheduledLinodeClient
+from saasFactory.vps.keys import SSHKeyPool, generate_private_key, write_key_pair
+from saasFactory.vps.readiness import wait_until, port_is_open, ssh_handshake
 from saasFactory.utils.cli import (
     findProjectRoot, 
     addEnvVar, 
@@ -27,14 +46,63 @@ from saasFactory.utils.cli import (
 
 
 
+def build_bootstrap_user_data(commands: list[str]) -> str:
+    """
+    Build the cloud-init user data script that runs the commands at the instance's first boot, stopping at the first failure.
+    Output goes to BOOTSTRAP_LOG_PATH on the instance.
+
+    Args:
+        commands (list[str]): The commands to run, e.g. COOLIFY_INSTALL_COMMANDS.
+
+    Returns:
+        str: The user data script.
+    """
+    lines = [
+        "#!/bin/bash",
+        "set -e",
+        f"exec >> {BOOTSTRAP_LOG_PATH} 2>&1",
+        "export DEBIAN_FRONTEND=noninteractive",
+    ]
+    return "\n".join(lines + commands) + "\n"
+
+
+def readiness_phase_names(wait_for_coolify: bool = False) -> list[str]:
+    """
+    The ReadinessPhases LinodeProvider.wait_for_instance goes through, in order.
+    """
+    if wait_for_coolify:
+        return [ReadinessPhases.STATUS.value, ReadinessPhases.COOLIFY.value]
+    return [ReadinessPhases.STATUS.value, ReadinessPhases.TCP.value, ReadinessPhases.SSH.value]
+
+
+# validated API tokens for this process: token hash -> authenticated username
+_validated_tokens = {}
+
+
 #abstract VPS class
 class VPSProvider:
-    def __init__(self, api_token: str):
+    def __init__(self, api_token: str, key_type: str = DEFAULT_SSH_KEY_TYPE, key_pool: SSHKeyPool|None = None):
+        """
+        Args:
+            api_token (str): The provider API token.
+            key_type (str): Type of the SSH keys generated for instances, one of the SSHKeyTypes values (default is DEFAULT_SSH_KEY_TYPE).
+            key_pool (SSHKeyPool|None): Optional pool of pre-generated keys of the same type to take keys from.
+        """
         self.api_token = api_token
+        self.key_type = key_type
+        self.key_pool = key_pool if key_pool is not None and key_pool.key_type == key_type else None
+
+    def new_private_key(self) -> ed25519.Ed25519PrivateKey|RSAKey:
+        """
+        Returns:
+            ed25519.Ed25519PrivateKey|RSAKey: A private key of type `self.key_type`, taken from the key pool when there is one.
+        """
+        return self.key_pool.get() if self.key_pool is not None else generate_private_key(self.key_type)
 
     def generate_ssh_key_pair(self, key_name: str, passphrase: str = None) -> str|None:
         """
-        Generate an SSH key pair and return the public key in Linode-compatible format.
+        Generate an SSH key pair of type `self.key_type` and return the public key in Linode-compatible format.
+        Keys are taken from the key pool when there is one.
 
         Args:
             key_name (str): Name for the key pair files
@@ -53,21 +121,13 @@ class VPSProvider:
         if not os.path.exists(key_dir):
             os.makedirs(key_dir, mode=0o700) #mode 0o700: rwx for owner only
 
-        # Generate RSA key pair using paramiko
-        private_key = RSAKey.generate(bits=4096)
+        private_key = self.new_private_key()
 
         private_path = os.path.join(key_dir, f"{key_name}")
         public_path = os.path.join(key_dir, f"{key_name}.pub")
 
-        # Write private key to file
-        private_key.write_private_key_file(private_path, password=passphrase)
-        os.chmod(private_path, 0o600)
-
-        # Write public key to file
-        with open(public_path, 'w') as f:
-            f.write(f"{private_key.get_name()} {private_key.get_base64()}")
-
-        return f"{private_key.get_name()} {private_key.get_base64()}"
+        # Write private and public key files
+        return write_key_pair(private_key, private_path, public_path, passphrase=passphrase)
 
     
     
@@ -125,9 +185,9 @@ class VPSProvider:
 
 #Linode VPS provider class
 class LinodeProvider(VPSProvider):
-    def __init__(self, api_token: str):
-        super().__init__(api_token)
-        self.linode_client = LinodeClient(self.api_token)
+    def __init__(self, api_token: str, key_type: str = DEFAULT_SSH_KEY_TYPE, key_pool: SSHKeyPool|None = None):
+        super().__init__(api_token, key_type=key_type, key_pool=key_pool)
+        self.linode_client = ScheduledLinodeClient(self.api_token)
 
     def getLinodeImageOptions(self, image_vendor: str = "ubuntu") -> list[Image]:
         """
@@ -143,6 +203,7 @@ class LinodeProvider(VPSProvider):
             images = self.linode_client.images(Image.vendor == image_vendor)
             return images
         except Exception as e:
+            self.forget_token_validation(e)
             print(f"Error getting Linode image options: {e}")
             None
     
@@ -157,6 +218,7 @@ class LinodeProvider(VPSProvider):
             regions = self.linode_client.regions()
             return [region.id for region in regions]
         except Exception as e:
+            self.forget_token_validation(e)
             print(f"Error getting Linode region options: {e}")
             return None
 
@@ -171,20 +233,114 @@ class LinodeProvider(VPSProvider):
             plans = self.linode_client.linode.types()
             return plans
         except Exception as e:
+            self.forget_token_validation(e)
             print(f"Error getting Linode type options: {e}")
             return None
+
+    def get_catalog(self, image_vendor: str = "ubuntu", refresh: bool = False) -> dict|None:
+        """
+        Get the Linode catalog (images, regions and types) used to configure an instance.
+        The catalog is cached on disk for DEFAULT_LINODE_CATALOG_TTL seconds. When it is missing, expired or `refresh` is True
+        the three lists are fetched concurrently; if that fails an expired cached catalog is used instead.
+
+        Args:
+            image_vendor (str): The vendor of the images to list (default: "ubuntu").
+            refresh (bool): Fetch the catalog from the API even if the cached one is still fresh (default: False).
+
+        Returns:
+            dict|None: The catalog with LinodeCatalogKeys sections, or None if it could not be fetched or read from the cache.
+        """
+        catalog_cache = DiskCache("linode_catalog")
+        cache_key = f"{hash_token(self.api_token)}|{image_vendor}"
+        if not refresh:
+            catalog = catalog_cache.get(cache_key, DEFAULT_LINODE_CATALOG_TTL)
+            if catalog is not None:
+                return catalog
+
+        # paginated lists are iterated inside the worker threads so every page is fetched concurrently with the other lists
+        def fetch_images() -> list[dict]|None:
+            images = self.getLinodeImageOptions(image_vendor)
+            return None if images is None else [{"id": image.id, "label": image.label} for image in images]
+
+        def fetch_types() -> list[dict]|None:
+            types = self.getLinodeTypeOptions()
+            return None if types is None else [{
+                "id": type.id,
+                "label": type.label,
+                "vcpus": type.vcpus,
+                "memory": type.memory,
+                "disk": type.disk,
+                "price_hourly": type.price.hourly,
+                "price_monthly": type.price.monthly
+            } for type in types]
+
+        try:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                images = executor.submit(fetch_images)
+                regions = executor.submit(self.getLinodeRegionOptions)
+                types = executor.submit(fetch_types)
+                catalog = {
+                    LinodeCatalogKeys.IMAGES_KEY.value: images.result(),
+                    LinodeCatalogKeys.REGIONS_KEY.value: regions.result(),
+                    LinodeCatalogKeys.TYPES_KEY.value: types.result()
+                }
+        except Exception as e:
+            print(f"Error getting the Linode catalog: {e}")
+            catalog = None
+
+        if catalog is None or any(section is None for section in catalog.values()):
+            stale_catalog = catalog_cache.get(cache_key, float("inf"))
+            if stale_catalog is not None:
+                print(f"{Emojis.WARNING_SIGN.value} Could not refresh the Linode catalog, using the cached one.")
+            return stale_catalog
+        catalog_cache.set(cache_key, catalog)
+        return catalog
         
-    def test_token_client(self):
+    def test_token_client(self, force: bool = False) -> bool:
         """
         Test the Linode API token by using the client to get the user account information.
+        A successful validation is remembered per token hash, in this process and on disk for DEFAULT_TOKEN_VALIDATION_TTL seconds,
+        and is only repeated once it expires, after an API call fails with an auth error, or if `force` is True.
+
+        Args:
+            force (bool): Validate the token against the API even if it was validated recently (default: False).
+
+        Returns:
+            bool: True if the token is valid, False otherwise.
         """
+        token_hash = hash_token(self.api_token)
+        token_cache = DiskCache("linode_tokens")
+        if not force:
+            username = _validated_tokens.get(token_hash)
+            if username is None:
+                username = token_cache.get(token_hash, DEFAULT_TOKEN_VALIDATION_TTL)
+            if username is not None:
+                _validated_tokens[token_hash] = username
+                return True
         try:
             users = self.linode_client.account.users()
-            print(f"Linode API Token is valid {Emojis.CHECK_MARK.value}. Authenticated as: {''.join([user.username for user in users])}")
-            return True
+            username = ''.join([user.username for user in users])
+            print(f"Linode API Token is valid {Emojis.CHECK_MARK.value}. Authenticated as: {username}")
         except Exception as e:
             print(f"Error Validating Linode API Token. Client Error: {e}")
+            self.forget_token_validation()
             return False
+        _validated_tokens[token_hash] = username
+        token_cache.set(token_hash, username)
+        return True
+
+    def forget_token_validation(self, error: Exception|None = None) -> None:
+        """
+        Drop the remembered validation of the API token so the next test_token_client call checks it against the API again.
+
+        Args:
+            error (Exception|None): If given, the validation is only dropped if this is an authentication (401) error from the API.
+        """
+        if error is not None and not (isinstance(error, ApiError) and error.status == 401):
+            return
+        token_hash = hash_token(self.api_token)
+        _validated_tokens.pop(token_hash, None)
+        DiskCache("linode_tokens").invalidate(token_hash)
         
     def configure_instance(self, configsDict: Optional[dict] = None) -> bool:
         """
@@ -218,23 +374,23 @@ class LinodeProvider(VPSProvider):
                 return False
             return True
         else:
-            images = self.getLinodeImageOptions()
-            regions = self.getLinodeRegionOptions()
-            types = self.getLinodeTypeOptions()
+            catalog = self.get_catalog()
     
-            if images is None or regions is None or types is None:
+            if catalog is None:
                 print("Error requesting Linode configuration options.")
                 return False
-            
+            images = catalog[LinodeCatalogKeys.IMAGES_KEY.value]
+            regions = catalog[LinodeCatalogKeys.REGIONS_KEY.value]
+            types = catalog[LinodeCatalogKeys.TYPES_KEY.value]
     
-            image_choice_index = get_user_choice([image.label for image in images])
+            image_choice_index = get_user_choice([image["label"] for image in images])
             region_choice_index = get_user_choice(regions)
             type_format_headers = ["#", "vCPUs", "RAM (GiB)", "Disk (GiB)", "$/hr", "$/mo", "label"]
-            type_format_options = [[str(i), str(type.vcpus), str(mb_to_gb(type.memory)), str(mb_to_gb(type.disk)), str(type.price.hourly), str(type.price.monthly), type.label] for i, type in enumerate(types)]
+            type_format_options = [[str(i), str(type["vcpus"]), str(mb_to_gb(type["memory"])), str(mb_to_gb(type["disk"])), str(type["price_hourly"]), str(type["price_monthly"]), type["label"]] for i, type in enumerate(types)]
             type_choice_index = get_user_choice(type_format_options, use_table=True, table_headers=type_format_headers)
     
             print("Selected configurations:")
-            selected = [[VPSKeys.LINODE_IMAGE_KEY.value, images[image_choice_index].id], [VPSKeys.LINODE_REGION_KEY.value, regions[region_choice_index]], [VPSKeys.LINODE_TYPE_KEY.value, types[type_choice_index]]]
+            selected = [[VPSKeys.LINODE_IMAGE_KEY.value, images[image_choice_index]["id"]], [VPSKeys.LINODE_REGION_KEY.value, regions[region_choice_index]], [VPSKeys.LINODE_TYPE_KEY.value, types[type_choice_index]["id"]]]
             print(tabulate(selected, headers=["", "Selected"], tablefmt="fancy_grid"))
 
             project_name_config = sf_config_parser.get(VPSKeys.VPS_PROJECT_NAME_KEY.value) if isinstance(sf_config_parser.get(VPSKeys.VPS_PROJECT_NAME_KEY.value), str) else sf_config_parser.get(VPSKeys.VPS_PROJECT_NAME_KEY.value)[VPSKeys.VPS_PROJECT_NAME_KEY.value]
@@ -242,9 +398,9 @@ class LinodeProvider(VPSProvider):
             new_configs = {
                 VPSKeys.VPS_PROVIDER_KEY.value: "linode",
                 VPSKeys.VPS_CONFIGS_KEY.value: {
-                    VPSKeys.LINODE_IMAGE_KEY.value: images[image_choice_index].id,
+                    VPSKeys.LINODE_IMAGE_KEY.value: images[image_choice_index]["id"],
                     VPSKeys.LINODE_REGION_KEY.value: regions[region_choice_index],
-                    VPSKeys.LINODE_TYPE_KEY.value: types[type_choice_index].id,
+                    VPSKeys.LINODE_TYPE_KEY.value: types[type_choice_index]["id"],
                     VPSKeys.LINODE_LABEL_KEY.value: LINODE_INSTANCE_PREFIX + project_name_config
                 }
             }
@@ -253,9 +409,79 @@ class LinodeProvider(VPSProvider):
                 return False
             return True
         
-    def create_instance(self) -> None:
+    def read_create_settings(self, project_root: str, sf_config_parser: YAMLParser) -> tuple[dict, str]|None:
+        """
+        Read and check the Linode configurations and the root password needed to create instances.
+
+        Args:
+            project_root (str): The project root directory.
+            sf_config_parser (YAMLParser): Parser of the project's CONFIG_FILE_NAME file.
+
+        Returns:
+            tuple[dict, str]|None: The vps_configs section and the root password, or None if either is missing.
+        """
+        linode_configs = sf_config_parser.get(VPSKeys.VPS_CONFIGS_KEY.value) #change to optional key for read
+        print(f"Linode Configurations: {linode_configs}")
+        if linode_configs is None:
+            print(f"{Emojis.ERROR_SIGN.value} No Linode configurations found.")
+            return None
+
+        required_keys = [VPSKeys.LINODE_IMAGE_KEY.value, VPSKeys.LINODE_REGION_KEY.value, VPSKeys.LINODE_TYPE_KEY.value, VPSKeys.LINODE_LABEL_KEY.value]
+        if any(linode_configs.get(key) is None for key in required_keys):
+            print(f"{Emojis.ERROR_SIGN.value} Error reading Linode configurations.")
+            return None
+
+        # get root password from .env file
+        load_dotenv(os.path.join(project_root, ".env"))
+        root_pass = os.getenv(EnvVarNames.VPS_ROOT_PASSWORD_ENV_VAR.value)
+        if root_pass is None:
+            print(f"{Emojis.WARNING_SIGN.value} {EnvVarNames.VPS_ROOT_PASSWORD_ENV_VAR.value} not found in .env file. Please make sure it is set.")
+            return None
+        return linode_configs, root_pass
+
+    def bootstrap_kwargs(self, bootstrap_coolify: bool) -> dict:
+        """
+        Extra instance_create arguments that install Coolify at first boot through cloud-init user data (Linode Metadata service).
+        The image and region must support Metadata, e.g. the Ubuntu images in DEFAULT_LINODE_VPS_CONFIG.
+
+        Args:
+            bootstrap_coolify (bool): Whether to install Coolify at first boot.
+
+        Returns:
+            dict: The keyword arguments, empty if `bootstrap_coolify` is False.
+        """
+        if not bootstrap_coolify:
+            return {}
+        return {"metadata": self.linode_client.linode.build_instance_metadata(user_data=build_bootstrap_user_data(COOLIFY_INSTALL_COMMANDS))}
+
+    def resolve_image(self, linode_configs: dict, golden_image: bool) -> str|None:
+        """
+        The image new instances are created from: the configured image, or the Coolify image recorded by `vps bake`.
+
+        Args:
+            linode_configs (dict): The vps_configs section of the CONFIG_FILE_NAME file.
+            golden_image (bool): Use the image recorded under VPSKeys.LINODE_GOLDEN_IMAGE_KEY.
+
+        Returns:
+            str|None: The image ID, or None if `golden_image` is set but no image was baked yet.
+        """
+        if not golden_image:
+            return linode_configs.get(VPSKeys.LINODE_IMAGE_KEY.value)
+        image = linode_configs.get(VPSKeys.LINODE_GOLDEN_IMAGE_KEY.value)
+        if image is None:
+            print(f"{Emojis.ERROR_SIGN.value} No {VPSKeys.LINODE_GOLDEN_IMAGE_KEY.value} in {CONFIG_FILE_NAME}. Run `sfy vps bake` on an instance with Coolify installed first.")
+        return image
+
+    def create_instance(self, bootstrap_coolify: bool = False, golden_image: bool = False) -> Instance|None:
         """
         Create a Linode VPS instance with the configured parameters pulled from the CONFIG_FILE_NAME file.
+
+        Args:
+            bootstrap_coolify (bool): Install Coolify during the first boot with cloud-init instead of over SSH afterwards (default is False).
+            golden_image (bool): Create the instance from the Coolify image made by `vps bake`, so nothing needs to be installed (default is False).
+
+        Returns:
+            Instance|None: The new instance, or None if it could not be created and recorded in the config file.
         """
         project_root = findProjectRoot()
         if project_root is None:
@@ -267,27 +493,16 @@ class LinodeProvider(VPSProvider):
         config_file_path = os.path.join(project_root, CONFIG_FILE_NAME)
         sf_config_parser = YAMLParser(config_file_path)
 
-        linode_configs = sf_config_parser.get(VPSKeys.VPS_CONFIGS_KEY.value) #change to optional key for read
-        print(f"Linode Configurations: {linode_configs}")
-        if linode_configs is None:
-            print(f"{Emojis.ERROR_SIGN.value} No Linode configurations found.")
+        create_settings = self.read_create_settings(project_root, sf_config_parser)
+        if create_settings is None:
+            return
+        linode_configs, root_pass = create_settings
+        image = self.resolve_image(linode_configs, golden_image)
+        if image is None:
             return
-        
-        image = linode_configs.get(VPSKeys.LINODE_IMAGE_KEY.value)
         region = linode_configs.get(VPSKeys.LINODE_REGION_KEY.value)   
         instance_type = linode_configs.get(VPSKeys.LINODE_TYPE_KEY.value)
         instance_label = linode_configs.get(VPSKeys.LINODE_LABEL_KEY.value)
-
-        if image is None or region is None or instance_type is None or instance_label is None:
-            print(f"{Emojis.ERROR_SIGN.value} Error reading Linode configurations.")
-            return
-
-        # get root password from .env file
-        load_dotenv(os.path.join(project_root, ".env"))
-        root_pass = os.getenv(EnvVarNames.VPS_ROOT_PASSWORD_ENV_VAR.value)
-        if root_pass is None:
-            print(f"{Emojis.WARNING_SIGN.value} {EnvVarNames.VPS_ROOT_PASSWORD_ENV_VAR.value} not found in .env file. Please make sure it is set.")
-            return
         
         ssh_public_key = self.generate_ssh_key_pair(SSH_KEY_FILE_NAME)#, root_pass)
         if ssh_public_key is None:
@@ -295,32 +510,420 @@ class LinodeProvider(VPSProvider):
             return
 
 
-        new_linode = self.linode_client.linode.instance_create(
-            ltype=instance_type,
-            region=region,
-            image=image,
-            label=instance_label,
-            root_pass=root_pass,
-            authorized_keys=[ssh_public_key]
-        )
+        try:
+            new_linode = self.linode_client.linode.instance_create(
+                ltype=instance_type,
+                region=region,
+                image=image,
+                label=instance_label,
+                root_pass=root_pass,
+                authorized_keys=[ssh_public_key],
+                **self.bootstrap_kwargs(bootstrap_coolify)
+            )
+        except Exception as e:
+            self.forget_token_validation(e)
+            print(f"{Emojis.ERROR_SIGN.value} Error Creating Linode Instance. Error: {e}")
+            return
         print(f"{Emojis.STAR.value} Linode instance successfully created. Please wait a frew minutes for the intance to boot.")
         instance_details = [[VPSKeys.LINODE_LABEL_KEY.value, new_linode.label], [VPSKeys.LINODE_PUBLIC_IP_KEY.value, new_linode.ipv4[0]], [VPSKeys.LINODE_ID_KEY.value, new_linode.id]]
         print(tabulate(instance_details, headers=["", "Details"], tablefmt="fancy_grid"))
-        linode_configs = sf_config_parser.get(VPSKeys.VPS_CONFIGS_KEY.value)
-        if isinstance(linode_configs, dict):
-            linode_configs[VPSKeys.LINODE_ID_KEY.value] = new_linode.id
-            linode_configs[VPSKeys.LINODE_PUBLIC_IP_KEY.value] = new_linode.ipv4[0]
-            sf_config_parser.remove(VPSKeys.VPS_CONFIGS_KEY.value)
-        if( not sf_config_parser.append({VPSKeys.VPS_CONFIGS_KEY.value: linode_configs})):
-            print(f"{Emojis.ERROR_SIGN.value} Error adding Linode ID to {CONFIG_FILE_NAME} file.")
+        try:
+            with sf_config_parser.edit() as sf_config:
+                if not isinstance(sf_config.get(VPSKeys.VPS_CONFIGS_KEY.value), dict):
+                    sf_config[VPSKeys.VPS_CONFIGS_KEY.value] = linode_configs
+                sf_config[VPSKeys.VPS_CONFIGS_KEY.value][VPSKeys.LINODE_ID_KEY.value] = new_linode.id
+                sf_config[VPSKeys.VPS_CONFIGS_KEY.value][VPSKeys.LINODE_PUBLIC_IP_KEY.value] = new_linode.ipv4[0]
+        except Exception as e:
+            print(f"{Emojis.ERROR_SIGN.value} Error adding Linode ID to {CONFIG_FILE_NAME} file. Error: {e}")
             print(f"Please add the following config to the {CONFIG_FILE_NAME} file manually:")
             print(f"    '{VPSKeys.LINODE_ID_KEY.value}: {new_linode.id}'")
             return
+        return new_linode
+
+    def create_instances(self, count: int, wait: bool = False, timeout: float = DEFAULT_READINESS_TIMEOUT, parallelism: int = DEFAULT_PROVISION_PARALLELISM, bootstrap_coolify: bool = False, golden_image: bool = False) -> list[dict]|None:
+        """
+        Create `count` extra Linode instances from the project's vps_configs concurrently.
+        Each instance gets its own SSH key (generated in parallel) and a numbered label based on the configured one,
+        e.g. `sfy-instance-<project>-2`. All created instances are recorded in vps_configs.instances with a single config write.
+
+        Args:
+            count (int): Number of instances to create.
+            wait (bool): Wait until every instance accepts SSH connections (default is False).
+            timeout (float): Maximum seconds to wait per instance when `wait` is True (default is DEFAULT_READINESS_TIMEOUT).
+            parallelism (int): Maximum number of instances created at once (default is DEFAULT_PROVISION_PARALLELISM).
+            bootstrap_coolify (bool): Install Coolify on every instance at first boot with cloud-init; waiting then waits for the Coolify port (default is False).
+            golden_image (bool): Create the instances from the Coolify image made by `vps bake`; waiting then waits for the Coolify port (default is False).
+
+        Returns:
+            list[dict]|None: The label, linode_id, public_ip and ssh_key of each created instance, or None if nothing could be created.
+        """
+        project_root = findProjectRoot()
+        if project_root is None:
+            root_dir_error_msg()
+            return None
+        self.test_token_client()
+
+        config_file_path = os.path.join(project_root, CONFIG_FILE_NAME)
+        sf_config_parser = YAMLParser(config_file_path)
+        create_settings = self.read_create_settings(project_root, sf_config_parser)
+        if create_settings is None:
+            return None
+        linode_configs, root_pass = create_settings
+        image = self.resolve_image(linode_configs, golden_image)
+        if image is None:
+            return None
+
+        # number new instances after the highest one already recorded so labels and key files stay unique,
+        # also when `vps down` could only delete some of them
+        recorded_indexes = [int(instance[VPSKeys.LINODE_SSH_KEY_KEY.value].rsplit("-", 1)[1]) for instance in linode_configs.get(VPSKeys.LINODE_INSTANCES_KEY.value) or []]
+        first_index = max(recorded_indexes, default=1) + 1
+        planned = [{
+            VPSKeys.LINODE_LABEL_KEY.value: f"{linode_configs[VPSKeys.LINODE_LABEL_KEY.value]}-{index}",
+            VPSKeys.LINODE_SSH_KEY_KEY.value: f"{SSH_KEY_FILE_NAME}-{index}"
+        } for index in range(first_index, first_index + count)]
+
+        def create(instance_plan: dict) -> dict:
+            start = time.perf_counter()
+            ssh_public_key = self.generate_ssh_key_pair(instance_plan[VPSKeys.LINODE_SSH_KEY_KEY.value])
+            if ssh_public_key is None:
+                return {**instance_plan, "error": "SSH key generation failed", "seconds": time.perf_counter() - start}
+            try:
+                new_linode = self.linode_client.linode.instance_create(
+                    ltype=linode_configs[VPSKeys.LINODE_TYPE_KEY.value],
+                    region=linode_configs[VPSKeys.LINODE_REGION_KEY.value],
+                    image=image,
+                    label=instance_plan[VPSKeys.LINODE_LABEL_KEY.value],
+                    root_pass=root_pass,
+                    authorized_keys=[ssh_public_key],
+                    **self.bootstrap_kwargs(bootstrap_coolify)
+                )
+            except Exception as e:
+                self.forget_token_validation(e)
+                return {**instance_plan, "error": str(e), "seconds": time.perf_counter() - start}
+            return {
+                **instance_plan,
+                VPSKeys.LINODE_ID_KEY.value: new_linode.id,
+                VPSKeys.LINODE_PUBLIC_IP_KEY.value: new_linode.ipv4[0],
+                "seconds": time.perf_counter() - start
+            }
+
+        print(f"{Emojis.ROCKET.value} Creating {count} Linode instances, {min(count, parallelism)} at a time.")
+        with ThreadPoolExecutor(max_workers=max(1, min(count, parallelism))) as executor:
+            results = list(executor.map(create, planned))
+
+        created = [{key: result[key] for key in (VPSKeys.LINODE_LABEL_KEY.value, VPSKeys.LINODE_ID_KEY.value, VPSKeys.LINODE_PUBLIC_IP_KEY.value, VPSKeys.LINODE_SSH_KEY_KEY.value)} for result in results if "error" not in result]
+        if created:
+            try:
+                with sf_config_parser.edit() as sf_config:
+                    sf_config[VPSKeys.VPS_CONFIGS_KEY.value].setdefault(VPSKeys.LINODE_INSTANCES_KEY.value, []).extend(created)
+            except Exception as e:
+                print(f"{Emojis.ERROR_SIGN.value} Error adding the new instances to {CONFIG_FILE_NAME} file. Error: {e}")
+                print(f"Please add the following instances under '{VPSKeys.VPS_CONFIGS_KEY.value}.{VPSKeys.LINODE_INSTANCES_KEY.value}' manually: {created}")
+
+        print(tabulate(
+            [[result[VPSKeys.LINODE_LABEL_KEY.value], result.get(VPSKeys.LINODE_ID_KEY.value, "-"), result.get(VPSKeys.LINODE_PUBLIC_IP_KEY.value, "-"), Emojis.ERROR_SIGN.value if "error" in result else Emojis.CHECK_MARK.value, f"{result['seconds']:.1f}", result.get("error", "")] for result in results],
+            headers=["Label", "ID", "Public IP", "Result", "Time (s)", "Details"], tablefmt="fancy_grid"
+        ))
+        print(f"Linode API: {self.linode_client.metrics_summary()}")
+        if not created:
+            return None
+
+        if wait:
+            key_dir = os.path.join(project_root, SSH_KEY_DIR_NAME)
+            print(f"{Emojis.LOADING.value} Waiting for {len(created)} instances to {'answer on the Coolify port' if bootstrap_coolify or golden_image else 'accept SSH connections'}.")
+            with ThreadPoolExecutor(max_workers=max(1, min(len(created), parallelism))) as executor:
+                phase_times = list(executor.map(lambda instance: self.wait_for_instance(
+                    instance[VPSKeys.LINODE_ID_KEY.value],
+                    instance[VPSKeys.LINODE_PUBLIC_IP_KEY.value],
+                    private_key_path=os.path.join(key_dir, instance[VPSKeys.LINODE_SSH_KEY_KEY.value]),
+                    timeout=timeout,
+                    log=False,
+                    wait_for_coolify=bootstrap_coolify or golden_image
+                ), created))
+            phase_names = readiness_phase_names(bootstrap_coolify or golden_image)
+            print(tabulate(
+                [[instance[VPSKeys.LINODE_LABEL_KEY.value]] + ([f"{seconds:.1f}" for seconds in times.values()] + [f"{sum(times.values()):.1f}"] if times is not None else ["-"] * len(phase_names) + ["timed out"]) for instance, times in zip(created, phase_times)],
+                headers=["Label"] + phase_names + ["total"], tablefmt="fancy_grid"
+            ))
+        return created
+
+    def wait_for_instance(self, instance_id: int, host: str, private_key_path: str|None = None, port: int = 22, timeout: float = DEFAULT_READINESS_TIMEOUT, log: bool = True, wait_for_coolify: bool = False) -> dict|None:
+        """
+        Wait until a Linode instance can be used over SSH, instead of sleeping for a fixed time after creating it.
+        Polls the instance status until it is running, then probes the SSH port, then does an SSH handshake with the instance key.
+        With `wait_for_coolify` (instances bootstrapped with cloud-init) it waits for the Coolify port to answer after the status instead.
+        Every phase polls with exponential backoff and jitter.
+
+        Args:
+            instance_id (int): The Linode instance ID.
+            host (str): The public IP address of the instance.
+            private_key_path (str|None): Private key to do the handshake with. Defaults to the project's SSH_KEY_DIR_NAME/SSH_KEY_FILE_NAME.
+            port (int): The SSH port of the instance (default is 22).
+            timeout (float): Maximum seconds to wait for all phases together (default is DEFAULT_READINESS_TIMEOUT).
+            log (bool): Print progress and a table of the time spent per phase (default is True).
+            wait_for_coolify (bool): Wait for the Coolify port instead of SSH (default is False).
+
+        Returns:
+            dict|None: Seconds spent in each ReadinessPhases phase, or None if the instance was not ready in time.
+        """
+        if private_key_path is None and not wait_for_coolify:
+            project_root = findProjectRoot()
+            if project_root is None:
+                root_dir_error_msg()
+                return None
+            private_key_path = os.path.join(project_root, SSH_KEY_DIR_NAME, SSH_KEY_FILE_NAME)
+
+        def instance_is_running() -> bool:
+            try:
+                return self.linode_client.load(Instance, instance_id).status == LinodeStatus.RUNNING.value
+            except Exception as e:
+                self.forget_token_validation(e)
+                return False
+
+        checks = {
+            ReadinessPhases.STATUS.value: instance_is_running,
+            ReadinessPhases.TCP.value: lambda: port_is_open(host, port),
+            ReadinessPhases.SSH.value: lambda: ssh_handshake(host, private_key_path, port=port, username=DEFAULT_LINODE_USERNAME),
+            ReadinessPhases.COOLIFY.value: lambda: port_is_open(host, DEFAULT_COOLIFY_PORT),
+        }
+        phases = [(phase, checks[phase]) for phase in readiness_phase_names(wait_for_coolify)]
+        deadline = time.monotonic() + timeout
+        phase_times = {}
+        for phase, check in phases:
+            if log:
+                print(f"{Emojis.LOADING.value} Waiting for {phase}...")
+            start = time.monotonic()
+            ready = wait_until(check, deadline)
+            phase_times[phase] = time.monotonic() - start
+            if not ready:
+                print(f"{Emojis.ERROR_SIGN.value} Linode instance {instance_id} was not ready after {timeout:.0f}s (waiting for {phase}).")
+                return None
+        if log:
+            print(f"{Emojis.STAR.value} Linode instance {instance_id} is ready{' and Coolify is answering' if wait_for_coolify else ' for SSH'}.")
+            print(tabulate([[phase, f"{seconds:.1f}"] for phase, seconds in phase_times.items()] + [["total", f"{sum(phase_times.values()):.1f}"]], headers=["Phase", "Time (s)"], tablefmt="fancy_grid"))
+        return phase_times
+
+    def bake_image(self, label: str|None = None, timeout: float = DEFAULT_IMAGE_BAKE_TIMEOUT) -> str|None:
+        """
+        Capture the project's instance, with Coolify already installed, as a private Linode image and record it
+        under VPSKeys.LINODE_GOLDEN_IMAGE_KEY in the CONFIG_FILE_NAME file.
+        The instance is shut down while its disk is imaged, so the image is consistent, and booted again afterwards.
+
+        Args:
+            label (str|None): Label of the image. Defaults to the instance label followed by GOLDEN_IMAGE_LABEL_SUFFIX.
+            timeout (float): Maximum seconds to wait for the shutdown and for the image to become available (default is DEFAULT_IMAGE_BAKE_TIMEOUT).
+
+        Returns:
+            str|None: The ID of the new image, or None if it could not be made or recorded.
+        """
+        project_root = findProjectRoot()
+        if project_root is None:
+            root_dir_error_msg()
+            return None
+        self.test_token_client()
+
+        sf_config_parser = YAMLParser(os.path.join(project_root, CONFIG_FILE_NAME))
+        linode_configs = sf_config_parser.get(VPSKeys.VPS_CONFIGS_KEY.value)
+        if linode_configs is None or linode_configs.get(VPSKeys.LINODE_ID_KEY.value) is None:
+            print(f"{Emojis.ERROR_SIGN.value} No Linode instance found in {CONFIG_FILE_NAME}. Run `sfy vps up` first.")
+            return None
+        instance_id = linode_configs[VPSKeys.LINODE_ID_KEY.value]
+        public_ip = linode_configs.get(VPSKeys.LINODE_PUBLIC_IP_KEY.value)
+
+        if public_ip is not None and not port_is_open(public_ip, DEFAULT_COOLIFY_PORT):
+            if not yes_no_prompt(f"Coolify does not answer on port {DEFAULT_COOLIFY_PORT} of {public_ip}. Bake the image anyway?"):
+                print(f"{Emojis.BOMB.value} Image bake aborted.")
+                return None
+
+        def instance_status() -> str|None:
+            try:
+                return self.linode_client.load(Instance, instance_id).status
+            except Exception as e:
+                self.forget_token_validation(e)
+                return None
+
+        deadline = time.monotonic() + timeout
+        phase_times = {}
+        boot_after_bake = False
+        try:
+            instance = self.linode_client.load(Instance, instance_id)
+            instance_label = instance.label
+            was_running = instance.status == LinodeStatus.RUNNING.value
+            disk = next((disk for disk in instance.disks if disk.filesystem != "swap"), None)
+            if disk is None:
+                print(f"{Emojis.ERROR_SIGN.value} Linode instance {instance_id} has no disk to image.")
+                return None
+
+            start = time.monotonic()
+            if instance.status != LinodeStatus.OFFLINE.value:
+                print(f"{Emojis.LOADING.value} Shutting down Linode instance {instance_id}...")
+                instance.shutdown()
+                boot_after_bake = was_running
+                if not wait_until(lambda: instance_status() == LinodeStatus.OFFLINE.value, deadline):
+                    print(f"{Emojis.ERROR_SIGN.value} Linode instance {instance_id} did not shut down within {timeout:.0f}s.")
+                    return None
+            phase_times["shutdown"] = time.monotonic() - start
+
+            start = time.monotonic()
+            print(f"{Emojis.LOADING.value} Imaging disk '{disk.label}'...")
+            image = self.linode_client.images.create(
+                disk,
+                label=label or f"{instance_label}{GOLDEN_IMAGE_LABEL_SUFFIX}",
+                description=f"saasFactory Coolify image of {instance_label}",
+                cloud_init=True
+            )
+            image_ready = wait_until(lambda: self.linode_client.load(Image, image.id).status == LinodeImageStatus.AVAILABLE.value, deadline)
+            phase_times["image"] = time.monotonic() - start
+        except Exception as e:
+            self.forget_token_validation(e)
+            print(f"{Emojis.ERROR_SIGN.value} Error baking the Linode image. Error: {e}")
+            return None
+        finally:
+            # once the instance was shut down for the bake, boot it again however the bake ended
+            if boot_after_bake:
+                start = time.monotonic()
+                try:
+                    instance.boot()
+                    phase_times["boot"] = time.monotonic() - start
+                except Exception as e:
+                    self.forget_token_validation(e)
+                    print(f"{Emojis.WARNING_SIGN.value} Error booting Linode instance {instance_id} again, boot it from the Linode dashboard. Error: {e}")
+        if not image_ready:
+            print(f"{Emojis.ERROR_SIGN.value} Image {image.id} was not available within {timeout:.0f}s. It is not recorded in {CONFIG_FILE_NAME}.")
+            return None
+
+        try:
+            with sf_config_parser.edit() as sf_config:
+                sf_config[VPSKeys.VPS_CONFIGS_KEY.value][VPSKeys.LINODE_GOLDEN_IMAGE_KEY.value] = image.id
+        except Exception as e:
+            print(f"{Emojis.ERROR_SIGN.value} Error adding the image to {CONFIG_FILE_NAME} file. Error: {e}")
+            print(f"Please add the following config to the {CONFIG_FILE_NAME} file manually:")
+            print(f"    '{VPSKeys.LINODE_GOLDEN_IMAGE_KEY.value}: {image.id}'")
+            return None
+        print(f"{Emojis.STAR.value} Image {image.id} baked. Create instances from it with `sfy vps up --golden-image`.")
+        print(tabulate([[phase, f"{seconds:.1f}"] for phase, seconds in phase_times.items()] + [["total", f"{sum(phase_times.values()):.1f}"]], headers=["Phase", "Time (s)"], tablefmt="fancy_grid"))
+        return image.id
+
+    def hibernate_instance(self, timeout: float = DEFAULT_SHUTDOWN_TIMEOUT) -> bool:
+        """
+        Shut the project's instance down but keep it, its disk, the SSH keys and the CONFIG_FILE_NAME configs,
+        so `vps up` can boot it again instead of provisioning a new one. Linode still bills offline instances.
+
+        Args:
+            timeout (float): Maximum seconds to wait for the instance to be offline (default is DEFAULT_SHUTDOWN_TIMEOUT).
+
+        Returns:
+            bool: True if the instance is offline and marked as hibernated, False otherwise.
+        """
+        project_root = findProjectRoot()
+        if project_root is None:
+            root_dir_error_msg()
+            return False
+        self.test_token_client()
+
+        sf_config_parser = YAMLParser(os.path.join(project_root, CONFIG_FILE_NAME))
+        linode_configs = sf_config_parser.get(VPSKeys.VPS_CONFIGS_KEY.value)
+        if linode_configs is None or linode_configs.get(VPSKeys.LINODE_ID_KEY.value) is None:
+            print(f"{Emojis.ERROR_SIGN.value} No Linode instance found in {CONFIG_FILE_NAME}.")
+            return False
+        instance_id = linode_configs[VPSKeys.LINODE_ID_KEY.value]
+
+        def instance_is_offline() -> bool:
+            try:
+                return self.linode_client.load(Instance, instance_id).status == LinodeStatus.OFFLINE.value
+            except Exception as e:
+                self.forget_token_validation(e)
+                return False
+
+        start = time.monotonic()
+        try:
+            instance = self.linode_client.load(Instance, instance_id)
+            if instance.status != LinodeStatus.OFFLINE.value:
+                print(f"{Emojis.LOADING.value} Shutting down Linode instance {instance.label}...")
+                instance.shutdown()
+        except Exception as e:
+            self.forget_token_validation(e)
+            print(f"{Emojis.ERROR_SIGN.value} Error shutting down the Linode instance. Error: {e}")
+            return False
+        if not wait_until(instance_is_offline, start + timeout):
+            print(f"{Emojis.ERROR_SIGN.value} Linode instance {instance_id} was not offline after {timeout:.0f}s.")
+            return False
+
+        try:
+            with sf_config_parser.edit() as sf_config:
+                sf_config[VPSKeys.VPS_CONFIGS_KEY.value][VPSKeys.LINODE_HIBERNATED_KEY.value] = True
+        except Exception as e:
+            print(f"{Emojis.ERROR_SIGN.value} Error marking the instance as hibernated in {CONFIG_FILE_NAME} file. Error: {e}")
+            return False
+        print(f"{Emojis.STAR.value} Linode instance hibernated in {time.monotonic() - start:.1f}s. Run `sfy vps up` to boot it again.")
+        print(f"{Emojis.DOLLAR.value} Offline Linode instances are still billed, use `sfy vps down` to delete it.")
+        return True
+
+    def find_hibernated_instance(self) -> Instance|None:
+        """
+        Find the project's instance if it was hibernated with `vps down --hibernate`, is still offline and still exists.
+        Instances that are offline for any other reason (shut down in the Linode dashboard, being baked, ...) are left alone.
+
+        Returns:
+            Instance|None: The hibernated instance, or None if there is none to resume.
+        """
+        project_root = findProjectRoot()
+        if project_root is None:
+            return None
+        linode_configs = YAMLParser(os.path.join(project_root, CONFIG_FILE_NAME)).get(VPSKeys.VPS_CONFIGS_KEY.value)
+        if not isinstance(linode_configs, dict) or linode_configs.get(VPSKeys.LINODE_ID_KEY.value) is None:
+            return None
+        if not linode_configs.get(VPSKeys.LINODE_HIBERNATED_KEY.value):
+            return None
+        try:
+            instance = self.linode_client.load(Instance, linode_configs[VPSKeys.LINODE_ID_KEY.value])
+            if instance.status != LinodeStatus.OFFLINE.value:
+                return None
+        except Exception as e:
+            self.forget_token_validation(e)
+            return None
+        return instance
+
+    def resume_instance(self, instance: Instance, timeout: float = DEFAULT_READINESS_TIMEOUT) -> dict|None:
+        """
+        Boot a hibernated instance and wait until it is ready: until Coolify answers if it was installed, otherwise until SSH works.
+
+        Args:
+            instance (Instance): The offline instance from find_hibernated_instance.
+            timeout (float): Maximum seconds to wait for the instance to be ready (default is DEFAULT_READINESS_TIMEOUT).
+
+        Returns:
+            dict|None: Seconds spent in each readiness phase, or None if the instance could not be booted or was not ready in time.
+        """
+        project_root = findProjectRoot()
+        if project_root is None:
+            root_dir_error_msg()
+            return None
+        sf_config_parser = YAMLParser(os.path.join(project_root, CONFIG_FILE_NAME))
+        has_coolify = sf_config_parser.get(CoolifyKeys.COOLIFY_CONFIGS_KEY.value) is not None
+
+        print(f"{Emojis.ROCKET.value} Booting hibernated Linode instance {instance.label}.")
+        try:
+            instance.boot()
+        except Exception as e:
+            self.forget_token_validation(e)
+            print(f"{Emojis.ERROR_SIGN.value} Error booting the Linode instance. Error: {e}")
+            return None
+        phase_times = self.wait_for_instance(instance.id, instance.ipv4[0], timeout=timeout, wait_for_coolify=has_coolify)
+        if phase_times is None:
+            return None
+        try:
+            with sf_config_parser.edit() as sf_config:
+                sf_config[VPSKeys.VPS_CONFIGS_KEY.value].pop(VPSKeys.LINODE_HIBERNATED_KEY.value, None)
+                sf_config[VPSKeys.VPS_CONFIGS_KEY.value][VPSKeys.LINODE_PUBLIC_IP_KEY.value] = instance.ipv4[0]
+        except Exception as e:
+            print(f"{Emojis.WARNING_SIGN.value} Error updating {CONFIG_FILE_NAME} file. Error: {e}")
+        return phase_times
 
-    
     def destroy_instance(self) -> None:
         """
-        Delete the Linode VPS instance.
+        Delete the Linode VPS instance, and the extra instances created with `vps up --count` recorded under VPSKeys.LINODE_INSTANCES_KEY.
+        The config entries and SSH keys of the deleted instances are removed; instances that could not be deleted stay recorded.
         """
         project_root = findProjectRoot()
         if project_root is None:
@@ -338,46 +941,143 @@ class LinodeProvider(VPSProvider):
             return 
         
         instance_id = linode_configs.get(VPSKeys.LINODE_ID_KEY.value)
-        if instance_id is None:
+        extra_instances = linode_configs.get(VPSKeys.LINODE_INSTANCES_KEY.value) or []
+        if instance_id is None and not extra_instances:
             print(f"{Emojis.ERROR_SIGN.value} Error reading Linode configurations.")
             return
-        
-        instance_to_delete = self.linode_client.linode.instances(Instance.id == instance_id) #object to call .delete() on
-        instance_to_delete_label = instance_to_delete[0].label
-        if instance_to_delete is None:
-            print(f"{Emojis.ERROR_SIGN.value} No Linode instance found with the specified ID.")
-            return 
-        
-        delete = yes_no_prompt("Are you sure you want to permanently delete this instance?", additional_text=f"Instance Label: {instance_to_delete_label}\n")
-        if delete:
+
+        instances_to_delete = [{**extra_instance} for extra_instance in extra_instances]
+        if instance_id is not None:
             try:
-                instance_to_delete[0].delete()
-                #print(f"Linode instance {instance_to_delete_details.label} deleted.")
-                print(f"{Emojis.STAR.value} Linode instance successfully deleted.")
-                
-            except Exception as e:
-                print(f"{Emojis.ERROR_SIGN.value} Error Deleting Linode Instance. Error: {e}")
-                return 
-            # now deleting associated data from sassFactory project directory
-            try: 
-                #removing ssh keys and instance ID
-                if os.path.exists(os.path.join(project_root, SSH_KEY_DIR_NAME)):
-                    print(f"Removing {SSH_KEY_DIR_NAME} folder and its contents.")
-                    shutil.rmtree(os.path.join(project_root, SSH_KEY_DIR_NAME))
-                    print(f"Removing {VPSKeys.LINODE_ID_KEY.value} and {VPSKeys.LINODE_PUBLIC_IP_KEY.value} from {CONFIG_FILE_NAME} file.")
-                    sf_config_parser.remove(list_to_dot_notation([VPSKeys.VPS_CONFIGS_KEY.value, VPSKeys.LINODE_ID_KEY.value]))
-                    sf_config_parser.remove(list_to_dot_notation([VPSKeys.VPS_CONFIGS_KEY.value, VPSKeys.LINODE_PUBLIC_IP_KEY.value]))
-                    # checking for coolify_configs
-                    if sf_config_parser.get(CoolifyKeys.COOLIFY_CONFIGS_KEY.value) is not None:
-                        sf_config_parser.remove(CoolifyKeys.COOLIFY_CONFIGS_KEY.value)
+                instance_label = self.linode_client.load(Instance, instance_id).label
             except Exception as e:
-                print(f"{Emojis.ERROR_SIGN.value} Error deleting SSH keys and/or {VPSKeys.LINODE_ID_KEY.value} from {CONFIG_FILE_NAME} file. Error: {e}")
-                return
-            
-        else:
+                self.forget_token_validation(e)
+                instance_label = linode_configs.get(VPSKeys.LINODE_LABEL_KEY.value)
+            instances_to_delete.insert(0, {VPSKeys.LINODE_ID_KEY.value: instance_id, VPSKeys.LINODE_LABEL_KEY.value: instance_label, VPSKeys.LINODE_SSH_KEY_KEY.value: SSH_KEY_FILE_NAME})
+
+        labels = "\n".join(f"Instance Label: {instance[VPSKeys.LINODE_LABEL_KEY.value]} (ID {instance[VPSKeys.LINODE_ID_KEY.value]})" for instance in instances_to_delete)
+        delete = yes_no_prompt(f"Are you sure you want to permanently delete {'these instances' if len(instances_to_delete) > 1 else 'this instance'}?", additional_text=f"{labels}\n")
+        if not delete:
             print(f"{Emojis.BOMB.value} Instance deletion aborted.")
             return
+
+        deleted_ids = set()
+        for instance in instances_to_delete:
+            try:
+                self.linode_client.load(Instance, instance[VPSKeys.LINODE_ID_KEY.value]).delete()
+            except ApiError as e:
+                # already deleted, e.g. in the Linode console
+                if e.status != 404:
+                    self.forget_token_validation(e)
+                    print(f"{Emojis.ERROR_SIGN.value} Error Deleting Linode Instance {instance[VPSKeys.LINODE_LABEL_KEY.value]}. Error: {e}")
+                    continue
+            except Exception as e:
+                print(f"{Emojis.ERROR_SIGN.value} Error Deleting Linode Instance {instance[VPSKeys.LINODE_LABEL_KEY.value]}. Error: {e}")
+                continue
+            deleted_ids.add(instance[VPSKeys.LINODE_ID_KEY.value])
+            print(f"{Emojis.STAR.value} Linode instance {instance[VPSKeys.LINODE_LABEL_KEY.value]} successfully deleted.")
+
+        # now deleting associated data from sassFactory project directory
+        try: 
+            key_dir = os.path.join(project_root, SSH_KEY_DIR_NAME)
+            for instance in instances_to_delete:
+                if instance[VPSKeys.LINODE_ID_KEY.value] not in deleted_ids or instance.get(VPSKeys.LINODE_SSH_KEY_KEY.value) is None:
+                    continue
+                for key_file_name in (instance[VPSKeys.LINODE_SSH_KEY_KEY.value], f"{instance[VPSKeys.LINODE_SSH_KEY_KEY.value]}.pub"):
+                    if os.path.exists(os.path.join(key_dir, key_file_name)):
+                        os.remove(os.path.join(key_dir, key_file_name))
+            if os.path.isdir(key_dir) and not os.listdir(key_dir):
+                print(f"Removing {SSH_KEY_DIR_NAME} folder.")
+                os.rmdir(key_dir)
+
+            with sf_config_parser.edit() as sf_config:
+                vps_configs = sf_config[VPSKeys.VPS_CONFIGS_KEY.value]
+                if instance_id in deleted_ids:
+                    print(f"Removing {VPSKeys.LINODE_ID_KEY.value} and {VPSKeys.LINODE_PUBLIC_IP_KEY.value} from {CONFIG_FILE_NAME} file.")
+                    vps_configs.pop(VPSKeys.LINODE_ID_KEY.value, None)
+                    vps_configs.pop(VPSKeys.LINODE_PUBLIC_IP_KEY.value, None)
+                    vps_configs.pop(VPSKeys.LINODE_HIBERNATED_KEY.value, None)
+                    sf_config.pop(CoolifyKeys.COOLIFY_CONFIGS_KEY.value, None)
+                remaining_instances = [extra_instance for extra_instance in extra_instances if extra_instance[VPSKeys.LINODE_ID_KEY.value] not in deleted_ids]
+                if remaining_instances:
+                    vps_configs[VPSKeys.LINODE_INSTANCES_KEY.value] = remaining_instances
+                else:
+                    vps_configs.pop(VPSKeys.LINODE_INSTANCES_KEY.value, None)
+        except Exception as e:
+            print(f"{Emojis.ERROR_SIGN.value} Error deleting SSH keys and/or {VPSKeys.LINODE_ID_KEY.value} from {CONFIG_FILE_NAME} file. Error: {e}")
+            return
+
+        left = [instance for instance in instances_to_delete if instance[VPSKeys.LINODE_ID_KEY.value] not in deleted_ids]
+        if left:
+            print(f"{Emojis.WARNING_SIGN.value} These instances were not deleted and are still recorded in {CONFIG_FILE_NAME}, run `sfy vps down` again to retry: {', '.join(str(instance[VPSKeys.LINODE_ID_KEY.value]) for instance in left)}")
         
+    def list_sfy_instances(self) -> list[dict]|None:
+        """
+        List every saasFactory instance on the account (label starting with LINODE_INSTANCE_PREFIX) with one paginated listing call.
+
+        Returns:
+            list[dict]|None: One dictionary per instance with its id, label, status, public_ip, region and type, or None if an error occurred.
+        """
+        try:
+            instances = self.linode_client.linode.instances(Instance.label.contains(LINODE_INSTANCE_PREFIX))
+            return [{
+                VPSKeys.LINODE_ID_KEY.value: instance.id,
+                VPSKeys.LINODE_LABEL_KEY.value: instance.label,
+                "status": instance.status,
+                VPSKeys.LINODE_PUBLIC_IP_KEY.value: instance.ipv4[0] if instance.ipv4 else None,
+                VPSKeys.LINODE_REGION_KEY.value: instance.region.id,
+                VPSKeys.LINODE_TYPE_KEY.value: instance.type.id if instance.type is not None else None
+            } for instance in instances if instance.label.startswith(LINODE_INSTANCE_PREFIX)]
+        except Exception as e:
+            self.forget_token_validation(e)
+            print(f"{Emojis.ERROR_SIGN.value} Error listing Linode instances. Error: {e}")
+            return None
+
+    def get_instances_status(self, project_roots: list[str]|None = None) -> list[list]|None:
+        """
+        Get the status of all saasFactory instances and of the instances recorded in the given projects,
+        with one listing call joined to the local configs in memory.
+
+        Args:
+            project_roots (list[str]|None): Project root directories whose CONFIG_FILE_NAME files are matched to the instances.
+
+        Returns:
+            list[list]|None: [project, label, id, status, public ip, region, type] rows, or None if the instances could not be listed.
+                Instances without a local project have "-" as project, projects whose instance no longer exists have "not found" as status.
+        """
+        instances = self.list_sfy_instances()
+        if instances is None:
+            return None
+
+        instances_by_id = {instance[VPSKeys.LINODE_ID_KEY.value]: instance for instance in instances}
+        projects_by_id = {}
+        rows = []
+        for project_root in project_roots or []:
+            config_file_path = os.path.join(project_root, CONFIG_FILE_NAME)
+            if not os.path.exists(config_file_path):
+                print(f"{Emojis.WARNING_SIGN.value} No {CONFIG_FILE_NAME} file found in {project_root}.")
+                continue
+            linode_configs = YAMLParser(config_file_path).get(VPSKeys.VPS_CONFIGS_KEY.value) or {}
+            instance_id = linode_configs.get(VPSKeys.LINODE_ID_KEY.value)
+            if instance_id is None:
+                continue
+            if instance_id in instances_by_id:
+                projects_by_id[instance_id] = os.path.basename(os.path.abspath(project_root))
+            else:
+                rows.append([os.path.basename(os.path.abspath(project_root)), linode_configs.get(VPSKeys.LINODE_LABEL_KEY.value), instance_id, "not found", linode_configs.get(VPSKeys.LINODE_PUBLIC_IP_KEY.value), linode_configs.get(VPSKeys.LINODE_REGION_KEY.value), linode_configs.get(VPSKeys.LINODE_TYPE_KEY.value)])
+
+        for instance in instances:
+            rows.append([
+                projects_by_id.get(instance[VPSKeys.LINODE_ID_KEY.value], "-"),
+                instance[VPSKeys.LINODE_LABEL_KEY.value],
+                instance[VPSKeys.LINODE_ID_KEY.value],
+                instance["status"],
+                instance[VPSKeys.LINODE_PUBLIC_IP_KEY.value],
+                instance[VPSKeys.LINODE_REGION_KEY.value],
+                instance[VPSKeys.LINODE_TYPE_KEY.value]
+            ])
+        return sorted(rows, key=lambda row: (row[0] == "-", str(row[0]), str(row[1])))
+
     def check_instance_status(self, log_status: bool = False) -> str|None:
         """
         Check the status of the Linode VPS instance. Returns the status of the instance as a string. 
@@ -421,6 +1121,7 @@ class LinodeProvider(VPSProvider):
                 
             return instance_status  
         except Exception as e:
+            self.forget_token_validation(e)
             print(f"{Emojis.ERROR_SIGN.value} Error getting Linode instance status. Error: {e}. Instance may be offline.")
             return "offline"
         
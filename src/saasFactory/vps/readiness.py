@@ -0,0 +1,78 @@
+import random
+import socket
+import time
+from typing import Callable, Iterator
+from paramiko import SSHClient, AutoAddPolicy
+from saasFactory.vps.keys import load_private_key
+from saasFactory.utils.globals import (
+    READINESS_POLL_INITIAL_DELAY,
+    READINESS_POLL_MAX_DELAY,
+    SSH_CONNECT_TIMEOUT
+)
+
+
+def backoff_delays(initial: float = READINESS_POLL_INITIAL_DELAY, maximum: float = READINESS_POLL_MAX_DELAY) -> Iterator[float]:
+    """
+    Yields exponentially growing delays capped at `maximum`, each randomized between half and all of its value
+    so many waiters don't poll in lockstep.
+
+    Args:
+        initial (float): The first delay in seconds.
+        maximum (float): The largest delay in seconds.
+    """
+    delay = initial
+    while True:
+        yield random.uniform(delay / 2, delay)
+        delay = min(delay * 2, maximum)
+
+
+def wait_until(check: Callable[[], bool], deadline: float, initial: float = READINESS_POLL_INITIAL_DELAY, maximum: float = READINESS_POLL_MAX_DELAY) -> bool:
+    """
+    Calls `check` with exponential backoff and jitter until it returns True or `deadline` (a time.monotonic() value) passes.
+
+    Returns:
+        bool: True if the check passed before the deadline, False otherwise.
+    """
+    for delay in backoff_delays(initial, maximum):
+        if check():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+
+
+def port_is_open(host: str, port: int = 22, timeout: float = SSH_CONNECT_TIMEOUT) -> bool:
+    """
+    Checks if a TCP connection to host:port can be opened.
+    """
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def ssh_handshake(host: str, private_key_path: str, port: int = 22, username: str = "root", timeout: float = SSH_CONNECT_TIMEOUT) -> bool:
+    """
+    Checks if an SSH session can be authenticated with the given key, without running anything.
+    """
+    ssh_client = SSHClient()
+    ssh_client.set_missing_host_key_policy(AutoAddPolicy())
+    try:
+        ssh_client.connect(
+            hostname=host,
+            port=port,
+            username=username,
+            pkey=load_private_key(private_key_path),
+            timeout=timeout,
+            banner_timeout=timeout,
+            auth_timeout=timeout,
+            look_for_keys=False,
+            allow_agent=False
+        )
+        return True
+    except Exception:
+        return False
+    finally:
+        ssh_client.close()
@@ -1,15 +1,194 @@
-from paramiko import SSHClient, AutoAddPolicy, RSAKey
+from paramiko import SSHClient, AutoAddPolicy
 from dotenv import load_dotenv
+import codecs
+import io
 import os
+import select
+import shlex
+import sys
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
 from saasFactory.utils.enums import Emojis, EnvVarNames
 from saasFactory.utils.cli import root_dir_error_msg, findProjectRoot, print_with_underline
+from saasFactory.vps.keys import load_private_key
 from saasFactory.utils.globals import (
     SSH_KEY_DIR_NAME,
-    SSH_KEY_FILE_NAME
+    SSH_KEY_FILE_NAME,
+    SSH_RECV_BUFFER_SIZE,
+    SSH_OUTPUT_TAIL_BYTES,
+    SSH_SELECT_TIMEOUT,
+    SSH_CONNECT_TIMEOUT,
+    SSH_STEP_MARKER,
+    SSH_REMOTE_SCRIPT_DIR
 )
 
+
+@dataclass
+class ScriptStep:
+    """
+    One command of a script run with SSHConnection.execute_script.
+
+    Attributes:
+        command (str): The command.
+        exit_code (int|None): The exit code of the command, or None if it never finished.
+        seconds (float|None): How long the command took, or None if it never started.
+    """
+    command: str
+    exit_code: int|None = None
+    seconds: float|None = None
+
+
+@dataclass
+class CommandResult:
+    """
+    Result of a command executed over SSH.
+
+    Attributes:
+        exit_code (int|None): The exit code of the command, or None if it could not be run.
+        output (str): The last SSH_OUTPUT_TAIL_BYTES of combined stdout/stderr.
+        truncated (bool): True if earlier output was dropped to keep memory bounded.
+        steps (list[ScriptStep]): Per step results when the command was a script run with execute_script.
+    """
+    exit_code: int|None
+    output: str = ""
+    truncated: bool = False
+    steps: list[ScriptStep] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.exit_code == 0
+
+
+class OutputTail:
+    """
+    Keeps only the last `max_bytes` of a command's output so long running commands use bounded memory.
+    """
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.chunks = deque()
+        self.size = 0
+        self.truncated = False
+
+    def append(self, chunk: bytes) -> None:
+        self.chunks.append(chunk)
+        self.size += len(chunk)
+        while self.size - len(self.chunks[0]) >= self.max_bytes:
+            self.size -= len(self.chunks.popleft())
+            self.truncated = True
+
+    def text(self) -> str:
+        data = b"".join(self.chunks)
+        if len(data) > self.max_bytes:
+            data = data[-self.max_bytes:]
+            self.truncated = True
+        return data.decode(errors="replace")
+
+
+class PrefixedLinePrinter:
+    """
+    Prints streamed text one complete line at a time with a prefix, so output from several hosts running at once stays readable.
+    """
+    def __init__(self, prefix: str, file=None) -> None:
+        self.prefix = prefix
+        self.file = file
+        self.partial_line = ""
+
+    def write(self, text: str) -> None:
+        lines = (self.partial_line + text).split("\n")
+        self.partial_line = lines.pop()
+        for line in lines:
+            print(f"{self.prefix}{line}", file=self.file or sys.stdout, flush=True)
+
+    def flush(self) -> None:
+        # partial lines are held back until they are complete, see finish()
+        pass
+
+    def finish(self) -> None:
+        if self.partial_line:
+            print(f"{self.prefix}{self.partial_line}", file=self.file or sys.stdout, flush=True)
+            self.partial_line = ""
+
+
+class StepMarkerReader:
+    """
+    Reads the output of a script built by build_step_script, times each step from its start/end marker lines
+    and forwards every other line to `output` (if given).
+    """
+    def __init__(self, steps: list[ScriptStep], output=None) -> None:
+        self.steps = steps
+        self.output = output
+        self.partial_line = ""
+        self.step_started_at = {}
+
+    def write(self, text: str) -> None:
+        lines = (self.partial_line + text).split("\n")
+        self.partial_line = lines.pop()
+        for line in lines:
+            marker_at = line.find(SSH_STEP_MARKER)
+            if marker_at == -1:
+                self._forward(line + "\n")
+                continue
+            if marker_at > 0:
+                # the step's output didn't end with a newline
+                self._forward(line[:marker_at] + "\n")
+            self._read_marker(line[marker_at + len(SSH_STEP_MARKER):].split())
+
+    def _read_marker(self, fields: list[str]) -> None:
+        # markers are `start <index>` and `end <index> <exit code>`
+        try:
+            index = int(fields[1])
+            step = self.steps[index]
+        except (IndexError, ValueError):
+            return
+        if fields[0] == "start":
+            self.step_started_at[index] = time.perf_counter()
+            self._forward(f"{Emojis.ROCKET.value} Step {index + 1}/{len(self.steps)}: `{step.command}`\n")
+        elif fields[0] == "end" and len(fields) > 2 and index in self.step_started_at:
+            step.seconds = time.perf_counter() - self.step_started_at[index]
+            step.exit_code = int(fields[2]) if fields[2].lstrip("-").isdigit() else None
+
+    def _forward(self, text: str) -> None:
+        if self.output is not None:
+            self.output.write(text)
+            self.output.flush()
+
+    def flush(self) -> None:
+        pass
+
+    def finish(self) -> None:
+        if self.partial_line:
+            self._forward(self.partial_line)
+            self.partial_line = ""
+
+
+def build_step_script(commands: list[str]) -> str:
+    """
+    Builds a bash script that runs the commands in order and stops at the first failure.
+    Each command is wrapped in `SSH_STEP_MARKER start <index>` and `SSH_STEP_MARKER end <index> <exit code>` lines
+    so the caller can time and report every step while the whole script runs in a single SSH channel.
+
+    Args:
+        commands (list[str]): The commands to run.
+
+    Returns:
+        str: The script.
+    """
+    lines = ["#!/usr/bin/env bash"]
+    for index, command in enumerate(commands):
+        lines += [
+            f"printf '{SSH_STEP_MARKER} start {index}\\n'",
+            command,
+            "sfy_exit_code=$?",
+            f"printf '{SSH_STEP_MARKER} end {index} %d\\n' \"$sfy_exit_code\"",
+            "[ \"$sfy_exit_code\" -eq 0 ] || exit \"$sfy_exit_code\"",
+        ]
+    return "\n".join(lines) + "\n"
+
+
 class SSHConnection:
-    def __init__(self, host: str, port:int = 22, username: str = "root", key_encrypted: bool = False) -> None:
+    def __init__(self, host: str, port:int = 22, username: str = "root", key_encrypted: bool = False, private_key_path: str|None = None, log_prefix: str = "", connect_timeout: float = SSH_CONNECT_TIMEOUT) -> None:
         """
         Initialize the SSHConnection class.
 
@@ -18,11 +197,17 @@ class SSHConnection:
             port (int): The port number to connect to the SSH server (default is 22).
             username (str): The username to use for authentication (default is "root").
             key_encrypted (bool): Whether to use a password for authentication if the private key is encrypted (default is False).
+            private_key_path (str|None): Path of the private key to use. Defaults to the project's SSH_KEY_DIR_NAME/SSH_KEY_FILE_NAME.
+            log_prefix (str): Prefix for every line this connection prints, e.g. "[host] " when running on several hosts at once (default is "").
+            connect_timeout (float): Seconds allowed for each of the TCP connect, SSH banner and authentication, so an unreachable host fails fast (default is SSH_CONNECT_TIMEOUT).
         """
         self.host = host
         self.port = port
         self.username = username
         self.key_encrypted = key_encrypted
+        self.custom_private_key_path = private_key_path
+        self.log_prefix = log_prefix
+        self.connect_timeout = connect_timeout
         self.ssh_client = SSHClient()
         self.ssh_client.set_missing_host_key_policy(AutoAddPolicy()) #this removes the `do you want to add to known hosts?` prompt when connecting
 
@@ -37,7 +222,7 @@ class SSHConnection:
             bool: True if credentials were successfully initialized, False otherwise.
         """
         project_root = findProjectRoot()
-        if project_root is None:
+        if project_root is None and (self.custom_private_key_path is None or self.key_encrypted):
             root_dir_error_msg()
             return False
         try:
@@ -46,10 +231,13 @@ class SSHConnection:
                 self.root_password = os.getenv(EnvVarNames.VPS_ROOT_PASSWORD_ENV_VAR.value)
             else:
                 self.root_password = None
-            self.private_key_path = os.path.join(project_root, SSH_KEY_DIR_NAME, SSH_KEY_FILE_NAME)
+            if self.custom_private_key_path is not None:
+                self.private_key_path = self.custom_private_key_path
+            else:
+                self.private_key_path = os.path.join(project_root, SSH_KEY_DIR_NAME, SSH_KEY_FILE_NAME)
             return True
         except Exception as e:
-            print(f"{Emojis.ERROR_SIGN.value} Error reading SSH credentials: {str(e)}")
+            print(f"{self.log_prefix}{Emojis.ERROR_SIGN.value} Error reading SSH credentials: {str(e)}")
             return False
         
     def connect(self) -> bool:
@@ -63,13 +251,12 @@ class SSHConnection:
             return
         
         try:
-            with open(self.private_key_path, "r") as key_file:
-                key = RSAKey.from_private_key(
-                    file_obj=key_file,
-                    password=self.root_password if self.key_encrypted else None
-                )
+            key = load_private_key(
+                self.private_key_path,
+                password=self.root_password if self.key_encrypted else None
+            )
         except Exception as e:
-            print(f"{Emojis.ERROR_SIGN.value} Error reading SSH key: {str(e)}")
+            print(f"{self.log_prefix}{Emojis.ERROR_SIGN.value} Error reading SSH key: {str(e)}")
             return False
         
         try:
@@ -77,45 +264,137 @@ class SSHConnection:
                 hostname=self.host,  
                 username=self.username,
                 pkey=key,
-                port=self.port
+                port=self.port,
+                timeout=self.connect_timeout,
+                banner_timeout=self.connect_timeout,
+                auth_timeout=self.connect_timeout
             )
         except Exception as e:
-            print(f"{Emojis.ERROR_SIGN.value} Error connecting to SSH server: {str(e)}")
+            print(f"{self.log_prefix}{Emojis.ERROR_SIGN.value} Error connecting to SSH server: {str(e)}")
             return False
         return True
     
-    def execute_command(self, command: str, logging: bool = False) -> str|None:
+    def upload_file(self, content: str, remote_path: str, mode: int = 0o600) -> bool:
+        """
+        Writes `content` to a file on the SSH server over SFTP.
+
+        Args:
+            content (str): The file content.
+            remote_path (str): The path of the file on the server.
+            mode (int): The permissions of the file (default is 0o600).
+
+        Returns:
+            bool: True if the file was uploaded, False otherwise.
+        """
+        try:
+            with self.ssh_client.open_sftp() as sftp:
+                sftp.putfo(io.BytesIO(content.encode()), remote_path)
+                sftp.chmod(remote_path, mode)
+        except Exception as e:
+            print(f"{self.log_prefix}{Emojis.ERROR_SIGN.value} Error uploading {remote_path}: {str(e)}")
+            return False
+        return True
+
+    def execute_script(self, commands: list[str], logging: bool = False) -> CommandResult:
         """
-        Executes a command on the SSH server.
+        Runs a sequence of commands as one uploaded script in a single SSH channel, instead of one channel per command.
+        The script stops at the first failing command. Each step is timed from the markers the script prints.
+
+        Args:
+            commands (list[str]): The commands to run, in order.
+            logging (bool): Whether to print the output of the commands. (default is False)
+
+        Returns:
+            CommandResult: The exit code and output tail of the script, with a ScriptStep per command in `steps`.
+        """
+        steps = [ScriptStep(command=command) for command in commands]
+        remote_path = f"{SSH_REMOTE_SCRIPT_DIR}/sfy-{uuid.uuid4().hex}.sh"
+        if not self.upload_file(build_step_script(commands), remote_path, mode=0o700):
+            return CommandResult(exit_code=None, steps=steps)
+        run_command = f"bash {shlex.quote(remote_path)}; sfy_exit_code=$?; rm -f {shlex.quote(remote_path)}; exit $sfy_exit_code"
+        result = self._run_channel(run_command, f"Executing {len(commands)} step script", logging, StepMarkerReader(steps))
+        result.steps = steps
+        return result
+
+    def execute_command(self, command: str, logging: bool = False) -> CommandResult:
+        """
+        Executes a command on the SSH server and waits for it to finish.
+        Stdout and stderr are read as they arrive (select on the channel, no busy waiting) and streamed to the console if logging is on.
+        Only the tail of the output is kept in memory.
 
         Args:
             command (str): The command to execute.
             logging (bool): Whether to print the output of the command. (default is False)
 
         Returns:
-            str|None: The output of the command, or None if an error occurred.
+            CommandResult: The exit code and output tail of the command. `exit_code` is None if the command could not be run.
+        """
+        return self._run_channel(command, f"Executing command: `{command}`", logging)
+
+    def _run_channel(self, command: str, description: str, logging: bool, step_reader: StepMarkerReader|None = None) -> CommandResult:
+        """
+        Runs a command in a new session channel, streaming its output. See execute_command.
+        If `step_reader` is given, stdout goes through it so step markers are picked out of the output.
         """
-        text_len = print_with_underline(f"{Emojis.ROCKET.value} Executing command: `{command}`")
+        if self.log_prefix:
+            # several connections may be printing at once, print whole prefixed lines only
+            print(f"{self.log_prefix}{Emojis.ROCKET.value} {description}")
+            text_len = 0
+            stdout_printer = PrefixedLinePrinter(self.log_prefix)
+            stderr_printer = PrefixedLinePrinter(self.log_prefix, file=sys.stderr)
+        else:
+            text_len = print_with_underline(f"{Emojis.ROCKET.value} {description}")
+            stdout_printer = sys.stdout
+            stderr_printer = sys.stderr
+        stdout_reader = stdout_printer
+        if step_reader is not None:
+            step_reader.output = stdout_printer if logging else None
+            stdout_reader = step_reader
+        output_tail = OutputTail(SSH_OUTPUT_TAIL_BYTES)
         try:
-            stdin, stdout, stderr = self.ssh_client.exec_command(command)
-            full_output = ""
-            if logging:
-                while not stdout.channel.exit_status_ready():
-                    if stdout.channel.recv_ready():
-                        output = stdout.channel.recv(1024).decode()
-                        print(output, end="")
-                        full_output += output
-            print("\n" + "-" * text_len)
-            return full_output
+            channel = self.ssh_client.get_transport().open_session()
+            channel.exec_command(command)
+            # incremental decoders so multi byte characters split across reads print correctly
+            stdout_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            stderr_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            while True:
+                select.select([channel], [], [], SSH_SELECT_TIMEOUT)
+                while channel.recv_ready():
+                    data = channel.recv(SSH_RECV_BUFFER_SIZE)
+                    output_tail.append(data)
+                    if logging or step_reader is not None:
+                        stdout_reader.write(stdout_decoder.decode(data))
+                        stdout_reader.flush()
+                while channel.recv_stderr_ready():
+                    data = channel.recv_stderr(SSH_RECV_BUFFER_SIZE)
+                    output_tail.append(data)
+                    if logging:
+                        stderr_printer.write(stderr_decoder.decode(data))
+                        stderr_printer.flush()
+                # only stop once the exit status is in and everything sent before it has been drained
+                if channel.exit_status_ready() and (channel.eof_received or channel.closed) and not channel.recv_ready() and not channel.recv_stderr_ready():
+                    break
+            exit_code = channel.recv_exit_status()
+            channel.close()
+            if step_reader is not None:
+                step_reader.finish()
+            if self.log_prefix:
+                stdout_printer.finish()
+                stderr_printer.finish()
+            if exit_code != 0:
+                print(f"\n{self.log_prefix}{Emojis.ERROR_SIGN.value} Command exited with status {exit_code}.")
+            if text_len:
+                print("\n" + "-" * text_len)
+            return CommandResult(exit_code=exit_code, output=output_tail.text(), truncated=output_tail.truncated)
         except Exception as e:
-            print(f"{Emojis.ERROR_SIGN.value} Error executing command: {str(e)}")
-            print(f"STDERR: {stderr.read().decode()}")
-            print("\n" + "-" * text_len)
-            return None
+            print(f"{self.log_prefix}{Emojis.ERROR_SIGN.value} Error executing command: {str(e)}")
+            if text_len:
+                print("\n" + "-" * text_len)
+            return CommandResult(exit_code=None, output=output_tail.text(), truncated=output_tail.truncated)
         
     def disconnect(self) -> None:
         """
         Disconnects from the SSH server.
         """
         self.ssh_client.close()
-        print(f"\n{Emojis.DYNAMITE.value} SSH Connection Terminated.")
\ No newline at end of file
+        print(f"\n{self.log_prefix}{Emojis.DYNAMITE.value} SSH Connection Terminated.")
\ No newline at end of file
@@ -0,0 +1,137 @@
+import multiprocessing
+import os
+import threading
+import pytest
+from saasFactory.utils.cli import addEnvVar
+from saasFactory.utils.enums import CoolifyKeys
+from saasFactory.utils.globals import CONFIG_FILE_NAME
+from saasFactory.utils.lock import file_lock
+from saasFactory.utils.yaml import YAMLParser, list_to_dot_notation
+
+PROCESSES = 8
+PROJECTS_PER_PROCESS = 25
+PROJECTS_KEY = list_to_dot_notation([CoolifyKeys.COOLIFY_CONFIGS_KEY.value, CoolifyKeys.COOLIFY_PROJECTS_PARENT_KEY.value])
+
+
+@pytest.fixture
+def project_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    project_path = tmp_path / "stress_sfy_project"
+    project_path.mkdir()
+    (project_path / ".env").touch()
+    YAMLParser(str(project_path / CONFIG_FILE_NAME)).append({"project_name": "stress"})
+    return project_path
+
+
+def _edit_projects(config_path: str, worker: int, start: multiprocessing.Event) -> None:
+    parser = YAMLParser(config_path)
+    start.wait()
+    for i in range(PROJECTS_PER_PROCESS):
+        with parser.edit() as doc:
+            coolify_configs = doc.setdefault(CoolifyKeys.COOLIFY_CONFIGS_KEY.value, {})
+            coolify_configs[CoolifyKeys.COOLIFY_PROJECTS_PARENT_KEY.value] = coolify_configs.get(CoolifyKeys.COOLIFY_PROJECTS_PARENT_KEY.value) or []
+            coolify_configs[CoolifyKeys.COOLIFY_PROJECTS_PARENT_KEY.value].append({
+                CoolifyKeys.COOLIFY_NAME_KEY.value: f"edit-{worker}-{i}",
+                CoolifyKeys.COOLIFY_UUID_KEY.value: f"uuid-{worker}-{i}",
+            })
+
+
+def _append_projects(config_path: str, worker: int, start: multiprocessing.Event) -> None:
+    parser = YAMLParser(config_path)
+    start.wait()
+    for i in range(PROJECTS_PER_PROCESS):
+        assert parser.append_nested(PROJECTS_KEY, [{CoolifyKeys.COOLIFY_NAME_KEY.value: f"append-{worker}-{i}"}])
+
+
+def _add_env_vars(project_path: str, worker: int, start: multiprocessing.Event) -> None:
+    os.chdir(project_path)
+    start.wait()
+    for i in range(PROJECTS_PER_PROCESS):
+        assert addEnvVar(f"stress_{worker}_{i}", str(i))
+
+
+def _run_workers(target, path: str) -> None:
+    start = multiprocessing.Event()
+    workers = [multiprocessing.Process(target=target, args=(path, worker, start)) for worker in range(PROCESSES)]
+    for worker in workers:
+        worker.start()
+    start.set()
+    for worker in workers:
+        worker.join(timeout=120)
+        assert worker.exitcode == 0
+
+
+@pytest.mark.parametrize("target,prefix", [(_edit_projects, "edit"), (_append_projects, "append")])
+def test_concurrent_project_appends_are_not_lost(project_dir, target, prefix):
+    config_path = str(project_dir / CONFIG_FILE_NAME)
+    _run_workers(target, config_path)
+
+    projects = YAMLParser(config_path).get(PROJECTS_KEY)
+    names = [project[CoolifyKeys.COOLIFY_NAME_KEY.value] for project in projects]
+    expected = {f"{prefix}-{worker}-{i}" for worker in range(PROCESSES) for i in range(PROJECTS_PER_PROCESS)}
+    assert len(names) == len(expected)
+    assert set(names) == expected
+    assert YAMLParser(config_path).get("project_name") == "stress"
+
+
+def test_concurrent_env_vars_are_not_lost(project_dir):
+    _run_workers(_add_env_vars, str(project_dir))
+
+    with open(project_dir / ".env") as env_file:
+        keys = {line.split("=", 1)[0] for line in env_file if line.strip()}
+    assert keys == {f"STRESS_{worker}_{i}" for worker in range(PROCESSES) for i in range(PROJECTS_PER_PROCESS)}
+
+
+def test_lock_files_stay_out_of_the_project(project_dir):
+    YAMLParser(str(project_dir / CONFIG_FILE_NAME)).append_nested("vps_configs.region", "us-east")
+    with file_lock(str(project_dir / ".env"), exclusive=True):
+        pass
+    assert sorted(os.listdir(project_dir)) == [".env", CONFIG_FILE_NAME]
+
+
+def test_shared_lock_is_not_upgraded(project_dir):
+    config_path = str(project_dir / CONFIG_FILE_NAME)
+    with file_lock(config_path):
+        with pytest.raises(RuntimeError):
+            with file_lock(config_path, exclusive=True):
+                pass
+    # shared inside exclusive reuses the exclusive lock
+    with file_lock(config_path, exclusive=True):
+        with file_lock(config_path):
+            pass
+
+
+def test_env_conflict_prompt_does_not_block_other_writers(project_dir, monkeypatch):
+    monkeypatch.chdir(project_dir)
+    (project_dir / ".env").write_text("EXISTING=old\n")
+    prompting = threading.Event()
+    answer = threading.Event()
+    prompts = []
+
+    def blocking_input(prompt: str) -> str:
+        prompts.append(prompt)
+        prompting.set()
+        answer.wait(timeout=30)
+        return "2"
+
+    monkeypatch.setattr("builtins.input", blocking_input)
+    results = {}
+    conflicted = threading.Thread(target=lambda: results.setdefault("existing", addEnvVar("existing", "new")))
+    conflicted.start()
+    assert prompting.wait(timeout=10)
+
+    # the other writer must not wait for the answer, and its change to the variable makes the prompt run again
+    writer = threading.Thread(target=lambda: results.setdefault("other", addEnvVar("other", "1")))
+    writer.start()
+    writer.join(timeout=10)
+    assert not writer.is_alive()
+    with file_lock(str(project_dir / ".env"), exclusive=True):
+        env_text = (project_dir / ".env").read_text()
+        (project_dir / ".env").write_text(env_text.replace("EXISTING=old", "EXISTING=changed"))
+    answer.set()
+    conflicted.join(timeout=30)
+
+    assert results == {"existing": True, "other": True}
+    assert len(prompts) == 2
+    lines = (project_dir / ".env").read_text().splitlines()
+    assert "EXISTING=new" in lines and "OTHER=1" in lines
@@ -0,0 +1,45 @@
+import os
+from saasFactory.utils.enums import VPSKeys
+from saasFactory.utils.globals import CONFIG_FILE_NAME
+from saasFactory.utils.yaml import YAMLParser, list_to_dot_notation
+
+LINODE_ID_KEY = list_to_dot_notation([VPSKeys.VPS_CONFIGS_KEY.value, VPSKeys.LINODE_ID_KEY.value])
+
+
+def replace_keeping_stat(config_path: str, text: str) -> None:
+    """
+    Replace the file like another process's YAMLParser._write would, within the same mtime tick and with the same size.
+    """
+    old_stat = os.stat(config_path)
+    tmp_path = f"{config_path}.tmp"
+    with open(tmp_path, "w") as file:
+        file.write(text)
+    os.replace(tmp_path, config_path)
+    os.utime(config_path, ns=(old_stat.st_atime_ns, old_stat.st_mtime_ns))
+    new_stat = os.stat(config_path)
+    assert (new_stat.st_mtime_ns, new_stat.st_size) == (old_stat.st_mtime_ns, old_stat.st_size)
+
+
+def test_same_size_same_mtime_rewrite_is_not_served_stale(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    config_path = str(tmp_path / CONFIG_FILE_NAME)
+    parser = YAMLParser(config_path)
+    parser.append({VPSKeys.VPS_CONFIGS_KEY.value: {VPSKeys.LINODE_ID_KEY.value: 1111}})
+    assert parser.get(LINODE_ID_KEY) == 1111
+
+    replace_keeping_stat(config_path, f"{VPSKeys.VPS_CONFIGS_KEY.value}:\n  {VPSKeys.LINODE_ID_KEY.value}: 2222\n")
+    assert parser.get(LINODE_ID_KEY) == 2222
+
+
+def test_edit_parses_the_file_under_the_lock(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    config_path = str(tmp_path / CONFIG_FILE_NAME)
+    parser = YAMLParser(config_path)
+    parser.append({VPSKeys.VPS_CONFIGS_KEY.value: {VPSKeys.LINODE_ID_KEY.value: 1111}})
+    assert parser.get(LINODE_ID_KEY) == 1111
+
+    replace_keeping_stat(config_path, f"{VPSKeys.VPS_CONFIGS_KEY.value}:\n  {VPSKeys.LINODE_ID_KEY.value}: 2222\n")
+    with parser.edit() as doc:
+        doc[VPSKeys.VPS_PROJECT_NAME_KEY.value] = "demo"
+    assert parser.get(LINODE_ID_KEY) == 2222
+    assert parser.get(VPSKeys.VPS_PROJECT_NAME_KEY.value) == "demo"